@@ -0,0 +1,58 @@
+"""
+    Benchmark of interpreted versus compiled policy evaluation.
+
+    Run from the repository root:
+
+        python -m benchmarks.compile_policies --policies 1000 --requests 200
+"""
+
+import argparse
+import time
+
+from py_abac import PDP, EvaluationAlgorithm
+from py_abac.storage.memory import MemoryStorage
+
+from .workload import create_policy, create_request
+
+
+def run(pdp: PDP, requests: list) -> float:
+    """
+        Evaluate requests and return the mean time per request in seconds
+    """
+    start = time.perf_counter()
+    for request in requests:
+        pdp.is_allowed(request)
+    return (time.perf_counter() - start) / len(requests)
+
+
+def main():
+    """
+        Run benchmark
+    """
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--policies", type=int, default=1000, help="number of stored policies")
+    parser.add_argument("--requests", type=int, default=200, help="number of evaluated requests")
+    args = parser.parse_args()
+
+    storage = MemoryStorage()
+    for idx in range(args.policies):
+        storage.add(create_policy(idx))
+    requests = [create_request(idx) for idx in range(args.requests)]
+
+    for algorithm in EvaluationAlgorithm:
+        interpreted = PDP(storage, algorithm)
+        compiled = PDP(storage, algorithm, compile_policies=True)
+        # Decisions are identical for both evaluation paths
+        decisions = [interpreted.is_allowed(request) for request in requests]
+        assert decisions == [compiled.is_allowed(request) for request in requests]
+        interpreted_time = run(interpreted, requests)
+        compiled_time = run(compiled, requests)
+        print("{:<18} interpreted: {:8.3f} ms  compiled: {:8.3f} ms  speedup: {:.2f}x".format(
+            algorithm.value, interpreted_time * 1e3, compiled_time * 1e3,
+            interpreted_time / compiled_time
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+    Benchmark suite of PDP access request evaluation.
+
+    Measures the latency and throughput of `PDP.is_allowed` for all combinations
+    of storage backend, number of stored policies, condition mix and evaluation
+    algorithm, and writes the results as JSON for comparison between releases.
+    Run from the repository root:
+
+        python -m benchmarks.suite --policies 100 1000 10000 --output results.json
+        python -m benchmarks.suite --backends memory --policies 100 1000 10000 100000
+
+    The SQL backend uses an in-memory SQLite database while the Redis and MongoDB
+    backends use the `fakeredis` and `mongomock` packages as stand-ins for servers.
+    Backends whose packages are not installed are skipped. Note that the file
+    backend loads all policies from disk for every request and is slow to
+    benchmark for large numbers of policies.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+from py_abac import PDP, EvaluationAlgorithm
+from py_abac.version import __version__
+
+from .workload import MIXES, create_policy, create_request
+
+LOG = logging.getLogger(__name__)
+
+
+@contextmanager
+def memory_storage():
+    """
+        Create in-memory storage
+    """
+    from py_abac.storage.memory import MemoryStorage
+    yield MemoryStorage()
+
+
+@contextmanager
+def file_storage():
+    """
+        Create file storage in a temporary directory
+    """
+    from py_abac.storage.file import FileStorage
+    storage_dir = tempfile.mkdtemp(prefix="py_abac_benchmark_")
+    try:
+        yield FileStorage(storage_dir)
+    finally:
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+@contextmanager
+def sql_storage():
+    """
+        Create SQL storage on an in-memory SQLite database
+    """
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from py_abac.storage.sql import SQLStorage
+    from py_abac.storage.sql.model import Base
+
+    engine = create_engine("sqlite://", poolclass=StaticPool,
+                           connect_args={"check_same_thread": False})
+
+    # Case sensitive LIKE statements are needed for target matching on SQLite
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_con, _):
+        dbapi_con.execute("pragma case_sensitive_like=ON")
+
+    Base.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine))
+    try:
+        yield SQLStorage(scoped_session=session)
+    finally:
+        session.remove()
+        engine.dispose()
+
+
+@contextmanager
+def redis_storage():
+    """
+        Create Redis storage on a fakeredis server
+    """
+    import fakeredis
+    from py_abac.storage.redis import RedisStorage
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    try:
+        yield RedisStorage(client)
+    finally:
+        client.close()
+
+
+@contextmanager
+def mongo_storage():
+    """
+        Create MongoDB storage on a mongomock client
+    """
+    import mongomock
+    from py_abac.storage.mongo import MongoStorage
+    client = mongomock.MongoClient()
+    try:
+        yield MongoStorage(client)
+    finally:
+        client.close()
+
+
+# Factories of benchmarked storage backends
+BACKENDS = {
+    "memory": memory_storage,
+    "file": file_storage,
+    "sql": sql_storage,
+    "redis": redis_storage,
+    "mongo": mongo_storage,
+}
+
+
+def measure(pdp: PDP, requests: list, repeat: int) -> dict:
+    """
+        Evaluate requests and compute latency statistics in milliseconds and
+        throughput in requests per second.
+    """
+    latencies = []
+    allowed = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for request in requests:
+            request_start = time.perf_counter()
+            allowed += pdp.is_allowed(request)
+            latencies.append(time.perf_counter() - request_start)
+    total = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "allowed": allowed,
+        "total_s": total,
+        "throughput_rps": len(latencies) / total,
+        "latency_ms": {
+            "mean": statistics.mean(latencies) * 1e3,
+            "stdev": statistics.pstdev(latencies) * 1e3,
+            "min": latencies[0] * 1e3,
+            "p50": percentile(latencies, 50) * 1e3,
+            "p95": percentile(latencies, 95) * 1e3,
+            "p99": percentile(latencies, 99) * 1e3,
+            "max": latencies[-1] * 1e3,
+        }
+    }
+
+
+def percentile(values: list, percent: float) -> float:
+    """
+        Get percentile of sorted values using the nearest-rank method
+    """
+    rank = max(int(round(percent / 100 * len(values))), 1)
+    return values[rank - 1]
+
+
+def run_backend(backend: str, args, requests: list) -> list:
+    """
+        Run benchmarks of a storage backend for all combinations of the arguments
+    """
+    results = []
+    for num_policies in args.policies:
+        for mix in args.mixes:
+            with BACKENDS[backend]() as storage:
+                start = time.perf_counter()
+                for idx in range(num_policies):
+                    storage.add(create_policy(idx, mix))
+                load_time = time.perf_counter() - start
+                for algorithm in args.algorithms:
+                    pdp = PDP(storage, EvaluationAlgorithm(algorithm),
+                              compile_policies=args.compile_policies)
+                    # Warm up caches, e.g. of compiled regular expressions
+                    for request in requests[:args.warmup]:
+                        pdp.is_allowed(request)
+                    result = {
+                        "backend": backend,
+                        "policies": num_policies,
+                        "mix": mix,
+                        "algorithm": algorithm,
+                        "compile_policies": args.compile_policies,
+                        "load_s": load_time,
+                    }
+                    result.update(measure(pdp, requests, args.repeat))
+                    results.append(result)
+                    LOG.info(
+                        "%-6s %7d policies  %-9s %-16s mean: %9.3f ms  p95: %9.3f ms"
+                        "  %9.1f req/s", backend, num_policies, mix, algorithm,
+                        result["latency_ms"]["mean"], result["latency_ms"]["p95"],
+                        result["throughput_rps"]
+                    )
+    return results
+
+
+def run_suite(args) -> dict:
+    """
+        Run benchmarks of all storage backends and create report
+    """
+    requests = [create_request(idx) for idx in range(args.requests)]
+    results = []
+    skipped = []
+    for backend in args.backends:
+        try:
+            results.extend(run_backend(backend, args, requests))
+        except ImportError as err:
+            LOG.warning("Skipping backend '%s': %s", backend, err)
+            skipped.append({"backend": backend, "reason": str(err)})
+    return {
+        "metadata": {
+            "py_abac_version": __version__,
+            "python_version": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "arguments": vars(args),
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def main():
+    """
+        Run benchmark suite
+    """
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--policies", type=int, nargs="+", default=[100, 1000],
+                        help="numbers of stored policies")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS),
+                        help="storage backends")
+    parser.add_argument("--mixes", nargs="+", choices=list(MIXES), default=list(MIXES),
+                        help="condition mixes of policies")
+    parser.add_argument("--algorithms", nargs="+",
+                        choices=[algorithm.value for algorithm in EvaluationAlgorithm],
+                        default=[algorithm.value for algorithm in EvaluationAlgorithm],
+                        help="evaluation algorithms")
+    parser.add_argument("--requests", type=int, default=100, help="number of distinct requests")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of times the requests are evaluated")
+    parser.add_argument("--warmup", type=int, default=10,
+                        help="number of requests evaluated before measuring")
+    parser.add_argument("--compile-policies", action="store_true",
+                        help="evaluate compiled policies")
+    parser.add_argument("--output", default="-",
+                        help="path of JSON results file, '-' for standard output")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    # Storage and PDP log on every added policy
+    logging.getLogger("py_abac").setLevel(logging.WARNING)
+
+    report = run_suite(args)
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write(os.linesep)
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
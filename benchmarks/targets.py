@@ -0,0 +1,71 @@
+"""
+    Benchmark of compiled target matchers versus per-call fnmatch matching.
+
+    Run from the repository root:
+
+        python -m benchmarks.targets --repeat 100000
+"""
+
+import argparse
+import time
+
+from py_abac.context import EvaluationContext
+from py_abac.policy.targets import Targets
+
+from .workload import create_request
+
+# Target ID patterns of benchmarked targets by kind
+TARGETS = {
+    "any": {"subject_id": "*", "resource_id": "*", "action_id": "*"},
+    "exact": {"subject_id": ["user::1", "user::2", "user::3"], "resource_id": "doc::1",
+              "action_id": ["read", "write"]},
+    "prefix": {"subject_id": ["user::*", "service::*"], "resource_id": "doc::*",
+               "action_id": "re*"},
+    "mixed": {"subject_id": ["admin", "user::*", "*::1"], "resource_id": ["doc::[0-9]*", "*"],
+              "action_id": ["read", "wr?te", "*ad"]},
+}
+
+
+def fnmatch_match(targets: Targets, ctx: EvaluationContext) -> bool:
+    """
+        Check if request matches targets using fnmatch on every call
+    """
+    # pylint: disable=protected-access
+    return targets._is_in(targets.subject_id, ctx.subject_id) and \
+           targets._is_in(targets.resource_id, ctx.resource_id) and \
+           targets._is_in(targets.action_id, ctx.action_id)
+
+
+def run(match, targets: Targets, ctx: EvaluationContext, repeat: int) -> float:
+    """
+        Match request against targets and return the mean time per match in seconds
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        match(targets, ctx)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    """
+        Run benchmark
+    """
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=100000, help="number of matches")
+    args = parser.parse_args()
+
+    ctx = EvaluationContext(create_request(1))
+    for kind, targets_json in TARGETS.items():
+        targets = Targets(**targets_json)
+        # Results are identical for both implementations
+        assert fnmatch_match(targets, ctx) == targets.match(ctx)
+        fnmatch_time = run(fnmatch_match, targets, ctx, args.repeat)
+        compiled_time = run(Targets.match, targets, ctx, args.repeat)
+        print("{:<8} fnmatch: {:8.3f} us  compiled: {:8.3f} us  speedup: {:.2f}x".format(
+            kind, fnmatch_time * 1e6, compiled_time * 1e6, fnmatch_time / compiled_time
+        ))
+
+
+if __name__ == "__main__":
+    main()
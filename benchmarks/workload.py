@@ -0,0 +1,132 @@
+"""
+    Policies and access requests used by the benchmarks
+"""
+
+from py_abac import AccessRequest, Policy
+
+# Number of distinct departments of subjects. Every policy fits the requests
+# of subjects in department `idx % NUM_DEPARTMENTS`.
+NUM_DEPARTMENTS = 10
+
+
+def create_targets(idx: int) -> dict:
+    """
+        Create policy targets. Every fourth policy targets a single resource.
+    """
+    return {
+        "subject_id": ["user::*", "service::{}".format(idx)],
+        "resource_id": "doc::{}".format(idx) if idx % 4 == 0 else "*"
+    }
+
+
+def create_simple_rules(idx: int) -> dict:
+    """
+        Create rules with string equality conditions only
+    """
+    return {
+        "subject": {"$.department": {"condition": "Equals",
+                                     "value": "dep-{}".format(idx % NUM_DEPARTMENTS)}},
+        "action": {"$.method": {"condition": "Equals", "value": "get"}},
+    }
+
+
+def create_mixed_rules(idx: int) -> dict:
+    """
+        Create rules with a mix of string, numeric, collection, logic and network conditions
+    """
+    return {
+        "subject": [
+            {
+                "$.department": {"condition": "Equals",
+                                 "value": "dep-{}".format(idx % NUM_DEPARTMENTS)},
+                "$.level": {"condition": "Gte", "value": idx % 5},
+                "$.roles": {"condition": "AnyIn", "values": ["admin", "editor"]},
+            },
+            {"$.name": {"condition": "StartsWith", "value": "root", "case_insensitive": True}}
+        ],
+        "resource": {
+            "$.path": {"condition": "AnyOf", "values": [
+                {"condition": "StartsWith", "value": "/docs/"},
+                {"condition": "EndsWith", "value": ".txt", "case_insensitive": True},
+            ]},
+            "$.tags": {"condition": "IsNotEmpty"},
+        },
+        "action": {
+            "$.method": {"condition": "Not",
+                         "value": {"condition": "Equals", "value": "delete"}}
+        },
+        "context": {"$.ip": {"condition": "CIDR", "value": "10.0.0.0/8"}},
+    }
+
+
+def create_string_rules(idx: int) -> dict:
+    """
+        Create rules with regular expression and substring conditions
+    """
+    return {
+        "subject": {
+            "$.department": {"condition": "RegexMatch",
+                             "value": "^dep-{}$".format(idx % NUM_DEPARTMENTS)},
+            "$.name": {"condition": "Contains", "value": "user", "case_insensitive": True},
+        },
+        "resource": {"$.path": {"condition": "NotContains", "value": "/private/"}},
+        "action": {"$.method": {"condition": "RegexMatch", "value": "^(get|list)$"}},
+    }
+
+
+def create_attribute_rules(idx: int) -> dict:
+    """
+        Create rules with attribute conditions comparing attributes of the request
+    """
+    return {
+        "subject": {
+            "$.department": {"condition": "Equals",
+                             "value": "dep-{}".format(idx % NUM_DEPARTMENTS)},
+            "$.roles": {"condition": "AnyInAttribute", "ace": "resource", "path": "$.roles"},
+        },
+        "resource": {"$.owner": {"condition": "NotEqualsAttribute", "ace": "subject",
+                                 "path": "$.name"}},
+        "context": {"$.level": {"condition": "IsInAttribute", "ace": "subject",
+                                "path": "$.levels"}},
+    }
+
+
+# Condition mixes of benchmarked policies
+MIXES = {
+    "simple": create_simple_rules,
+    "mixed": create_mixed_rules,
+    "string": create_string_rules,
+    "attribute": create_attribute_rules,
+}
+
+
+def create_policy(idx: int, mix: str = "mixed") -> Policy:
+    """
+        Create policy with rules of the given condition mix
+    """
+    return Policy.from_json({
+        "uid": str(idx),
+        "description": "Benchmark policy {}".format(idx),
+        "rules": MIXES[mix](idx),
+        "targets": create_targets(idx),
+        "effect": "allow" if idx % 7 else "deny",
+        "priority": idx % 3
+    })
+
+
+def create_request(idx: int) -> AccessRequest:
+    """
+        Create access request with the attributes used by all condition mixes
+    """
+    return AccessRequest.from_json({
+        "subject": {"id": "user::{}".format(idx), "attributes": {
+            "name": "user-{}".format(idx), "department": "dep-{}".format(idx % NUM_DEPARTMENTS),
+            "level": idx % 7, "levels": [0, 1, 2], "roles": ["viewer", "editor"]
+        }},
+        "resource": {"id": "doc::{}".format(idx), "attributes": {
+            "path": "/docs/{}.TXT".format(idx), "tags": ["public"], "owner": "user-0",
+            "roles": ["editor"]
+        }},
+        "action": {"id": "read", "attributes": {"method": "get"}},
+        "context": {"ip": "10.1.{}.{}".format(idx % 256, idx % 199), "level": idx % 4}
+    })
@@ -0,0 +1,291 @@
+"""
+    Caching utilities
+"""
+
+import hashlib
+import json
+from time import monotonic
+from typing import Any, Dict, FrozenSet, Hashable, Optional, Tuple, Union
+
+from lru import LRU
+
+from .policy import Policy
+from .request import AccessRequest
+
+# Key marking values of non JSON types in canonical form of requests
+_TYPE_TAG = "__type__"
+
+
+class LRUCache(object):
+    """
+        Bounded least recently used cache with an optional time-to-live for entries.
+        Hit, miss and eviction counts are recorded for monitoring.
+
+        :param max_size: maximum number of entries held in cache
+        :param ttl: time-to-live of entries in seconds. Entries never expire when None.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = None):
+        if max_size <= 0:
+            raise ValueError("Cache size should be a positive integer.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Cache TTL should be a positive number.")
+        self._ttl = ttl
+        self._entries = LRU(max_size, callback=self._on_evict)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+            Get cached value for key. The default is returned if the key is
+            not in cache or its entry has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or expires_at > monotonic():
+                self.hits += 1
+                return value
+            # Remove expired entry
+            try:
+                del self._entries[key]
+            except KeyError:  # pragma: no cover
+                pass  # pragma: no cover
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: float = None):
+        """
+            Add value to cache for key
+
+            :param key: key of value
+            :param value: value to cache
+            :param ttl: time-to-live of the entry in seconds overriding the TTL of the cache
+        """
+        ttl = ttl if ttl is not None else self._ttl
+        expires_at = monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+
+    def clear(self):
+        """
+            Remove all entries from cache
+        """
+        self._entries.clear()
+
+    @property
+    def stats(self) -> dict:
+        """
+            Cache statistics
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_size": self._entries.get_size()
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _on_evict(self, *_):
+        """
+            Callback invoked by the LRU dictionary when an entry is evicted
+        """
+        self.evictions += 1
+
+
+class DecisionCache(LRUCache):
+    """
+        Cache of access decisions made by the PDP. Entries are keyed by a canonical
+        hash of the access request, i.e. the target IDs along with all attributes
+        and context of the request.
+
+        .. note::
+
+            The cache is not invalidated on changes to the policy storage. Use the TTL
+            to bound how long a stale decision can be served or call :code:`clear`
+            after updating policies.
+
+            Attribute values returned by attribute providers are not part of the key.
+            A decision depending on such attributes is served from cache even after the
+            provider starts returning different values, so the TTL is the only bound on
+            how long the stale decision is served.
+
+        :param max_size: maximum number of decisions held in cache
+        :param ttl: time-to-live of decisions in seconds. Decisions never expire when None.
+    """
+
+    @staticmethod
+    def make_key(request: AccessRequest) -> str:
+        """
+            Get canonical hash of access request
+        """
+        data = {
+            "subject": {"id": request.subject_id, "attributes": request.subject},
+            "resource": {"id": request.resource_id, "attributes": request.resource},
+            "action": {"id": request.action_id, "attributes": request.action},
+            "context": request.context
+        }
+        data_str = json.dumps(_canonical(data), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(data_str.encode("utf-8")).hexdigest()
+
+
+class AttributeDecisionCache(DecisionCache):
+    """
+        Cache of access decisions keyed by only the attributes read by the policies.
+        Entries are keyed by a canonical hash of the target IDs of the request and the
+        values of the attributes the rules of the policies matching the targets can read,
+        see :attr:`Policy.required_attributes`. Requests differing only in attributes no
+        policy reads, e.g. timestamps or request IDs in the context, share a decision.
+
+        The attributes required for a target are cached as well, so that the storage is
+        queried only on a miss. The attribute values are resolved through the evaluation
+        context, including values returned by attribute providers, which are thus part of
+        the key.
+
+        .. note::
+
+            The cache is not invalidated on changes to the policy storage. Use the TTL
+            to bound how long a stale decision can be served or call :code:`clear`
+            after updating policies.
+
+        :param max_size: maximum number of decisions held in cache, which is also the
+            maximum number of targets whose required attributes are held in cache
+        :param ttl: time-to-live of decisions in seconds. Decisions never expire when None.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = None):
+        super().__init__(max_size, ttl)
+        self._required_attributes = LRUCache(max_size, ttl)
+
+    def get_required_attributes(
+            self,
+            target: Tuple[str, str, str]
+    ) -> Optional[FrozenSet[Tuple[str, str]]]:
+        """
+            Get attributes required by the policies for target IDs. None is returned
+            if not in cache.
+
+            :param target: subject, resource and action IDs
+        """
+        return self._required_attributes.get(target)
+
+    def set_required_attributes(
+            self,
+            target: Tuple[str, str, str],
+            required_attributes: FrozenSet[Tuple[str, str]]
+    ):
+        """
+            Add attributes required by the policies for target IDs to cache
+
+            :param target: subject, resource and action IDs
+            :param required_attributes: `(access control element, attribute path)` pairs
+        """
+        self._required_attributes.set(target, required_attributes)
+
+    @staticmethod
+    def make_attribute_key(target: Tuple[str, str, str], values: Dict[Tuple[str, str], Any]) -> str:
+        """
+            Get canonical hash of target IDs and attribute values
+
+            :param target: subject, resource and action IDs
+            :param values: attribute values keyed by access control element and attribute path
+        """
+        data = {
+            "target": list(target),
+            "attributes": sorted(
+                [ace, attribute_path, _canonical(value)]
+                for (ace, attribute_path), value in values.items()
+            )
+        }
+        data_str = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(data_str.encode("utf-8")).hexdigest()
+
+    def clear(self):
+        """
+            Remove all decisions and required attributes from cache
+        """
+        super().clear()
+        self._required_attributes.clear()
+
+
+class PolicyCache(LRUCache):
+    """
+        Cache of policies decoded by storages. Entries are keyed by a hash of the
+        stored policy JSON so that a policy is decoded only once as long as it is
+        unchanged in storage. An updated policy has a different key and is decoded
+        again, while its stale entry is eventually evicted.
+
+        A single cache can be shared by multiple storages.
+
+        .. note::
+
+            Cached policies are shared between all requests evaluated using the cache
+            and must not be modified.
+
+        :param max_size: maximum number of policies held in cache
+        :param ttl: time-to-live of policies in seconds. Policies never expire when None.
+    """
+
+    @staticmethod
+    def make_key(policy_json: Union[str, bytes, dict]) -> bytes:
+        """
+            Get hash of stored policy JSON. The JSON can either be serialized as
+            string or bytes, or be deserialized as dictionary.
+        """
+        if isinstance(policy_json, dict):
+            policy_json = json.dumps(policy_json, sort_keys=True, separators=(",", ":"))
+        if isinstance(policy_json, str):
+            policy_json = policy_json.encode("utf-8")
+        return hashlib.sha256(policy_json).digest()
+
+    def get_policy(self, policy_json: Union[str, bytes, dict], lazy: bool = False) -> Policy:
+        """
+            Get policy for stored policy JSON. The policy is decoded and added
+            to cache if not found.
+
+            :param policy_json: stored policy JSON
+            :param lazy: if True, the rules of a decoded policy are decoded on first
+                access, see :meth:`Policy.from_json`
+        """
+        key = self.make_key(policy_json)
+        policy = self.get(key)
+        if policy is None:
+            if not isinstance(policy_json, dict):
+                policy_json = json.loads(policy_json)
+            policy = Policy.from_json(policy_json, lazy)
+            self.set(key, policy)
+        return policy
+
+
+def _canonical(value: Any) -> Any:
+    """
+        Convert value into a JSON serializable structure which is unique for the value.
+        Values not native to JSON, e.g. sets and tuples, are tagged with their type so that
+        they cannot collide with JSON values having the same representation.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and _TYPE_TAG not in value:
+            return {key: _canonical(item) for key, item in value.items()}
+        items = sorted(_dumps([_canonical(key), _canonical(item)]) for key, item in value.items())
+        return {_TYPE_TAG: "dict", "value": items}
+    if isinstance(value, tuple):
+        return {_TYPE_TAG: "tuple", "value": [_canonical(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        items = sorted(_dumps(_canonical(item)) for item in value)
+        return {_TYPE_TAG: type(value).__name__, "value": items}
+    # Other values are represented by their repr
+    return {_TYPE_TAG: type(value).__name__, "value": repr(value)}
+
+
+def _dumps(value: Any) -> str:
+    """
+        Serialize canonical value to JSON string
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
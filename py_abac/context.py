@@ -2,11 +2,15 @@
     PDP policy evaluation context
 """
 
+import asyncio
+import copy
 import logging
-from typing import List, Any
+from concurrent import futures
+from typing import Any, Iterable, List, Tuple, Union
 
-from .provider.base import AttributeProvider
+from .provider.base import AttributeProvider, AsyncAttributeProvider
 from .provider.request import RequestAttributeProvider
+from .provider.routes import ProviderRoutes
 from .request import AccessRequest
 
 LOG = logging.getLogger(__name__)
@@ -17,25 +21,36 @@ class EvaluationContext(object):
         Evaluation context class
     """
 
-    def __init__(self, request: AccessRequest, providers: List[AttributeProvider] = None):
+    def __init__(
+            self,
+            request: AccessRequest,
+            providers: Union[List[AttributeProvider], ProviderRoutes] = None
+    ):
         """
             Initialize evaluation context object
 
             :param request: request object
+            :param providers: list of attribute providers or their routing table
         """
         self._subject_id = request.subject_id
         self._resource_id = request.resource_id
         self._action_id = request.action_id
         self._request_provider = RequestAttributeProvider(request)
-        self._other_providers = providers or []
+        if not isinstance(providers, ProviderRoutes):
+            providers = ProviderRoutes(providers)
+        self._provider_routes = providers
+        self._other_providers = providers.providers
 
         # Access control element being evaluated
         self._ace = None
         # Path of attribute being evaluated
         self._attribute_path = None
-        # Call stack of attribute providers as called by context. The stack
-        # is used to prevent infinite recursive loops.
-        self._provider_call_stack = [None]
+        # Identifiers of attribute providers being called by context. Used to
+        # prevent infinite recursive loops.
+        self._active_providers = set()
+        # Attribute values found by providers keyed by access control element
+        # and attribute path. Includes None for values not found.
+        self._provider_values = {}
 
     @property
     def subject_id(self) -> str:
@@ -103,19 +118,217 @@ class EvaluationContext(object):
         """
         rvalue = self._request_provider.get_attribute_value(ace, attribute_path, self)
         # If attribute value not found then check other attribute providers
-        if rvalue is None:
-            # Providers are checked in order
-            for provider in self._other_providers:
-                # To prevent infinite recursion skip provider if already in call stack.
-                if provider not in self._provider_call_stack:
-                    # Append provider to call-stack
-                    self._provider_call_stack.append(provider)
-                    # Call attribute provider
-                    rvalue = provider.get_attribute_value(ace, attribute_path, self)
-                    # Pop provider from call-stack
-                    self._provider_call_stack.pop()
-                    if rvalue is not None:
-                        # Return attribute value for the very first provider which has the value.
-                        # Other providers are not checked.
-                        return rvalue
+        if rvalue is None and self._other_providers:
+            # Values are memoized only for lookups not made by a provider, as the
+            # providers being called are skipped by nested lookups.
+            if self._active_providers:
+                return self._get_provider_value(ace, attribute_path)
+            key = (ace, attribute_path)
+            try:
+                return self._provider_values[key]
+            except KeyError:
+                rvalue = self._get_provider_value(ace, attribute_path)
+                self._provider_values[key] = rvalue
         return rvalue
+
+    def prefetch_attribute_values(self, keys: Iterable[Tuple[str, str]]):
+        """
+            Prefetch attribute values not in the request using the bulk retrieval of
+            attribute providers, see :meth:`AttributeProvider.get_attribute_values`.
+            Prefetched values are memoized for the evaluation of the request. Values
+            not prefetched are retrieved one at a time when needed.
+
+            Providers are called in order for the values they serve not found by the
+            preceding providers. Values served by a provider not supporting bulk
+            retrieval are not prefetched from the following providers, so that they
+            are still taken from the first provider having them.
+
+            :param keys: `(access control element, attribute path)` pairs
+        """
+        pending = [
+            key for key in dict.fromkeys(keys)
+            if key not in self._provider_values and
+            self._request_provider.get_attribute_value(key[0], key[1], self) is None
+        ]
+        # Keys left to be retrieved one at a time
+        deferred = set()
+        for provider in self._other_providers:
+            provider_keys = [
+                key for key in pending
+                if key not in deferred and provider in self._provider_routes.get_providers(*key)
+            ]
+            if not provider_keys:
+                continue
+            self._active_providers.add(id(provider))
+            try:
+                values = provider.get_attribute_values(provider_keys, self)
+            finally:
+                self._active_providers.discard(id(provider))
+            if values is None:
+                deferred.update(provider_keys)
+                continue
+            for key in provider_keys:
+                value = values.get(key)
+                if value is not None:
+                    self._provider_values[key] = value
+            pending = [key for key in pending if key not in self._provider_values]
+        # Values not found by any of the providers serving them
+        for key in pending:
+            if key not in deferred:
+                self._provider_values[key] = None
+
+    def resolve_attribute_values(
+            self,
+            keys: Iterable[Tuple[str, str]],
+            executor: futures.Executor,
+            timeout: float = None
+    ):
+        """
+            Concurrently retrieve attribute values not in the request from the attribute
+            providers using an executor, e.g. a thread pool. Each attribute is looked up
+            as by :meth:`get_attribute_value` in a task of its own, so that the time
+            taken is bounded by the slowest lookup instead of their sum. Retrieved values
+            are memoized for the evaluation of the request. Attribute providers must thus
+            be safe to call from several threads.
+
+            :param keys: `(access control element, attribute path)` pairs
+            :param executor: executor running the lookups
+            :param timeout: maximum time in seconds to wait for the lookups. No limit
+                when None.
+            :raises concurrent.futures.TimeoutError: if the lookups are not done in time
+        """
+        pending = [
+            key for key in dict.fromkeys(keys)
+            if key not in self._provider_values and
+            self._request_provider.get_attribute_value(key[0], key[1], self) is None
+        ]
+        if not pending:
+            return
+        tasks = {executor.submit(self._fork()._get_provider_value, *key): key for key in pending}
+        done, not_done = futures.wait(tasks, timeout)
+        for task in not_done:
+            # Lookups already running can't be stopped and are left to complete
+            task.cancel()
+        for task in done:
+            self._provider_values[tasks[task]] = task.result()
+        if not_done:
+            raise futures.TimeoutError(
+                "Attribute lookups not done within {} seconds.".format(timeout)
+            )
+
+    def _fork(self) -> 'EvaluationContext':
+        """
+            Get copy of context with its own recursion guard for lookups made in other
+            threads. The copy shares the request and memoized attribute values.
+        """
+        ctx = copy.copy(self)
+        ctx._active_providers = set()
+        return ctx
+
+    def _get_provider_value(self, ace: str, attribute_path: str):
+        """
+            Get attribute value from the attribute providers serving the attribute
+            which are not being called
+        """
+        # Providers serving the attribute are checked in order
+        for provider in self._provider_routes.get_providers(ace, attribute_path):
+            provider_id = id(provider)
+            # To prevent infinite recursion skip provider if already being called.
+            if provider_id in self._active_providers:
+                continue
+            self._active_providers.add(provider_id)
+            try:
+                # Call attribute provider
+                rvalue = provider.get_attribute_value(ace, attribute_path, self)
+            finally:
+                self._active_providers.discard(provider_id)
+            if rvalue is not None:
+                # Return attribute value for the very first provider which has the value.
+                # Other providers are not checked.
+                return rvalue
+        return None
+
+
+class AsyncEvaluationContext(EvaluationContext):
+    """
+        Evaluation context used by :class:`AsyncPDP`. Attribute values not found in
+        the request or synchronous attribute providers are recorded as pending while
+        policies are evaluated. The pending values are then fetched concurrently from
+        the asynchronous attribute providers and the policy is evaluated again.
+    """
+
+    def __init__(
+            self,
+            request: AccessRequest,
+            providers: Union[List[AttributeProvider], ProviderRoutes] = None,
+            async_providers: Union[List[AsyncAttributeProvider], ProviderRoutes] = None
+    ):
+        """
+            Initialize evaluation context object
+
+            :param request: request object
+            :param providers: list of synchronous attribute providers or their routing table
+            :param async_providers: list of asynchronous attribute providers or their
+                routing table
+        """
+        super().__init__(request, providers)
+        if not isinstance(async_providers, ProviderRoutes):
+            async_providers = ProviderRoutes(async_providers)
+        self._async_provider_routes = async_providers
+        self._async_providers = async_providers.providers
+        # Attribute values fetched from asynchronous providers keyed by access control
+        # element and attribute path. Includes None for values not found.
+        self._async_values = {}
+        # Keys of attribute values requested but not yet fetched
+        self._pending = set()
+        # Pending values are not recorded while being fetched
+        self._fetching = False
+
+    def get_attribute_value(self, ace: str, attribute_path: str):
+        """
+            Get attribute value for given access control element and attribute path.
+            Returns None for values pending to be fetched from asynchronous providers.
+
+            :param ace: access control element
+            :param attribute_path: attribute path in ObjectPath format
+            :return: attribute value
+        """
+        rvalue = super().get_attribute_value(ace, attribute_path)
+        if rvalue is None and self._async_providers:
+            key = (ace, attribute_path)
+            if key in self._async_values:
+                return self._async_values[key]
+            if not self._fetching:
+                self._pending.add(key)
+        return rvalue
+
+    async def fetch_pending(self) -> bool:
+        """
+            Concurrently fetch attribute values requested during evaluation from the
+            asynchronous attribute providers.
+
+            :return: True if any pending attribute values were fetched else False
+        """
+        if not self._pending:
+            return False
+        keys = list(self._pending)
+        self._pending.clear()
+        self._fetching = True
+        try:
+            values = await asyncio.gather(*(self._fetch(*key) for key in keys))
+        finally:
+            self._fetching = False
+        self._async_values.update(zip(keys, values))
+        return True
+
+    async def _fetch(self, ace: str, attribute_path: str):
+        """
+            Fetch attribute value from asynchronous attribute providers
+        """
+        # Providers serving the attribute are checked in order
+        for provider in self._async_provider_routes.get_providers(ace, attribute_path):
+            rvalue = await provider.get_attribute_value(ace, attribute_path, self)
+            if rvalue is not None:
+                # Return attribute value for the very first provider which has the value.
+                return rvalue
+        return None
@@ -2,13 +2,23 @@
     Policy decision point implementation
 """
 
+import asyncio
+import logging
+import time
+from concurrent import futures
 from enum import Enum
-from typing import List
+from itertools import chain
+from typing import Iterable, List, Union
 
-from .context import EvaluationContext
-from .provider.base import AttributeProvider
+from .cache import DecisionCache, AttributeDecisionCache
+from .context import EvaluationContext, AsyncEvaluationContext
+from .policy import get_required_attributes
+from .provider.base import AttributeProvider, AsyncAttributeProvider
+from .provider.routes import ProviderRoutes
 from .request import AccessRequest
-from .storage.base import Storage
+from .storage.base import Storage, AsyncStorage
+
+LOG = logging.getLogger(__name__)
 
 
 class EvaluationAlgorithm(Enum):
@@ -51,12 +61,28 @@ class PDP(object):
         :param storage: policy storage
         :param algorithm: policy evaluation algorithm
         :param providers: list of attribute providers
+        :param cache: optional cache of access decisions
+        :param compile_policies: whether policies are compiled into closures for evaluation
+        :param prefetch_attributes: whether attribute values needed by the policies matching
+            the request targets are prefetched in bulk from the attribute providers
+        :param executor: optional executor, e.g. a thread pool, used to retrieve the attribute
+            values needed by the policies matching the request targets concurrently
+        :param timeout: time in seconds from the start of a decision within which the attribute
+            values retrieved concurrently must be resolved. Requires an executor.
+        :param timeout_decision: decision returned when the timeout is exceeded
     """
 
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
     def __init__(self,
                  storage: Storage,
                  algorithm: EvaluationAlgorithm = EvaluationAlgorithm.DENY_OVERRIDES,
-                 providers: List[AttributeProvider] = None):
+                 providers: List[AttributeProvider] = None,
+                 cache: DecisionCache = None,
+                 compile_policies: bool = False,
+                 prefetch_attributes: bool = False,
+                 executor: futures.Executor = None,
+                 timeout: float = None,
+                 timeout_decision: bool = False):
         if not isinstance(storage, Storage):
             raise TypeError("Invalid type '{}' for storage.".format(type(storage)))
         if not isinstance(algorithm, EvaluationAlgorithm):
@@ -67,6 +93,29 @@ class PDP(object):
         for provider in self._providers:
             if not isinstance(provider, AttributeProvider):
                 raise TypeError("Invalid type '{}' for attribute provider.".format(type(provider)))
+        self._provider_routes = ProviderRoutes(self._providers)
+        if cache is not None and not isinstance(cache, DecisionCache):
+            raise TypeError("Invalid type '{}' for decision cache.".format(type(cache)))
+        self._cache = cache
+        self._compile_policies = compile_policies
+        self._prefetch_attributes = prefetch_attributes
+        if executor is not None and not isinstance(executor, futures.Executor):
+            raise TypeError("Invalid type '{}' for executor.".format(type(executor)))
+        if timeout is not None:
+            if timeout <= 0:
+                raise ValueError("PDP timeout should be a positive number.")
+            if executor is None:
+                raise ValueError("PDP timeout requires an executor.")
+        self._executor = executor
+        self._timeout = timeout
+        self._timeout_decision = timeout_decision
+
+    @property
+    def cache(self) -> DecisionCache:
+        """
+            Decision cache used by the PDP. None if caching is disabled.
+        """
+        return self._cache
 
     def is_allowed(self, request: AccessRequest):
         """
@@ -78,64 +127,580 @@ class PDP(object):
         if not isinstance(request, AccessRequest):
             raise TypeError("Invalid type '{}' for authorization request.".format(request))
 
+        return self._decide(request, self._get_for_target)
+
+    def is_allowed_many(self, requests: Iterable[AccessRequest]) -> List[bool]:
+        """
+            Check if a batch of authorization requests are allowed. Requests are grouped
+            by their target IDs so that the storage is queried only once for every distinct
+            `(subject_id, resource_id, action_id)` triple in the batch.
+
+            :param requests: iterable of request objects
+            :return: list of decisions in the same order as the requests
+        """
+        requests = list(requests)
+        for request in requests:
+            if not isinstance(request, AccessRequest):
+                raise TypeError("Invalid type '{}' for authorization request.".format(request))
+
+        # Policies retrieved from storage for each target ID triple in batch
+        target_policies = {}
+
+        def get_for_target(request):
+            target = (request.subject_id, request.resource_id, request.action_id)
+            if target not in target_policies:
+                target_policies[target] = list(self._get_for_target(request))
+            return target_policies[target]
+
+        return [self._decide(request, get_for_target) for request in requests]
+
+    def _get_for_target(self, request: AccessRequest):
+        """
+            Get filtered policies based on request targets from storage. Policies
+            are retrieved in descending order of priority for the highest priority
+            algorithm.
+        """
+        if self._algorithm == EvaluationAlgorithm.HIGHEST_PRIORITY.value:
+            return self._storage.get_for_target_by_priority(
+                request.subject_id, request.resource_id, request.action_id
+            )
+        return self._storage.get_for_target(
+            request.subject_id, request.resource_id, request.action_id
+        )
+
+    def _decide(self, request: AccessRequest, get_for_target):
+        """
+            Get access decision for request. The decision cache is checked first
+            when enabled.
+
+            :param request: request object
+            :param get_for_target: callable returning policies for request targets
+            :return: True if authorized else False
+        """
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        try:
+            if self._cache is None:
+                return self._evaluate(request, get_for_target(request), deadline=deadline)
+            if isinstance(self._cache, AttributeDecisionCache):
+                return self._decide_by_attributes(request, get_for_target, deadline)
+
+            key = self._cache.make_key(request)
+            decision = self._cache.get(key)
+            if decision is None:
+                decision = self._evaluate(request, get_for_target(request), deadline=deadline)
+                self._cache.set(key, decision)
+            return decision
+        except futures.TimeoutError:
+            LOG.warning("Attribute providers exceeded the PDP timeout of %s seconds. "
+                        "Returning the timeout decision.", self._timeout)
+            return self._timeout_decision
+
+    def _decide_by_attributes(self, request: AccessRequest, get_for_target, deadline: float):
+        """
+            Get access decision for request using a decision cache keyed by the
+            values of the attributes required by the policies for request targets.
+
+            :param request: request object
+            :param get_for_target: callable returning policies for request targets
+            :param deadline: monotonic time by which attribute values must be resolved
+            :return: True if authorized else False
+        """
+        ctx = EvaluationContext(request, self._provider_routes)
+        target = (request.subject_id, request.resource_id, request.action_id)
+        policies = None
+        required_attributes = self._cache.get_required_attributes(target)
+        if required_attributes is None:
+            policies = list(get_for_target(request))
+            required_attributes = get_required_attributes(
+                policy for policy in policies if policy.targets.match(ctx)
+            )
+            self._cache.set_required_attributes(target, required_attributes)
+
+        self._fetch_attributes(ctx, required_attributes, deadline)
+        values = {key: ctx.get_attribute_value(*key) for key in required_attributes}
+        key = self._cache.make_attribute_key(target, values)
+        decision = self._cache.get(key)
+        if decision is None:
+            if policies is None:
+                policies = get_for_target(request)
+            decision = self._evaluate(request, policies, ctx, deadline)
+            self._cache.set(key, decision)
+        return decision
+
+    def _evaluate(
+            self,
+            request: AccessRequest,
+            policies,
+            ctx: EvaluationContext = None,
+            deadline: float = None
+    ):
+        """
+            Evaluate authorization request against given policies
+
+            :param request: request object
+            :param policies: policies retrieved from storage for request targets
+            :param ctx: evaluation context. Created for the request if not given.
+            :param deadline: monotonic time by which attribute values must be resolved
+            :return: True if authorized else False
+        """
         # Get appropriate evaluation algorithm handler
         evaluate = getattr(self, "_{}".format(self._algorithm))
         # Create evaluation context
-        ctx = EvaluationContext(request, self._providers)
+        if ctx is None:
+            ctx = EvaluationContext(request, self._provider_routes)
+        if (self._prefetch_attributes or self._executor is not None) and self._providers:
+            # All policies are retrieved to fetch the attributes they need
+            policies = list(policies)
+            required_attributes = list(chain.from_iterable(
+                policy.required_attributes for policy in policies
+                if policy.targets.match(ctx)
+            ))
+            self._fetch_attributes(ctx, required_attributes, deadline)
+
+        # Policies are lazily checked for fit with the authorization request by the
+        # evaluation algorithm so that it can stop as soon as the decision is known.
+        if self._compile_policies:
+            def fits(policy):
+                return policy.compile()(ctx)
+        else:
+            def fits(policy):
+                return policy.fits(ctx)
+        try:
+            return evaluate(policies, fits)
+        finally:
+            # Release resources, e.g. database cursors, held by a partially
+            # consumed storage generator.
+            close = getattr(policies, "close", None)
+            if close is not None:
+                close()
 
-        # Get filtered policies based on targets from storage
-        policies = self._storage.get_for_target(ctx.subject_id, ctx.resource_id, ctx.action_id)
-        # Filter policies based on fit with authorization request
-        policies = [policy for policy in policies if policy.fits(ctx)]
+    def _fetch_attributes(self, ctx: EvaluationContext, keys: List, deadline: float):
+        """
+            Fetch attribute values from the attribute providers before evaluation,
+            in bulk if prefetching is enabled and concurrently if an executor is set.
 
-        return evaluate(policies)
+            :param ctx: evaluation context
+            :param keys: `(access control element, attribute path)` pairs
+            :param deadline: monotonic time by which attribute values must be resolved
+            :raises concurrent.futures.TimeoutError: if the deadline is exceeded
+        """
+        if not self._providers:
+            return
+        if self._prefetch_attributes:
+            ctx.prefetch_attribute_values(keys)
+        if self._executor is not None:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            ctx.resolve_attribute_values(keys, self._executor, timeout)
 
     @staticmethod
-    def _allow_overrides(policies):
+    def _allow_overrides(policies, fits):
         """
-            Allow overrides evaluation algorithm
+            Allow overrides evaluation algorithm. Stops at the first fitting
+            policy which allows access.
 
-            :param policies: list of policies to evaluate
+            :param policies: iterable of policies to evaluate
+            :param fits: callable checking if a policy fits the request
             :return: True if request is authorized else False
         """
-        if not policies:
-            return False
         for policy in policies:
-            if policy.is_allowed:
+            if fits(policy) and policy.is_allowed:
                 return True
         return False
 
     @staticmethod
-    def _deny_overrides(policies):
+    def _deny_overrides(policies, fits):
         """
-            Deny overrides evaluation algorithm
+            Deny overrides evaluation algorithm. Stops at the first fitting
+            policy which denies access.
 
-            :param policies: list of policies to evaluate
+            :param policies: iterable of policies to evaluate
+            :param fits: callable checking if a policy fits the request
             :return: True if request is authorized else False
         """
-        if not policies:
-            return False
+        allowed = False
         for policy in policies:
-            if not policy.is_allowed:
-                return False
-        return True
+            if fits(policy):
+                if not policy.is_allowed:
+                    return False
+                allowed = True
+        return allowed
 
-    def _highest_priority(self, policies):
+    @staticmethod
+    def _highest_priority(policies, fits):
         """
-            Highest priority evaluation algorithm
+            Highest priority evaluation algorithm. The policies are expected in
+            descending order of priority so that evaluation stops once the highest
+            priority fitting policies have been checked. Policies of lower priority
+            are not checked for fit.
 
-            :param policies: list of policies to evaluate
+            :param policies: iterable of policies ordered by priority to evaluate
+            :param fits: callable checking if a policy fits the request
             :return: True if request is authorized else False
         """
-        if not policies:
-            return False
-        policy_groups = {}
-        max_priority = -1
+        policies = iter(policies)
+        # Fitting policies of highest priority
+        fitting_policies = []
+        last_priority = None
         for policy in policies:
-            if policy.priority > max_priority:
-                max_priority = policy.priority
-            if policy.priority in policy_groups:
-                policy_groups[policy.priority].append(policy)
+            if last_priority is not None and policy.priority > last_priority:
+                # Policies not ordered by priority, e.g. due to a custom storage sorting
+                # incorrectly. Evaluate all policies without relying on order.
+                LOG.warning(
+                    "Policy with UID=%s received out of order of priority. "
+                    "Evaluating all policies for target.", policy.uid
+                )
+                fitting_policies.extend(
+                    _policy for _policy in chain([policy], policies) if fits(_policy)
+                )
+                return _unordered_highest_priority(fitting_policies)
+            last_priority = policy.priority
+            if fitting_policies and policy.priority < fitting_policies[0].priority:
+                # Lower priority policies cannot change the decision
+                break
+            if fits(policy):
+                fitting_policies.append(policy)
+        # Deny overrides within policies of highest priority
+        return bool(fitting_policies) and all(policy.is_allowed for policy in fitting_policies)
+
+
+class AsyncPDP(object):
+    """
+        Asynchronous policy decision point. Policies are retrieved from an
+        asynchronous storage and attribute values from asynchronous attribute
+        providers without blocking the event loop, so that many authorization
+        requests can be evaluated concurrently.
+
+        :Example:
+
+        .. code-block:: python
+
+            from redis.asyncio import Redis
+            from py_abac import AsyncPDP, EvaluationAlgorithm
+            from py_abac.provider.base import AsyncAttributeProvider
+            from py_abac.storage.redis import AsyncRedisStorage
+
+            # A simple email attribute provider class calling a service
+            class EmailAttributeProvider(AsyncAttributeProvider):
+                async def get_attribute_value(self, ace, attribute_path, ctx):
+                    return await directory.get_email(ctx.subject_id)
+
+            st = AsyncRedisStorage(Redis())
+            pdp = AsyncPDP(st, EvaluationAlgorithm.HIGHEST_PRIORITY, [EmailAttributeProvider()])
+
+            allowed = await pdp.is_allowed(request)
+
+        :param storage: asynchronous policy storage
+        :param algorithm: policy evaluation algorithm
+        :param providers: list of synchronous and asynchronous attribute providers
+        :param cache: optional cache of access decisions
+        :param compile_policies: whether policies are compiled into closures for evaluation
+        :param timeout: time in seconds within which a decision must be made, including the
+            retrieval of policies and attribute values. No limit when None.
+        :param timeout_decision: decision returned when the timeout is exceeded
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 storage: AsyncStorage,
+                 algorithm: EvaluationAlgorithm = EvaluationAlgorithm.DENY_OVERRIDES,
+                 providers: List[Union[AttributeProvider, AsyncAttributeProvider]] = None,
+                 cache: DecisionCache = None,
+                 compile_policies: bool = False,
+                 timeout: float = None,
+                 timeout_decision: bool = False):
+        if not isinstance(storage, AsyncStorage):
+            raise TypeError("Invalid type '{}' for storage.".format(type(storage)))
+        if not isinstance(algorithm, EvaluationAlgorithm):
+            raise TypeError("Invalid type '{}' for evaluation algorithm.".format(type(algorithm)))
+        self._storage = storage
+        self._algorithm = algorithm.value
+        self._providers = []
+        self._async_providers = []
+        for provider in providers or []:
+            if isinstance(provider, AttributeProvider):
+                self._providers.append(provider)
+            elif isinstance(provider, AsyncAttributeProvider):
+                self._async_providers.append(provider)
+            else:
+                raise TypeError("Invalid type '{}' for attribute provider.".format(type(provider)))
+        self._provider_routes = ProviderRoutes(self._providers)
+        self._async_provider_routes = ProviderRoutes(self._async_providers)
+        if cache is not None and not isinstance(cache, DecisionCache):
+            raise TypeError("Invalid type '{}' for decision cache.".format(type(cache)))
+        self._cache = cache
+        self._compile_policies = compile_policies
+        if timeout is not None and timeout <= 0:
+            raise ValueError("PDP timeout should be a positive number.")
+        self._timeout = timeout
+        self._timeout_decision = timeout_decision
+
+    @property
+    def cache(self) -> DecisionCache:
+        """
+            Decision cache used by the PDP. None if caching is disabled.
+        """
+        return self._cache
+
+    async def is_allowed(self, request: AccessRequest) -> bool:
+        """
+            Check if authorization request is allowed
+
+            :param request: request object
+            :return: True if authorized else False
+        """
+        if not isinstance(request, AccessRequest):
+            raise TypeError("Invalid type '{}' for authorization request.".format(request))
+
+        return await self._decide_within_timeout(request, self._get_for_target)
+
+    async def is_allowed_many(self, requests: Iterable[AccessRequest]) -> List[bool]:
+        """
+            Check if a batch of authorization requests are allowed. The storage is queried
+            only once for every distinct `(subject_id, resource_id, action_id)` triple in
+            the batch and the requests are evaluated concurrently.
+
+            :param requests: iterable of request objects
+            :return: list of decisions in the same order as the requests
+        """
+        requests = list(requests)
+        for request in requests:
+            if not isinstance(request, AccessRequest):
+                raise TypeError("Invalid type '{}' for authorization request.".format(request))
+
+        # Tasks retrieving policies from storage for each target ID triple in batch
+        target_policies = {}
+
+        async def retrieve(request):
+            return [policy async for policy in self._get_for_target(request)]
+
+        async def get_for_target(request):
+            target = (request.subject_id, request.resource_id, request.action_id)
+            if target not in target_policies:
+                target_policies[target] = asyncio.ensure_future(retrieve(request))
+            # Shielded so that a decision exceeding the timeout does not cancel the
+            # retrieval shared with the other requests of the target
+            for policy in await asyncio.shield(target_policies[target]):
+                yield policy
+
+        return list(await asyncio.gather(
+            *(self._decide_within_timeout(request, get_for_target) for request in requests)
+        ))
+
+    def _get_for_target(self, request: AccessRequest):
+        """
+            Get filtered policies based on request targets from storage. Policies
+            are retrieved in descending order of priority for the highest priority
+            algorithm.
+        """
+        if self._algorithm == EvaluationAlgorithm.HIGHEST_PRIORITY.value:
+            return self._storage.get_for_target_by_priority(
+                request.subject_id, request.resource_id, request.action_id
+            )
+        return self._storage.get_for_target(
+            request.subject_id, request.resource_id, request.action_id
+        )
+
+    async def _decide_within_timeout(self, request: AccessRequest, get_for_target):
+        """
+            Get access decision for request within the timeout of the PDP. The
+            timeout decision is returned if the timeout is exceeded.
+
+            :param request: request object
+            :param get_for_target: callable returning async iterator of policies for request targets
+            :return: True if authorized else False
+        """
+        if self._timeout is None:
+            return await self._decide(request, get_for_target)
+        try:
+            return await asyncio.wait_for(self._decide(request, get_for_target), self._timeout)
+        except asyncio.TimeoutError:
+            LOG.warning("Decision exceeded the PDP timeout of %s seconds. "
+                        "Returning the timeout decision.", self._timeout)
+            return self._timeout_decision
+
+    async def _decide(self, request: AccessRequest, get_for_target):
+        """
+            Get access decision for request. The decision cache is checked first
+            when enabled.
+
+            :param request: request object
+            :param get_for_target: callable returning async iterator of policies for request targets
+            :return: True if authorized else False
+        """
+        if self._cache is None:
+            return await self._evaluate(request, get_for_target(request))
+        if isinstance(self._cache, AttributeDecisionCache):
+            return await self._decide_by_attributes(request, get_for_target)
+
+        key = self._cache.make_key(request)
+        decision = self._cache.get(key)
+        if decision is None:
+            decision = await self._evaluate(request, get_for_target(request))
+            self._cache.set(key, decision)
+        return decision
+
+    async def _decide_by_attributes(self, request: AccessRequest, get_for_target):
+        """
+            Get access decision for request using a decision cache keyed by the
+            values of the attributes required by the policies for request targets.
+
+            :param request: request object
+            :param get_for_target: callable returning async iterator of policies for request targets
+            :return: True if authorized else False
+        """
+        ctx = AsyncEvaluationContext(request, self._provider_routes, self._async_provider_routes)
+        target = (request.subject_id, request.resource_id, request.action_id)
+        policies = None
+        required_attributes = self._cache.get_required_attributes(target)
+        if required_attributes is None:
+            policies = [policy async for policy in get_for_target(request)]
+            required_attributes = get_required_attributes(
+                policy for policy in policies if policy.targets.match(ctx)
+            )
+            self._cache.set_required_attributes(target, required_attributes)
+
+        while True:
+            values = {key: ctx.get_attribute_value(*key) for key in required_attributes}
+            # Resolve again if attribute values had to be fetched from the
+            # asynchronous attribute providers.
+            if not await ctx.fetch_pending():
+                break
+        key = self._cache.make_attribute_key(target, values)
+        decision = self._cache.get(key)
+        if decision is None:
+            if policies is None:
+                policies = get_for_target(request)
             else:
-                policy_groups[policy.priority] = [policy]
-        return self._deny_overrides(policy_groups[max_priority])
+                policies = _iterate(policies)
+            decision = await self._evaluate(request, policies, ctx)
+            self._cache.set(key, decision)
+        return decision
+
+    async def _evaluate(self, request: AccessRequest, policies, ctx: AsyncEvaluationContext = None):
+        """
+            Evaluate authorization request against given policies
+
+            :param request: request object
+            :param policies: async iterator of policies retrieved from storage for request targets
+            :param ctx: evaluation context. Created for the request if not given.
+            :return: True if authorized else False
+        """
+        # Get appropriate evaluation algorithm handler
+        evaluate = getattr(self, "_{}".format(self._algorithm))
+        # Create evaluation context
+        if ctx is None:
+            ctx = AsyncEvaluationContext(request, self._provider_routes,
+                                         self._async_provider_routes)
+        compile_policies = self._compile_policies
+
+        async def fits(policy):
+            _fits = policy.compile() if compile_policies else policy.fits
+            while True:
+                rvalue = _fits(ctx)
+                # Evaluate again if attribute values had to be fetched from the
+                # asynchronous attribute providers.
+                if not await ctx.fetch_pending():
+                    return rvalue
+
+        try:
+            return await evaluate(policies, fits)
+        finally:
+            # Release resources, e.g. database cursors, held by a partially
+            # consumed storage generator.
+            aclose = getattr(policies, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    @staticmethod
+    async def _allow_overrides(policies, fits):
+        """
+            Allow overrides evaluation algorithm. Stops at the first fitting
+            policy which allows access.
+
+            :param policies: async iterator of policies to evaluate
+            :param fits: coroutine function checking if a policy fits the request
+            :return: True if request is authorized else False
+        """
+        async for policy in policies:
+            if await fits(policy) and policy.is_allowed:
+                return True
+        return False
+
+    @staticmethod
+    async def _deny_overrides(policies, fits):
+        """
+            Deny overrides evaluation algorithm. Stops at the first fitting
+            policy which denies access.
+
+            :param policies: async iterator of policies to evaluate
+            :param fits: coroutine function checking if a policy fits the request
+            :return: True if request is authorized else False
+        """
+        allowed = False
+        async for policy in policies:
+            if await fits(policy):
+                if not policy.is_allowed:
+                    return False
+                allowed = True
+        return allowed
+
+    @staticmethod
+    async def _highest_priority(policies, fits):
+        """
+            Highest priority evaluation algorithm. The policies are expected in
+            descending order of priority so that evaluation stops once the highest
+            priority fitting policies have been checked.
+
+            :param policies: async iterator of policies ordered by priority to evaluate
+            :param fits: coroutine function checking if a policy fits the request
+            :return: True if request is authorized else False
+        """
+        # Fitting policies of highest priority
+        fitting_policies = []
+        last_priority = None
+        async for policy in policies:
+            if last_priority is not None and policy.priority > last_priority:
+                # Policies not ordered by priority. Evaluate all policies without
+                # relying on order.
+                LOG.warning(
+                    "Policy with UID=%s received out of order of priority. "
+                    "Evaluating all policies for target.", policy.uid
+                )
+                if await fits(policy):
+                    fitting_policies.append(policy)
+                async for _policy in policies:
+                    if await fits(_policy):
+                        fitting_policies.append(_policy)
+                return _unordered_highest_priority(fitting_policies)
+            last_priority = policy.priority
+            if fitting_policies and policy.priority < fitting_policies[0].priority:
+                # Lower priority policies cannot change the decision
+                break
+            if await fits(policy):
+                fitting_policies.append(policy)
+        # Deny overrides within policies of highest priority
+        return bool(fitting_policies) and all(policy.is_allowed for policy in fitting_policies)
+
+
+def _unordered_highest_priority(policies):
+    """
+        Highest priority evaluation algorithm for fitting policies in any order
+
+        :param policies: list of fitting policies to evaluate
+        :return: True if request is authorized else False
+    """
+    if not policies:
+        return False
+    max_priority = max(policy.priority for policy in policies)
+    # Deny overrides within policies of highest priority
+    return all(policy.is_allowed for policy in policies if policy.priority == max_priority)
+
+
+async def _iterate(policies):
+    """
+        Get async iterator of policies in a list
+
+        :param policies: list of policies
+    """
+    for policy in policies:
+        yield policy
@@ -2,4 +2,4 @@
     Exposed classes and methods
 """
 
-from .policy import Policy
+from .policy import Policy, get_required_attributes
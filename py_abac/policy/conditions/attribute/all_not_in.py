@@ -17,33 +17,28 @@ class AllNotInAttribute(AttributeCondition):
         Condition for all attribute values not in that of another
     """
 
-    def is_satisfied(self, ctx) -> bool:
-        # Extract attribute value from request to match
-        self.value = ctx.get_attribute_value(self.ace, self.path)
+    def evaluate(self, what, ctx) -> bool:
         # Check if attribute value to match is a collection
-        if not is_collection(ctx.attribute_value):
+        if not is_collection(what):
             LOG.debug(
-                "Invalid type '%s' for attribute value at path '%s' for element '%s'."
-                " Condition not satisfied.",
-                type(ctx.attribute_value),
-                ctx.attribute_path,
-                ctx.ace
+                "Invalid type '%s' for attribute value. Condition not satisfied.",
+                type(what)
             )
             return False
-        return self._is_satisfied(ctx.attribute_value)
+        return super().evaluate(what, ctx)
 
-    def _is_satisfied(self, what) -> bool:
+    def _is_satisfied(self, what, value) -> bool:
         # Check if value is a collection
-        if not is_collection(self.value):
+        if not is_collection(value):
             LOG.debug(
                 "Invalid type '%s' for attribute value at path '%s' for element '%s'."
                 " Condition not satisfied.",
-                type(self.value),
+                type(value),
                 self.path,
                 self.ace
             )
             return False
-        return not set(what).issubset(self.value)
+        return not set(what).issubset(value)
 
 
 class AllNotInAttributeSchema(AttributeConditionSchema):
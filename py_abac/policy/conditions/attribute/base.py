@@ -19,19 +19,23 @@ class AttributeCondition(ConditionBase, metaclass=ABCMeta):
     def __init__(self, ace, path):
         self.ace = ace
         self.path = path
-        self.value = None
 
-    def is_satisfied(self, ctx) -> bool:
+    @property
+    def required_attributes(self):
+        return frozenset([(self.ace, self.path)])
+
+    def evaluate(self, what, ctx) -> bool:
         # Extract attribute value from request to match
-        self.value = ctx.get_attribute_value(self.ace, self.path)
-        return self._is_satisfied(ctx.attribute_value)
+        value = ctx.get_attribute_value(self.ace, self.path)
+        return self._is_satisfied(what, value)
 
     @abstractmethod
-    def _is_satisfied(self, what) -> bool:
+    def _is_satisfied(self, what, value) -> bool:
         """
             Is attribute conditions satisfied
 
             :param what: attribute value to check
+            :param value: value of the attribute referred by the condition
             :return: True if satisfied else False
         """
         raise NotImplementedError()
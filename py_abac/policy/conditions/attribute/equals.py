@@ -12,8 +12,8 @@ class EqualsAttribute(AttributeCondition):
         Condition for attribute value equals that of another
     """
 
-    def _is_satisfied(self, what) -> bool:
-        return what == self.value
+    def _is_satisfied(self, what, value) -> bool:
+        return what == value
 
 
 class EqualsAttributeSchema(AttributeConditionSchema):
@@ -17,18 +17,18 @@ class IsInAttribute(AttributeCondition):
         Condition for attribute value in that of another
     """
 
-    def _is_satisfied(self, what) -> bool:
+    def _is_satisfied(self, what, value) -> bool:
         # Check if value is a collection
-        if not is_collection(self.value):
+        if not is_collection(value):
             LOG.debug(
                 "Invalid type '%s' for attribute value at path '%s' for element '%s'."
                 " Condition not satisfied.",
-                type(self.value),
+                type(value),
                 self.path,
                 self.ace
             )
             return False
-        return what in self.value
+        return what in value
 
 
 class IsInAttributeSchema(AttributeConditionSchema):
@@ -3,6 +3,7 @@
 """
 
 from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, FrozenSet, Tuple
 
 from py_abac.context import EvaluationContext
 
@@ -13,11 +14,62 @@ class ConditionBase(metaclass=ABCMeta):
     """
 
     @abstractmethod
-    def is_satisfied(self, ctx: EvaluationContext) -> bool:
+    def evaluate(self, what: Any, ctx: EvaluationContext) -> bool:
         """
-            Is conditions satisfied?
+            Is conditions satisfied by the attribute value?
+
+            Conditions must not store any state computed during evaluation so that
+            the same condition can be evaluated concurrently by multiple threads.
 
+            :param what: attribute value to check
             :param ctx: evaluation context
             :return: True if satisfied else False
         """
         raise NotImplementedError()
+
+    @property
+    def required_attributes(self) -> FrozenSet[Tuple[str, str]]:
+        """
+            Set of `(access control element, attribute path)` pairs of attribute
+            values read by the condition, in addition to the attribute value it
+            checks. Conditions reading other attributes from the evaluation
+            context must override it.
+        """
+        return frozenset()
+
+    def is_satisfied(self, ctx: EvaluationContext) -> bool:
+        """
+            Is conditions satisfied by the attribute value at the access control
+            element and attribute path set in the evaluation context?
+
+            :param ctx: evaluation context
+            :return: True if satisfied else False
+        """
+        return self.evaluate(ctx.attribute_value, ctx)
+
+    def compile(self) -> Callable[[Any, EvaluationContext], bool]:
+        """
+            Compile condition into a predicate called with the attribute value to check
+            and the evaluation context. The default predicate is :meth:`evaluate`, i.e.
+            the interpreted evaluation of the condition.
+
+            :return: predicate returning True if satisfied else False
+        """
+        return self.evaluate
+
+    def compile_for(  # pylint: disable=unused-argument
+            self,
+            ace: str,
+            attribute_path: str
+    ) -> Callable[[Any, EvaluationContext], bool]:
+        """
+            Compile condition on the attribute value at the access control element and
+            attribute path. Conditions may override it to share state with the conditions
+            of other compiled policies on the same attribute. The default predicate is
+            the one returned by :meth:`compile`.
+
+            :param ace: access control element
+            :param attribute_path: attribute path in ObjectPath format
+            :return: predicate returning True if satisfied else False
+        """
+        return self.compile()
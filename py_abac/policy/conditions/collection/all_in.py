@@ -13,7 +13,7 @@ class AllIn(CollectionCondition):
     """
 
     def _is_satisfied(self, what) -> bool:
-        return set(what).issubset(self.values)
+        return self._contains_all(what)
 
 
 class AllInSchema(CollectionConditionSchema):
@@ -13,7 +13,7 @@ class AnyIn(CollectionCondition):
     """
 
     def _is_satisfied(self, what) -> bool:
-        return bool(set(what).intersection(self.values))
+        return self._contains_any(what)
 
 
 class AnyInSchema(CollectionConditionSchema):
@@ -13,7 +13,7 @@ class AnyNotIn(CollectionCondition):
     """
 
     def _is_satisfied(self, what) -> bool:
-        return not bool(set(what).intersection(self.values))
+        return not self._contains_any(what)
 
 
 class AnyNotInSchema(CollectionConditionSchema):
@@ -20,7 +20,9 @@ def is_collection(value) -> bool:
 
 class CollectionCondition(ConditionBase, metaclass=ABCMeta):
     """
-        Base class for collection conditions
+        Base class for collection conditions. The values are hashed into a set on
+        creation so that membership is checked in constant time. Values which are
+        not hashable, e.g. dicts and lists, are kept in a list compared one by one.
 
         :param values: collection of values to compare during policy evaluation
     """
@@ -28,17 +30,84 @@ class CollectionCondition(ConditionBase, metaclass=ABCMeta):
     def __init__(self, values):
         self.values = values
 
-    def is_satisfied(self, ctx) -> bool:
-        if not is_collection(ctx.attribute_value):
+    @property
+    def values(self) -> list:
+        """
+            Collection of values to compare during policy evaluation
+        """
+        return self._values
+
+    @values.setter
+    def values(self, values: list):
+        self._values = values
+        value_set = set()
+        unhashable_values = []
+        for value in values:
+            try:
+                value_set.add(value)
+            except TypeError:
+                unhashable_values.append(value)
+        self._value_set = frozenset(value_set)
+        self._unhashable_values = tuple(unhashable_values)
+
+    def evaluate(self, what, ctx) -> bool:
+        if not is_collection(what):
             LOG.debug(
-                "Invalid type '%s' for attribute value at path '%s' for element '%s'."
-                " Condition not satisfied.",
-                type(ctx.attribute_value),
-                ctx.attribute_path,
-                ctx.ace
+                "Invalid type '%s' for attribute value. Condition not satisfied.",
+                type(what)
             )
             return False
-        return self._is_satisfied(ctx.attribute_value)
+        return self._is_satisfied(what)
+
+    def compile(self):
+        is_satisfied = self._compile()
+
+        def predicate(what, _):
+            if not is_collection(what):
+                LOG.debug(
+                    "Invalid type '%s' for attribute value. Condition not satisfied.",
+                    type(what)
+                )
+                return False
+            return is_satisfied(what)
+
+        return predicate
+
+    def _compile(self):
+        """
+            Compile collection condition into a predicate called with the value to check.
+            Conditions override this method to specialize the check on their value.
+        """
+        return self._is_satisfied
+
+    def _contains(self, value) -> bool:
+        """
+            Is value a member of the condition values
+        """
+        try:
+            return value in self._value_set
+        except TypeError:
+            return value in self._unhashable_values
+
+    def _contains_all(self, what) -> bool:
+        """
+            Are all values of collection members of the condition values
+        """
+        try:
+            # Iterates over the smaller of the collection and the condition values
+            return self._value_set.issuperset(what)
+        except TypeError:
+            # Collection has values which are not hashable
+            return all(self._contains(value) for value in what)
+
+    def _contains_any(self, what) -> bool:
+        """
+            Is any value of collection a member of the condition values
+        """
+        try:
+            return not self._value_set.isdisjoint(what)
+        except TypeError:
+            return any(self._contains(value) for value in what)
 
     @abstractmethod
     def _is_satisfied(self, what) -> bool:
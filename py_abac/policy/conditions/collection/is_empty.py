@@ -12,17 +12,28 @@ class IsEmpty(ConditionBase):
         Condition for `what` being an empty collection
     """
 
-    def is_satisfied(self, ctx) -> bool:
-        if not is_collection(ctx.attribute_value):
+    def evaluate(self, what, ctx) -> bool:
+        if not is_collection(what):
             LOG.debug(
-                "Invalid type '%s' for attribute value at path '%s' for element '%s'."
-                " Condition not satisfied.",
-                type(ctx.attribute_value),
-                ctx.attribute_path,
-                ctx.ace
+                "Invalid type '%s' for attribute value. Condition not satisfied.",
+                type(what)
             )
             return False
-        return self._is_satisfied(ctx.attribute_value)
+        return self._is_satisfied(what)
+
+    def compile(self):
+        is_satisfied = self._is_satisfied
+
+        def predicate(what, _):
+            if not is_collection(what):
+                LOG.debug(
+                    "Invalid type '%s' for attribute value. Condition not satisfied.",
+                    type(what)
+                )
+                return False
+            return is_satisfied(what)
+
+        return predicate
 
     @staticmethod
     def _is_satisfied(what) -> bool:
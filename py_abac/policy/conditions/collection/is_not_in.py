@@ -12,11 +12,19 @@ class IsNotIn(CollectionCondition):
         Condition for `what` is not a member of `values`
     """
 
-    def is_satisfied(self, ctx) -> bool:
-        return self._is_satisfied(ctx.attribute_value)
+    def evaluate(self, what, ctx) -> bool:
+        return self._is_satisfied(what)
+
+    def compile(self):
+        is_satisfied = self._is_satisfied
+
+        def predicate(what, _):
+            return is_satisfied(what)
+
+        return predicate
 
     def _is_satisfied(self, what) -> bool:
-        return what not in self.values
+        return not self._contains(what)
 
 
 class IsNotInSchema(CollectionConditionSchema):
@@ -0,0 +1,176 @@
+"""
+    Indexes of conditions shared by the compiled policies
+"""
+
+import logging
+import threading
+import weakref
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Optional, Tuple, Type
+
+LOG = logging.getLogger(__name__)
+
+
+class ConditionIndex(metaclass=ABCMeta):
+    """
+        Base class for indexes of the conditions of compiled policies on an attribute.
+        Compiled conditions add a key to the index, e.g. the network of a CIDR condition,
+        and the index finds the keys of all conditions satisfied by an attribute value
+        at once. The keys found for the last value looked up are kept, so that the
+        conditions of many policies on the same attribute share the lookup. The index
+        tables are built on the first lookup after the keys change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Number of predicates looking up each key
+        self._counts = {}  # type: Dict[Hashable, int]
+        # Index tables. None if to be built.
+        self._table = None
+        # Value and keys found for the last value looked up
+        self.last_lookup = None  # type: Optional[Tuple[Any, FrozenSet]]
+
+    def __len__(self):
+        return len(self._counts)
+
+    def add(self, key: Hashable):
+        """
+            Add key to index
+
+            :param key: key of condition
+        """
+        with self._lock:
+            if key not in self._counts:
+                self._counts[key] = 0
+                self._reset()
+            self._counts[key] += 1
+
+    def discard(self, key: Hashable):
+        """
+            Remove key added to index
+
+            :param key: key of condition
+        """
+        with self._lock:
+            self._counts[key] -= 1
+            if not self._counts[key]:
+                del self._counts[key]
+                self._reset()
+
+    def lookup(self, what) -> FrozenSet:
+        """
+            Get keys of index satisfied by attribute value
+
+            :param what: attribute value to check
+            :return: set of keys
+        """
+        table = self._table
+        if table is None:
+            table = self._get_table()
+        keys = self._find(table, what)
+        with self._lock:
+            # Keys found in a table changed meanwhile are not kept
+            if self._table is table:
+                self.last_lookup = (what, keys)
+        return keys
+
+    def compile(
+            self,
+            key: Hashable,
+            value_type: type,
+            negated: bool = False
+    ) -> Callable[[Any, Any], bool]:
+        """
+            Add key to index and get condition predicate checking if the key is satisfied
+            by an attribute value. The key is removed from the index along with the
+            predicate.
+
+            :param key: key of condition
+            :param value_type: type of attribute values looked up. The condition is not
+                satisfied by values of other types.
+            :param negated: whether the condition is satisfied if the key is not
+                satisfied, e.g. for NotContains conditions sharing the index of Contains
+                conditions
+            :return: predicate called with the attribute value to check and the
+                evaluation context
+        """
+        self.add(key)
+
+        def predicate(what, _):
+            if not isinstance(what, value_type):
+                LOG.debug(
+                    "Invalid type '%s' for attribute value. Condition not satisfied.",
+                    type(what)
+                )
+                return False
+            last = self.last_lookup
+            if last is not None and last[0] == what:
+                return (key in last[1]) is not negated
+            return (key in self.lookup(what)) is not negated
+
+        weakref.finalize(predicate, self.discard, key).atexit = False
+        return predicate
+
+    @abstractmethod
+    def _build(self, keys: Iterable[Hashable]):
+        """
+            Build index tables
+
+            :param keys: keys of index
+            :return: index tables
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _find(self, table, what) -> FrozenSet:
+        """
+            Find keys satisfied by attribute value in index tables
+
+            :param table: index tables
+            :param what: attribute value to check
+            :return: set of keys
+        """
+        raise NotImplementedError()
+
+    def _get_table(self):
+        """
+            Get index tables, building them if the index changed
+        """
+        with self._lock:
+            if self._table is None:
+                self._table = self._build(list(self._counts))
+            return self._table
+
+    def _reset(self):
+        """
+            Reset index tables and last lookup on change of the keys
+        """
+        self._table = None
+        self.last_lookup = None
+
+
+# Indexes keyed by index type, access control element and attribute path
+_INDEXES = {}  # type: Dict[Tuple[Type[ConditionIndex], str, str], ConditionIndex]
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_condition_index(
+        index_type: Type[ConditionIndex],
+        ace: str,
+        attribute_path: str
+) -> ConditionIndex:
+    """
+        Get index of the conditions of compiled policies on an attribute
+
+        :param index_type: type of index
+        :param ace: access control element
+        :param attribute_path: attribute path in ObjectPath format
+        :return: index shared by the conditions on the attribute
+    """
+    with _INDEXES_LOCK:
+        key = (index_type, ace, attribute_path)
+        try:
+            return _INDEXES[key]
+        except KeyError:
+            index = _INDEXES[key] = index_type()
+            return index
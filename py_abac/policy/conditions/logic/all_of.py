@@ -12,8 +12,19 @@ class AllOf(LogicCondition):
         Condition for all of the sub-rules are satisfied
     """
 
-    def is_satisfied(self, ctx) -> bool:
-        return all(value.is_satisfied(ctx) for value in self.values)
+    def evaluate(self, what, ctx) -> bool:
+        return all(value.evaluate(what, ctx) for value in self.values)
+
+    def compile(self):
+        predicates = tuple(value.compile() for value in self.values)
+
+        def predicate(what, ctx):
+            for _predicate in predicates:
+                if not _predicate(what, ctx):
+                    return False
+            return True
+
+        return predicate
 
 
 class AllOfSchema(LogicConditionSchema):
@@ -12,8 +12,19 @@ class AnyOf(LogicCondition):
         Condition for any of sub-rules are satisfied
     """
 
-    def is_satisfied(self, ctx) -> bool:
-        return any(value.is_satisfied(ctx) for value in self.values)
+    def evaluate(self, what, ctx) -> bool:
+        return any(value.evaluate(what, ctx) for value in self.values)
+
+    def compile(self):
+        predicates = tuple(value.compile() for value in self.values)
+
+        def predicate(what, ctx):
+            for _predicate in predicates:
+                if _predicate(what, ctx):
+                    return True
+            return False
+
+        return predicate
 
 
 class AnyOfSchema(LogicConditionSchema):
@@ -15,7 +15,11 @@ class LogicCondition(ConditionBase, metaclass=ABCMeta):
     def __init__(self, values):
         self.values = values
 
-    def is_satisfied(self, ctx) -> bool:
+    @property
+    def required_attributes(self):
+        return frozenset().union(*(value.required_attributes for value in self.values))
+
+    def evaluate(self, what, ctx) -> bool:
         raise NotImplementedError()
 
 
@@ -15,8 +15,20 @@ class Not(ConditionBase):
     def __init__(self, value):
         self.value = value
 
-    def is_satisfied(self, ctx) -> bool:
-        return not self.value.is_satisfied(ctx)
+    @property
+    def required_attributes(self):
+        return self.value.required_attributes
+
+    def evaluate(self, what, ctx) -> bool:
+        return not self.value.evaluate(what, ctx)
+
+    def compile(self):
+        _predicate = self.value.compile()
+
+        def predicate(what, ctx):
+            return not _predicate(what, ctx)
+
+        return predicate
 
 
 class NotSchema(Schema):
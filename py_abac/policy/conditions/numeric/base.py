@@ -26,17 +26,35 @@ class NumericCondition(ConditionBase, metaclass=ABCMeta):
     def __init__(self, value):
         self.value = value
 
-    def is_satisfied(self, ctx) -> bool:
-        if not is_number(ctx.attribute_value):
+    def evaluate(self, what, ctx) -> bool:
+        if not is_number(what):
             LOG.debug(
-                "Invalid type '%s' for attribute value at path '%s' for element '%s'."
-                " Condition not satisfied.",
-                type(ctx.attribute_value),
-                ctx.attribute_path,
-                ctx.ace
+                "Invalid type '%s' for attribute value. Condition not satisfied.",
+                type(what)
             )
             return False
-        return self._is_satisfied(ctx.attribute_value)
+        return self._is_satisfied(what)
+
+    def compile(self):
+        is_satisfied = self._compile()
+
+        def predicate(what, _):
+            if not is_number(what):
+                LOG.debug(
+                    "Invalid type '%s' for attribute value. Condition not satisfied.",
+                    type(what)
+                )
+                return False
+            return is_satisfied(what)
+
+        return predicate
+
+    def _compile(self):
+        """
+            Compile numeric condition into a predicate called with the value to check.
+            Conditions override this method to specialize the check on their value.
+        """
+        return self._is_satisfied
 
     @abstractmethod
     def _is_satisfied(self, what) -> bool:
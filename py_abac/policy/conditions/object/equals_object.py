@@ -15,8 +15,16 @@ class EqualsObject(ConditionBase):
     def __init__(self, value):
         self.value = value
 
-    def is_satisfied(self, ctx) -> bool:
-        return self.value == ctx.attribute_value
+    def evaluate(self, what, ctx) -> bool:
+        return self.value == what
+
+    def compile(self):
+        value = self.value
+
+        def predicate(what, _):
+            return value == what
+
+        return predicate
 
 
 class EqualsObjectSchema(Schema):
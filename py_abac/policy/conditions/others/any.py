@@ -11,9 +11,15 @@ class Any(ConditionBase):
         Condition for attribute having any value
     """
 
-    def is_satisfied(self, ctx) -> bool:
+    def evaluate(self, what, ctx) -> bool:
         return True
 
+    def compile(self):
+        def predicate(*_):
+            return True
+
+        return predicate
+
 
 class AnySchema(Schema):
     """
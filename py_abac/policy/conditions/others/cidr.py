@@ -4,33 +4,108 @@
 
 import ipaddress
 import logging
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from marshmallow import Schema, fields, post_load
 
 from ..base import ConditionBase
+from ..index import ConditionIndex, get_condition_index
 
 LOG = logging.getLogger(__name__)
 
+# Number of bits of IPv4 and IPv6 addresses
+_ADDRESS_BITS = {4: 32, 6: 128}
+
+# Maximum number of parsed IP addresses cached
+ADDRESS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def parse_address(what: str) -> Optional[Tuple[int, int]]:
+    """
+        Parse IP address
+
+        :param what: IPv4 or IPv6 address
+        :return: IP version and integer value of address. None if invalid.
+    """
+    try:
+        address = ipaddress.ip_address(what)
+    except ValueError:
+        return None
+    return address.version, int(address)
+
+
+def parse_network(value: str) -> Optional[Tuple[int, int, int]]:
+    """
+        Parse IP network in CIDR notation
+
+        :param value: IPv4 or IPv6 network
+        :return: IP version, prefix length and network prefix, i.e. the integer value
+            of the network address shifted right by the number of host bits. None if
+            invalid.
+    """
+    try:
+        network = ipaddress.ip_network(value)
+    except (TypeError, ValueError):
+        return None
+    host_bits = _ADDRESS_BITS[network.version] - network.prefixlen
+    return network.version, network.prefixlen, int(network.network_address) >> host_bits
+
 
 class CIDR(ConditionBase):
     """
-        Condition for IP address `what` in CIDR `value`.
+        Condition for IP address `what` in CIDR `value`. The network is parsed once
+        on creation.
     """
 
     def __init__(self, value):
         self.value = value
 
-    def is_satisfied(self, ctx) -> bool:
-        if not isinstance(ctx.attribute_value, str):
+    @property
+    def value(self) -> str:
+        """
+            IP network in CIDR notation
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: str):
+        self._value = value
+        self._network = parse_network(value)
+
+    def evaluate(self, what, ctx) -> bool:
+        if not isinstance(what, str):
             LOG.debug(
-                "Invalid type '%s' for attribute value at path '%s' for element '%s'."
-                " Condition not satisfied.",
-                type(ctx.attribute_value),
-                ctx.attribute_path,
-                ctx.ace
+                "Invalid type '%s' for attribute value. Condition not satisfied.",
+                type(what)
             )
             return False
-        return self._is_satisfied(ctx.attribute_value)
+        return self._is_satisfied(what)
+
+    def compile(self):
+        is_satisfied = self._is_satisfied
+
+        def predicate(what, _):
+            if not isinstance(what, str):
+                LOG.debug(
+                    "Invalid type '%s' for attribute value. Condition not satisfied.",
+                    type(what)
+                )
+                return False
+            return is_satisfied(what)
+
+        return predicate
+
+    def compile_for(self, ace: str, attribute_path: str):
+        """
+            Compile condition into a predicate looking up the network in the index of
+            networks of the CIDR conditions on the attribute, see :class:`CIDRIndex`.
+        """
+        if self._network is None:
+            return self.compile()
+        index = get_condition_index(CIDRIndex, ace, attribute_path)
+        return index.compile(self._network, str)
 
     def _is_satisfied(self, what) -> bool:
         """
@@ -39,12 +114,43 @@ class CIDR(ConditionBase):
             :param what: IP address to check
             :return: True if satisfied else False
         """
-        try:
-            ip_addr = ipaddress.ip_address(what)
-            net = ipaddress.ip_network(self.value)
-        except ValueError:
+        address = parse_address(what)
+        if address is None or self._network is None:
             return False
-        return ip_addr in net
+        version, prefix_length, prefix = self._network
+        return address[0] == version and \
+            address[1] >> (_ADDRESS_BITS[version] - prefix_length) == prefix
+
+
+class CIDRIndex(ConditionIndex):
+    """
+        Index of the IP networks checked by CIDR conditions on an attribute. The
+        networks are kept in a table of network prefixes per IP version and prefix
+        length, so that the networks containing an IP address are found by one
+        lookup per distinct prefix length instead of checking each network.
+    """
+
+    def _build(self, keys):
+        prefixes = {}
+        for version, prefix_length, prefix in keys:
+            prefixes.setdefault(version, {}).setdefault(prefix_length, set()).add(prefix)
+        return {
+            version: tuple((prefix_length, frozenset(version_prefixes[prefix_length]))
+                           for prefix_length in sorted(version_prefixes))
+            for version, version_prefixes in prefixes.items()
+        }
+
+    def _find(self, table, what):
+        address = parse_address(what)
+        if address is None:
+            return frozenset()
+        version, value = address
+        bits = _ADDRESS_BITS[version]
+        return frozenset(
+            (version, prefix_length, value >> (bits - prefix_length))
+            for prefix_length, prefixes in table.get(version, ())
+            if value >> (bits - prefix_length) in prefixes
+        )
 
 
 class CIDRSchema(Schema):
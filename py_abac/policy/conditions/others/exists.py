@@ -11,8 +11,14 @@ class Exists(ConditionBase):
         Condition for attribute value exists
     """
 
-    def is_satisfied(self, ctx) -> bool:
-        return ctx.attribute_value is not None
+    def evaluate(self, what, ctx) -> bool:
+        return what is not None
+
+    def compile(self):
+        def predicate(what, _):
+            return what is not None
+
+        return predicate
 
 
 class ExistsSchema(Schema):
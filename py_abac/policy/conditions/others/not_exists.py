@@ -12,8 +12,14 @@ class NotExists(ConditionBase):
         Condition for attribute value not exists
     """
 
-    def is_satisfied(self, ctx) -> bool:
-        return ctx.attribute_value is None
+    def evaluate(self, what, ctx) -> bool:
+        return what is None
+
+    def compile(self):
+        def predicate(what, _):
+            return what is None
+
+        return predicate
 
 
 class NotExistsSchema(Schema):
@@ -27,17 +27,35 @@ class StringCondition(ConditionBase, metaclass=ABCMeta):
         self.case_insensitive = case_insensitive or False
         self.value = value
 
-    def is_satisfied(self, ctx) -> bool:
-        if not is_string(ctx.attribute_value):
+    def evaluate(self, what, ctx) -> bool:
+        if not is_string(what):
             LOG.debug(
-                "Invalid type '%s' for attribute value at path '%s' for element '%s'."
-                " Condition not satisfied.",
-                type(ctx.attribute_value),
-                ctx.attribute_path,
-                ctx.ace
+                "Invalid type '%s' for attribute value. Condition not satisfied.",
+                type(what)
             )
             return False
-        return self._is_satisfied(ctx.attribute_value)
+        return self._is_satisfied(what)
+
+    def compile(self):
+        is_satisfied = self._compile()
+
+        def predicate(what, _):
+            if not is_string(what):
+                LOG.debug(
+                    "Invalid type '%s' for attribute value. Condition not satisfied.",
+                    type(what)
+                )
+                return False
+            return is_satisfied(what)
+
+        return predicate
+
+    def _compile(self):
+        """
+            Compile string condition into a predicate called with the value to check.
+            Conditions override this method to specialize the check on their value.
+        """
+        return self._is_satisfied
 
     @abstractmethod
     def _is_satisfied(self, what) -> bool:
@@ -5,6 +5,8 @@
 from marshmallow import post_load
 
 from .base import StringCondition, StringConditionSchema
+from .trie import SubstringIndex
+from ..index import get_condition_index
 
 
 class Contains(StringCondition):
@@ -17,6 +19,23 @@ class Contains(StringCondition):
             return self.value.lower() in what.lower()
         return self.value in what
 
+    def _compile(self):
+        if self.case_insensitive:
+            value = self.value.lower()
+            return lambda what: value in what.lower()
+        value = self.value
+        return lambda what: value in what
+
+    def compile_for(self, ace: str, attribute_path: str):
+        """
+            Compile condition into a predicate looking up the substring in the index of
+            substrings of the Contains and NotContains conditions on the attribute, see
+            :class:`SubstringIndex`.
+        """
+        substring = self.value.lower() if self.case_insensitive else self.value
+        index = get_condition_index(SubstringIndex, ace, attribute_path)
+        return index.compile((bool(self.case_insensitive), substring), str)
+
 
 class ContainsSchema(StringConditionSchema):
     """
@@ -5,6 +5,8 @@
 from marshmallow import post_load
 
 from .base import StringCondition, StringConditionSchema
+from .trie import SuffixIndex
+from ..index import get_condition_index
 
 
 class EndsWith(StringCondition):
@@ -17,6 +19,22 @@ class EndsWith(StringCondition):
             return what.lower().endswith(self.value.lower())
         return what.endswith(self.value)
 
+    def _compile(self):
+        if self.case_insensitive:
+            value = self.value.lower()
+            return lambda what: what.lower().endswith(value)
+        value = self.value
+        return lambda what: what.endswith(value)
+
+    def compile_for(self, ace: str, attribute_path: str):
+        """
+            Compile condition into a predicate looking up the suffix in the index of
+            suffixes of the EndsWith conditions on the attribute, see :class:`SuffixIndex`.
+        """
+        suffix = self.value.lower() if self.case_insensitive else self.value
+        index = get_condition_index(SuffixIndex, ace, attribute_path)
+        return index.compile((bool(self.case_insensitive), suffix), str)
+
 
 class EndsWithSchema(StringConditionSchema):
     """
@@ -17,6 +17,13 @@ class Equals(StringCondition):
             return what.lower() == self.value.lower()
         return what == self.value
 
+    def _compile(self):
+        if self.case_insensitive:
+            value = self.value.lower()
+            return lambda what: what.lower() == value
+        value = self.value
+        return lambda what: what == value
+
 
 class EqualsSchema(StringConditionSchema):
     """
@@ -3,19 +3,72 @@
 """
 
 import re
+from functools import lru_cache
 
-from marshmallow import Schema, fields, post_load, ValidationError
+from marshmallow import fields, post_load, ValidationError
 
-from .base import StringCondition
+from .base import StringCondition, StringConditionSchema
+
+# Maximum number of compiled regexes shared by the regex match conditions
+REGEX_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_regex(pattern: str, case_insensitive: bool):
+    """
+        Compile regex. Compiled regexes are cached independent of the cache of the
+        `re` module, which holds only a few hundred patterns, so that conditions
+        created for every request by storages share them.
+
+        :param pattern: regular expression
+        :param case_insensitive: whether the regex ignores case
+        :return: compiled regex
+    """
+    return re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
 
 
 class RegexMatch(StringCondition):
     """
-        Condition for string `what` matches regex `value`
+        Condition for string `what` matches regex `value`. The regex is compiled
+        once on creation.
     """
 
+    def __init__(self, value, case_insensitive=False):
+        self._value = value
+        self._case_insensitive = case_insensitive or False
+        self._regex = compile_regex(value, self._case_insensitive)
+        super().__init__(value, case_insensitive)
+
+    @property
+    def value(self) -> str:
+        """
+            Regular expression
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: str):
+        self._value = value
+        self._regex = compile_regex(self._value, self._case_insensitive)
+
+    @property
+    def case_insensitive(self) -> bool:
+        """
+            Whether the regular expression ignores case
+        """
+        return self._case_insensitive
+
+    @case_insensitive.setter
+    def case_insensitive(self, value: bool):
+        self._case_insensitive = value
+        self._regex = compile_regex(self._value, self._case_insensitive)
+
     def _is_satisfied(self, what) -> bool:
-        return re.search(self.value, what) is not None
+        return self._regex.search(what) is not None
+
+    def _compile(self):
+        search = self._regex.search
+        return lambda what: search(what) is not None
 
 
 def validate_regex(value):
@@ -25,12 +78,12 @@ def validate_regex(value):
     """
     # noinspection PyBroadException
     try:
-        re.compile(value)
+        compile_regex(value, False)
     except Exception:
         raise ValidationError("Invalid regex expression '{}'.".format(value))
 
 
-class RegexMatchSchema(Schema):
+class RegexMatchSchema(StringConditionSchema):
     """
         JSON schema for regex match string condition
     """
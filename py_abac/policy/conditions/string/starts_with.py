@@ -5,6 +5,8 @@
 from marshmallow import post_load
 
 from .base import StringCondition, StringConditionSchema
+from .trie import PrefixIndex
+from ..index import get_condition_index
 
 
 class StartsWith(StringCondition):
@@ -17,6 +19,22 @@ class StartsWith(StringCondition):
             return what.lower().startswith(self.value.lower())
         return what.startswith(self.value)
 
+    def _compile(self):
+        if self.case_insensitive:
+            value = self.value.lower()
+            return lambda what: what.lower().startswith(value)
+        value = self.value
+        return lambda what: what.startswith(value)
+
+    def compile_for(self, ace: str, attribute_path: str):
+        """
+            Compile condition into a predicate looking up the prefix in the index of
+            prefixes of the StartsWith conditions on the attribute, see :class:`PrefixIndex`.
+        """
+        prefix = self.value.lower() if self.case_insensitive else self.value
+        index = get_condition_index(PrefixIndex, ace, attribute_path)
+        return index.compile((bool(self.case_insensitive), prefix), str)
+
 
 class StartsWithSchema(StringConditionSchema):
     """
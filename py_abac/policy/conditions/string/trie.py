@@ -0,0 +1,182 @@
+"""
+    Trie indexes of string prefix, suffix and substring conditions
+"""
+
+from collections import deque
+from typing import Iterable, List, Tuple
+
+from ..index import ConditionIndex
+
+# Key of the node entry holding the condition key of a string ending at the node
+_END = ""
+
+
+def build_trie(keys: Iterable[Tuple[bool, str]], reverse: bool) -> dict:
+    """
+        Build trie of the strings of string condition keys. Nodes are dicts keyed by
+        the next character, with the condition key of a string ending at the node
+        stored under the empty string.
+
+        :param keys: pairs of case insensitive flag and string, lower cased if case
+            insensitive
+        :param reverse: whether the strings are inserted reversed
+        :return: trie
+    """
+    root = {}
+    for key in keys:
+        node = root
+        for char in (reversed(key[1]) if reverse else key[1]):
+            node = node.setdefault(char, {})
+        node[_END] = key
+    return root
+
+
+def walk_trie(trie: dict, chars: Iterable[str]) -> list:
+    """
+        Walk trie along characters
+
+        :param trie: trie built by :func:`build_trie`
+        :param chars: characters to walk along
+        :return: condition keys of the strings which are prefixes of the characters
+    """
+    keys = []
+    node = trie
+    for char in chars:
+        if _END in node:
+            keys.append(node[_END])
+        node = node.get(char)
+        if node is None:
+            return keys
+    if _END in node:
+        keys.append(node[_END])
+    return keys
+
+
+# Aho-Corasick automaton as transitions, failure transition and outputs per state
+Automaton = Tuple[List[dict], List[int], List[tuple]]
+
+
+def build_automaton(keys: Iterable[Tuple[bool, str]]) -> Automaton:
+    """
+        Build Aho-Corasick automaton of the strings of string condition keys, i.e. a
+        trie of the strings with failure transitions to the state of the longest
+        proper suffix of the characters matched which is a prefix of a string.
+
+        :param keys: pairs of case insensitive flag and string, lower cased if case
+            insensitive
+        :return: transitions keyed by character, failure transition and condition
+            keys of the strings found per state. State 0 is the initial state.
+    """
+    transitions = [{}]
+    outputs = [[]]
+    for key in keys:
+        state = 0
+        for char in key[1]:
+            next_state = transitions[state].get(char)
+            if next_state is None:
+                next_state = transitions[state][char] = len(transitions)
+                transitions.append({})
+                outputs.append([])
+            state = next_state
+        outputs[state].append(key)
+    failures = [0] * len(transitions)
+    # States are visited in breadth first order so that failure transitions of
+    # shorter prefixes are set first
+    queue = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in transitions[state].items():
+            queue.append(next_state)
+            failure = failures[state]
+            while failure and char not in transitions[failure]:
+                failure = failures[failure]
+            if state:
+                failure = transitions[failure].get(char, 0)
+            failures[next_state] = failure
+            # Strings found at the failure state are suffixes of the ones found at state
+            if failure:
+                outputs[next_state].extend(outputs[failure])
+    return transitions, failures, [tuple(output) for output in outputs]
+
+
+def scan_automaton(automaton: Automaton, text: str) -> list:
+    """
+        Scan text with Aho-Corasick automaton
+
+        :param automaton: automaton built by :func:`build_automaton`
+        :param text: text to scan
+        :return: condition keys of the strings found in the text. Keys may be
+            repeated.
+    """
+    transitions, failures, outputs = automaton
+    keys = list(outputs[0])
+    state = 0
+    for char in text:
+        while state and char not in transitions[state]:
+            state = failures[state]
+        state = transitions[state].get(char, 0)
+        if outputs[state]:
+            keys.extend(outputs[state])
+    return keys
+
+
+class PrefixIndex(ConditionIndex):
+    """
+        Index of the prefixes checked by StartsWith conditions on an attribute. The
+        keys are pairs of case insensitive flag and prefix, lower cased if case
+        insensitive. The prefixes are kept in a trie for case sensitive conditions
+        and one for case insensitive conditions, so that the satisfied conditions
+        are found in one walk over the attribute value per trie.
+    """
+
+    # Whether strings are matched at the end of the attribute value
+    reverse = False
+
+    def _build(self, keys):
+        return (build_trie((key for key in keys if not key[0]), self.reverse),
+                build_trie((key for key in keys if key[0]), self.reverse))
+
+    def _find(self, table, what):
+        case_sensitive_trie, case_insensitive_trie = table
+        keys = []
+        if case_sensitive_trie:
+            keys.extend(walk_trie(case_sensitive_trie, reversed(what) if self.reverse else what))
+        if case_insensitive_trie:
+            what = what.lower()
+            keys.extend(walk_trie(case_insensitive_trie, reversed(what) if self.reverse else what))
+        return frozenset(keys)
+
+
+class SuffixIndex(PrefixIndex):
+    """
+        Index of the suffixes checked by EndsWith conditions on an attribute, kept
+        in tries of the reversed suffixes walked from the end of the attribute value.
+    """
+
+    reverse = True
+
+
+class SubstringIndex(ConditionIndex):
+    """
+        Index of the substrings checked by Contains and NotContains conditions on
+        an attribute. The keys are pairs of case insensitive flag and substring,
+        lower cased if case insensitive. The substrings are kept in an Aho-Corasick
+        automaton for case sensitive conditions and one for case insensitive
+        conditions, so that the satisfied conditions are found in one scan of the
+        attribute value per automaton.
+    """
+
+    def _build(self, keys):
+        case_sensitive_keys = [key for key in keys if not key[0]]
+        case_insensitive_keys = [key for key in keys if key[0]]
+        return (build_automaton(case_sensitive_keys) if case_sensitive_keys else None,
+                build_automaton(case_insensitive_keys) if case_insensitive_keys else None)
+
+    def _find(self, table, what):
+        case_sensitive_automaton, case_insensitive_automaton = table
+        keys = []
+        if case_sensitive_automaton:
+            keys.extend(scan_automaton(case_sensitive_automaton, what))
+        if case_insensitive_automaton:
+            keys.extend(scan_automaton(case_insensitive_automaton, what.lower()))
+        return frozenset(keys)
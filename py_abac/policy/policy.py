@@ -2,6 +2,8 @@
     Policy class
 """
 
+from typing import Callable, FrozenSet, Iterable, Tuple
+
 from marshmallow import Schema, fields, post_load, ValidationError, validate
 
 from .rules import Rules, RulesSchema
@@ -31,18 +33,88 @@ class Policy(object):
     ):
         self.uid = uid
         self.description = description
+        self._compiled = None
+        # JSON of rules not yet decoded by a lazily loaded policy
+        self._rules_json = None
+        self._required_attributes = None
         self.rules = rules
         self.targets = targets
         self.effect = effect
         self.priority = priority
 
+    @property
+    def rules(self) -> Rules:
+        """
+            Policy rules. The rules of a lazily loaded policy are decoded on first access.
+        """
+        if self._rules is None and self._rules_json is not None:
+            try:
+                rules = RulesSchema().load(self._rules_json)
+            except ValidationError as err:
+                raise PolicyCreateError(*err.args)
+            # The compiled policy is kept as it decodes the rules on first use
+            self._rules = rules
+            self._rules_json = None
+            self._required_attributes = rules.required_attributes
+        return self._rules
+
+    @rules.setter
+    def rules(self, value: Rules):
+        """
+            Set policy rules. The compiled policy is discarded and the attributes
+            required by the rules are analyzed.
+        """
+        self._rules = value
+        self._rules_json = None
+        self._compiled = None
+        self._required_attributes = value.required_attributes if value is not None else None
+
+    @property
+    def required_attributes(self) -> FrozenSet[Tuple[str, str]]:
+        """
+            Set of `(access control element, attribute path)` pairs of attribute
+            values the policy rules can read, see :attr:`Rules.required_attributes`.
+            The set is computed once when the rules are set or, for a lazily loaded
+            policy, decoded.
+
+            .. note:
+
+                Rules modified in place are not reflected. Re-assign the rules to
+                analyze them again.
+        """
+        if self._required_attributes is None:
+            # Decode and analyze the rules of a lazily loaded policy
+            self.rules  # pylint: disable=pointless-statement
+        return self._required_attributes
+
+    @property
+    def targets(self) -> Targets:
+        """
+            Policy targets
+        """
+        return self._targets
+
+    @targets.setter
+    def targets(self, value: Targets):
+        """
+            Set policy targets. The compiled policy is discarded.
+        """
+        self._targets = value
+        self._compiled = None
+
     @staticmethod
-    def from_json(data: dict) -> "Policy":
+    def from_json(data: dict, lazy: bool = False) -> "Policy":
         """
             Create Policy object from JSON
+
+            :param data: policy JSON
+            :param lazy: if True, only the targets, effect and priority of the
+                policy are decoded while its rules are decoded on first access.
+                Errors in the rules are then raised on first access.
+            :return: policy object
         """
         try:
-            return PolicySchema().load(data)
+            return (LazyPolicySchema() if lazy else PolicySchema()).load(data)
         except ValidationError as err:
             raise PolicyCreateError(*err.args)
 
@@ -54,12 +126,44 @@ class Policy(object):
 
     def fits(self, ctx: EvaluationContext) -> bool:
         """
-            Check if the request fits policy
+            Check if the request fits policy. The targets are checked first
+            so that rules are neither decoded nor evaluated for requests not
+            matching them.
 
             :param ctx: evaluation context
             :return: True if fits else False
         """
-        return self.rules.is_satisfied(ctx) and self.targets.match(ctx)
+        return self.targets.match(ctx) and self.rules.is_satisfied(ctx)
+
+    def compile(self) -> Callable[[EvaluationContext], bool]:
+        """
+            Compile policy into a closure checking if the request fits policy. The
+            closure gives the same result as :meth:`fits` while avoiding the overhead
+            of interpreting the rules and targets on every call. The compiled closure
+            is cached on the policy until its rules or targets are replaced.
+
+            .. note:
+
+                Conditions modified in place after compilation are not reflected by the
+                compiled closure. Re-assign the rules to discard it.
+
+            :return: compiled closure called with the evaluation context
+        """
+        if self._compiled is None:
+            targets_match = self.targets.compile()
+            # Rules are compiled on first match of targets
+            rules_satisfied = None
+
+            def fits(ctx: EvaluationContext) -> bool:
+                nonlocal rules_satisfied
+                if not targets_match(ctx):
+                    return False
+                if rules_satisfied is None:
+                    rules_satisfied = self.rules.compile()
+                return rules_satisfied(ctx)
+
+            self._compiled = fits
+        return self._compiled
 
     @property
     def is_allowed(self) -> bool:
@@ -69,6 +173,18 @@ class Policy(object):
         return self.effect == ALLOW_ACCESS
 
 
+def get_required_attributes(policies: Iterable[Policy]) -> FrozenSet[Tuple[str, str]]:
+    """
+        Get set of `(access control element, attribute path)` pairs of attribute
+        values the rules of the policies can read, e.g. of the policies returned
+        by :meth:`Storage.get_for_target`.
+
+        :param policies: policies to analyze
+        :return: set of attribute pairs
+    """
+    return frozenset().union(*(policy.required_attributes for policy in policies))
+
+
 class PolicySchema(Schema):
     """
         JSON schema for policy
@@ -83,3 +199,17 @@ class PolicySchema(Schema):
     @post_load
     def post_load(self, data, **_):  # pylint: disable=missing-docstring,no-self-use
         return Policy(**data)
+
+
+class LazyPolicySchema(PolicySchema):
+    """
+        JSON schema for policy deferring the decoding of rules
+    """
+    rules = fields.Dict(required=True)
+
+    @post_load
+    def post_load(self, data, **_):  # pylint: disable=missing-docstring,no-self-use
+        rules_json = data.pop("rules")
+        policy = Policy(rules=None, **data)
+        policy._rules_json = rules_json  # pylint: disable=protected-access
+        return policy
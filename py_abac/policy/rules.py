@@ -2,7 +2,8 @@
     Policy rules class
 """
 
-from typing import Union, List, Dict
+import logging
+from typing import Callable, Union, List, Dict, FrozenSet, Tuple
 
 from marshmallow import Schema, fields, post_load
 
@@ -10,6 +11,8 @@ from .conditions.attribute.base import validate_path
 from .conditions.schema import ConditionSchema
 from ..context import EvaluationContext
 
+LOG = logging.getLogger(__name__)
+
 
 class Rules(object):
     """
@@ -28,6 +31,25 @@ class Rules(object):
         self.action = action
         self.context = context
 
+    @property
+    def required_attributes(self) -> FrozenSet[Tuple[str, str]]:
+        """
+            Set of `(access control element, attribute path)` pairs of attribute
+            values the rules can read. Includes the attributes checked by the rule
+            conditions and the attributes read by the conditions themselves, e.g.
+            by attribute conditions nested in logic conditions.
+        """
+        required = set()
+        for ace_name in ("subject", "resource", "action", "context"):
+            ace_conditions = getattr(self, ace_name)
+            if isinstance(ace_conditions, dict):
+                ace_conditions = [ace_conditions]
+            for _ace_conditions in ace_conditions:
+                for attribute_path, condition in _ace_conditions.items():
+                    required.add((ace_name, attribute_path))
+                    required.update(condition.required_attributes)
+        return frozenset(required)
+
     def is_satisfied(self, ctx: EvaluationContext):
         """
             Check if request satisfies all conditions
@@ -69,14 +91,70 @@ class Rules(object):
     @staticmethod
     def _implicit_and(ace_name: str, ace_conditions: dict, ctx: EvaluationContext):
         for attribute_path, condition in ace_conditions.items():
-            ctx.ace = ace_name
-            ctx.attribute_path = attribute_path
+            what = ctx.get_attribute_value(ace_name, attribute_path)
             # If even one of the conditions is not satisfied, return False
-            if not condition.is_satisfied(ctx):
+            if not condition.evaluate(what, ctx):
+                LOG.debug(
+                    "Condition on attribute value at path '%s' for element '%s' not satisfied.",
+                    attribute_path,
+                    ace_name
+                )
                 return False
         # If all conditions are satisfied, return True
         return True
 
+    def compile(self) -> Callable[[EvaluationContext], bool]:
+        """
+            Compile rules into a closure checking if request satisfies all conditions.
+            The compiled closure gives the same result as :meth:`is_satisfied`, which
+            remains the reference implementation, but avoids its per-call dispatch on
+            the rule format and condition types.
+
+            .. note:
+
+                The closure captures the conditions at time of compilation. Rules
+                modified afterwards must be compiled again.
+
+            :return: compiled closure called with the evaluation context
+        """
+        # Tuples of access control element name and its alternative condition sets.
+        # A condition set is a tuple of attribute path and condition predicate pairs.
+        checks = tuple(
+            (ace_name, self._compile_ace_conditions(ace_name, getattr(self, ace_name)))
+            for ace_name in ("subject", "resource", "action", "context")
+        )
+
+        def is_satisfied(ctx: EvaluationContext):
+            get_attribute_value = ctx.get_attribute_value
+            for ace_name, alternatives in checks:
+                for conditions in alternatives:
+                    for attribute_path, predicate in conditions:
+                        if not predicate(get_attribute_value(ace_name, attribute_path), ctx):
+                            break
+                    else:
+                        # All conditions of alternative satisfied
+                        break
+                else:
+                    # None of the alternatives satisfied
+                    return False
+            return True
+
+        return is_satisfied
+
+    @staticmethod
+    def _compile_ace_conditions(ace_name, ace_conditions):
+        """
+            Compile access control element conditions into a tuple of alternative
+            condition sets, any of which should be satisfied.
+        """
+        if isinstance(ace_conditions, dict):
+            ace_conditions = [ace_conditions]
+        return tuple(
+            tuple((attribute_path, condition.compile_for(ace_name, attribute_path))
+                  for attribute_path, condition in _ace_conditions.items())
+            for _ace_conditions in ace_conditions
+        )
+
 
 class RuleField(fields.Field):
     """
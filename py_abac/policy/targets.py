@@ -3,15 +3,27 @@
 """
 
 import fnmatch
+import os
+import re
+from typing import Callable
 
 from marshmallow import Schema, fields, post_load, validate
 
 from ..context import EvaluationContext
 
+# Characters having special meaning in target ID patterns
+_WILDCARDS = "*?["
+
 
 class Targets(object):
     """
-        Policy targets
+        Policy targets. The ID patterns of each access control element are
+        compiled into a matcher when assigned.
+
+        .. note:
+
+            ID lists modified in place are not reflected by the matchers.
+            Re-assign the IDs to compile them again.
     """
 
     def __init__(self, subject_id: list, resource_id: list, action_id: list):
@@ -19,6 +31,42 @@ class Targets(object):
         self.resource_id = resource_id
         self.action_id = action_id
 
+    @property
+    def subject_id(self):
+        """
+            Subject ID patterns
+        """
+        return self._subject_id
+
+    @subject_id.setter
+    def subject_id(self, value):
+        self._subject_id = value
+        self._subject_match = _compile_matcher(value)
+
+    @property
+    def resource_id(self):
+        """
+            Resource ID patterns
+        """
+        return self._resource_id
+
+    @resource_id.setter
+    def resource_id(self, value):
+        self._resource_id = value
+        self._resource_match = _compile_matcher(value)
+
+    @property
+    def action_id(self):
+        """
+            Action ID patterns
+        """
+        return self._action_id
+
+    @action_id.setter
+    def action_id(self, value):
+        self._action_id = value
+        self._action_match = _compile_matcher(value)
+
     def match(self, ctx: EvaluationContext):
         """
             Check if request matches policy targets
@@ -26,14 +74,15 @@ class Targets(object):
             :param ctx: policy evaluation context
             :return: True if matches else False
         """
-        return self._is_in(self.subject_id, ctx.subject_id) and \
-               self._is_in(self.resource_id, ctx.resource_id) and \
-               self._is_in(self.action_id, ctx.action_id)
+        return self._subject_match(ctx.subject_id) and \
+               self._resource_match(ctx.resource_id) and \
+               self._action_match(ctx.action_id)
 
     @staticmethod
     def _is_in(ace_ids, ace_id: str):
         """
-            Returns True if `ace_id` is in `ace_ids`.
+            Returns True if `ace_id` is in `ace_ids`. Reference implementation
+            of the compiled matchers.
         """
         _ace_ids = ace_ids if isinstance(ace_ids, list) else [ace_ids]
         for _id in _ace_ids:
@@ -42,6 +91,127 @@ class Targets(object):
                 return True
         return False
 
+    def compile(self) -> Callable[[EvaluationContext], bool]:
+        """
+            Compile targets into a closure checking if request matches policy targets.
+            The compiled closure gives the same result as :meth:`match`.
+
+            :return: compiled closure called with the evaluation context
+        """
+        subject_match = self._subject_match
+        resource_match = self._resource_match
+        action_match = self._action_match
+
+        def match(ctx: EvaluationContext):
+            return subject_match(ctx.subject_id) and \
+                   resource_match(ctx.resource_id) and \
+                   action_match(ctx.action_id)
+
+        return match
+
+
+def _compile_matcher(ace_ids) -> Callable[[str], bool]:
+    """
+        Compile ID patterns into a callable returning True if an ID matches any
+        of the patterns, as checked by :func:`fnmatch.fnmatch`. Literal IDs are
+        looked up in a set and patterns of a literal prefix or suffix with a
+        single `*` wildcard are checked using string methods, while all other
+        patterns are combined into a single regular expression.
+    """
+    _ace_ids = ace_ids if isinstance(ace_ids, list) else [ace_ids]
+    # Patterns are normalized as done by fnmatch, which is a no-op on POSIX
+    normalize = os.path.normcase("A/") != "A/"
+    if normalize:
+        _ace_ids = [os.path.normcase(_id) for _id in _ace_ids]  # pragma: no cover
+
+    exact = set()
+    prefixes = []
+    suffixes = []
+    globs = []
+    for _id in _ace_ids:
+        literal = _id.strip("*")
+        if not literal and _id:
+            # Pattern matching every ID
+            return _match_all
+        if any(char in literal for char in _WILDCARDS):
+            globs.append(_id)
+        elif literal == _id:
+            exact.add(_id)
+        elif _id.startswith("*") and _id.endswith("*"):
+            globs.append(_id)
+        elif _id.endswith("*"):
+            prefixes.append(literal)
+        else:
+            suffixes.append(literal)
+
+    checks = []
+    if exact:
+        checks.append(frozenset(exact).__contains__)
+    if prefixes:
+        checks.append(_starts_with(tuple(prefixes)))
+    if suffixes:
+        checks.append(_ends_with(tuple(suffixes)))
+    if globs:
+        regex = re.compile("|".join(fnmatch.translate(_id) for _id in globs))
+        checks.append(_regex_match(regex))
+
+    if len(checks) == 1:
+        matcher = checks[0]
+    else:
+        matcher = _any_match(tuple(checks))
+    if normalize:
+        return _normalized(matcher)  # pragma: no cover
+    return matcher
+
+
+def _match_all(_: str) -> bool:
+    """
+        Returns True for every ID
+    """
+    return True
+
+
+def _starts_with(prefixes: tuple) -> Callable[[str], bool]:
+    """
+        Get matcher of IDs starting with any of the prefixes
+    """
+    return lambda ace_id: ace_id.startswith(prefixes)
+
+
+def _ends_with(suffixes: tuple) -> Callable[[str], bool]:
+    """
+        Get matcher of IDs ending with any of the suffixes
+    """
+    return lambda ace_id: ace_id.endswith(suffixes)
+
+
+def _regex_match(regex) -> Callable[[str], bool]:
+    """
+        Get matcher of IDs matching the regular expression
+    """
+    return lambda ace_id: regex.match(ace_id) is not None
+
+
+def _any_match(checks: tuple) -> Callable[[str], bool]:
+    """
+        Get matcher of IDs matched by any of the checks
+    """
+
+    def match(ace_id: str) -> bool:
+        for check in checks:
+            if check(ace_id):
+                return True
+        return False
+
+    return match
+
+
+def _normalized(matcher: Callable[[str], bool]) -> Callable[[str], bool]:  # pragma: no cover
+    """
+        Get matcher normalizing IDs before matching
+    """
+    return lambda ace_id: matcher(os.path.normcase(ace_id))
+
 
 class TargetField(fields.Field):
     """
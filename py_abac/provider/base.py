@@ -3,7 +3,7 @@
 """
 
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..context import EvaluationContext  # pragma: no cover
@@ -14,6 +14,12 @@ class AttributeProvider(metaclass=ABCMeta):
         Attribute provider interface
     """
 
+    # Attributes served by the provider as `(access control element, attribute path
+    # prefix)` pairs, e.g. `("subject", "$.address")` serves `$.address.city` of the
+    # subject. The provider is only called for the attributes it serves. Providers
+    # serving all attributes leave it None.
+    routes = None  # type: Optional[Iterable[Tuple[str, str]]]
+
     @abstractmethod
     def get_attribute_value(self, ace: str, attribute_path: str, ctx: 'EvaluationContext'):
         """
@@ -26,3 +32,46 @@ class AttributeProvider(metaclass=ABCMeta):
             :return: attribute value
         """
         raise NotImplementedError()
+
+    def get_attribute_values(
+            self,
+            keys: List[Tuple[str, str]],
+            ctx: 'EvaluationContext'
+    ) -> Optional[Dict[Tuple[str, str], Any]]:
+        """
+            Get attribute values for a list of access control element and attribute
+            path pairs at once, e.g. in a single round trip to a backend. Called by the
+            evaluation context to prefetch the attributes needed by a request before
+            policies are evaluated. Providers not supporting bulk retrieval return None,
+            which is the default.
+
+            :param keys: list of `(access control element, attribute path)` pairs
+            :param ctx: evaluation context
+            :return: dictionary of attribute values keyed by the pairs, with attributes
+                not found left out, or None if bulk retrieval is not supported
+        """
+        # pylint: disable=no-self-use,unused-argument
+        return None
+
+
+class AsyncAttributeProvider(metaclass=ABCMeta):
+    """
+        Asynchronous attribute provider interface. Used by :class:`AsyncPDP` to
+        retrieve attribute values from services without blocking the event loop.
+    """
+
+    # Attributes served by the provider, see :attr:`AttributeProvider.routes`
+    routes = None  # type: Optional[Iterable[Tuple[str, str]]]
+
+    @abstractmethod
+    async def get_attribute_value(self, ace: str, attribute_path: str, ctx: 'EvaluationContext'):
+        """
+            Get attribute value for given access control element and attribute path. If
+            attribute not found then returns None.
+
+            :param ace: Access control element
+            :param attribute_path: attribute path in ObjectPath format
+            :param ctx: evaluation context
+            :return: attribute value
+        """
+        raise NotImplementedError()
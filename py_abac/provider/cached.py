@@ -0,0 +1,137 @@
+"""
+    Caching attribute providers
+"""
+
+from typing import Hashable, Union, TYPE_CHECKING
+
+from .base import AttributeProvider, AsyncAttributeProvider
+from ..cache import LRUCache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..context import EvaluationContext  # pragma: no cover
+
+# Cached marker of attributes not found by the provider
+_NOT_FOUND = object()
+
+
+class _CachedAttributeProviderBase(object):
+    """
+        Attribute cache of a caching attribute provider
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+            self,
+            provider: Union[AttributeProvider, AsyncAttributeProvider],
+            max_size: int = 1024,
+            ttl: float = None,
+            negative_ttl: float = None,
+            cache_misses: bool = True
+    ):
+        if negative_ttl is not None and negative_ttl <= 0:
+            raise ValueError("Cache TTL should be a positive number.")
+        self.provider = provider
+        self._cache = LRUCache(max_size, ttl)
+        self._negative_ttl = negative_ttl
+        self._cache_misses = cache_misses
+
+    @staticmethod
+    def make_key(ace: str, attribute_path: str, ctx: 'EvaluationContext') -> Hashable:
+        """
+            Get cache key of attribute value. The key is made of the access control
+            element, attribute path and identifier of the access control element
+            being evaluated. There is no identifier for the context element.
+        """
+        if ace == "subject":
+            return ace, attribute_path, ctx.subject_id
+        if ace == "resource":
+            return ace, attribute_path, ctx.resource_id
+        if ace == "action":
+            return ace, attribute_path, ctx.action_id
+        return ace, attribute_path, None
+
+    @property
+    def routes(self):
+        """
+            Attributes served by the cached provider
+        """
+        return self.provider.routes
+
+    @property
+    def stats(self) -> dict:
+        """
+            Cache statistics
+        """
+        return self._cache.stats
+
+    def clear(self):
+        """
+            Remove all attribute values from cache
+        """
+        self._cache.clear()
+
+    def _get_cached(self, key: Hashable):
+        """
+            Get cached attribute value. None is returned for attributes not in
+            cache and the not found marker for cached misses.
+        """
+        return self._cache.get(key)
+
+    def _set_cached(self, key: Hashable, value):
+        """
+            Add attribute value returned by provider to cache
+        """
+        if value is not None:
+            self._cache.set(key, value)
+        elif self._cache_misses:
+            self._cache.set(key, _NOT_FOUND, self._negative_ttl)
+
+
+class CachedAttributeProvider(_CachedAttributeProviderBase, AttributeProvider):
+    """
+        Attribute provider caching the attribute values of another provider across
+        requests. Values are cached by access control element, attribute path and
+        identifier of the access control element, see :meth:`make_key`. Attributes
+        not found by the provider are cached as well unless disabled.
+
+        :param provider: attribute provider whose values are cached
+        :param max_size: maximum number of attribute values held in cache
+        :param ttl: time-to-live of attribute values in seconds. Values never expire when None.
+        :param negative_ttl: time-to-live of attributes not found by the provider in seconds.
+            Defaults to the TTL of attribute values.
+        :param cache_misses: cache attributes not found by the provider
+    """
+
+    def get_attribute_value(self, ace: str, attribute_path: str, ctx: 'EvaluationContext'):
+        key = self.make_key(ace, attribute_path, ctx)
+        rvalue = self._get_cached(key)
+        if rvalue is None:
+            rvalue = self.provider.get_attribute_value(ace, attribute_path, ctx)
+            self._set_cached(key, rvalue)
+        elif rvalue is _NOT_FOUND:
+            rvalue = None
+        return rvalue
+
+
+class AsyncCachedAttributeProvider(_CachedAttributeProviderBase, AsyncAttributeProvider):
+    """
+        Asynchronous attribute provider caching the attribute values of another
+        asynchronous provider across requests. See :class:`CachedAttributeProvider`.
+
+        :param provider: asynchronous attribute provider whose values are cached
+        :param max_size: maximum number of attribute values held in cache
+        :param ttl: time-to-live of attribute values in seconds. Values never expire when None.
+        :param negative_ttl: time-to-live of attributes not found by the provider in seconds.
+            Defaults to the TTL of attribute values.
+        :param cache_misses: cache attributes not found by the provider
+    """
+
+    async def get_attribute_value(self, ace: str, attribute_path: str, ctx: 'EvaluationContext'):
+        key = self.make_key(ace, attribute_path, ctx)
+        rvalue = self._get_cached(key)
+        if rvalue is None:
+            rvalue = await self.provider.get_attribute_value(ace, attribute_path, ctx)
+            self._set_cached(key, rvalue)
+        elif rvalue is _NOT_FOUND:
+            rvalue = None
+        return rvalue
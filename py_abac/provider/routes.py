@@ -0,0 +1,79 @@
+"""
+    Routing table of attribute providers
+"""
+
+from typing import Dict, List, Sequence, Tuple, Union
+
+from .base import AttributeProvider, AsyncAttributeProvider
+
+Provider = Union[AttributeProvider, AsyncAttributeProvider]
+
+
+class ProviderRoutes(object):
+    """
+        Routing table dispatching attribute lookups to the providers serving them.
+        Providers declare the attributes they serve through their `routes`, see
+        :attr:`AttributeProvider.routes`. Providers without routes serve all
+        attributes. The providers of an attribute are kept in the order given so
+        that values are still taken from the first provider having them. Lookups
+        are memoized per access control element and attribute path, so the table
+        should be created once and shared by the evaluation contexts of requests.
+
+        :param providers: list of attribute providers
+    """
+
+    def __init__(self, providers: Sequence[Provider] = None):
+        self._providers = list(providers or [])
+        # Indices of providers serving all attributes
+        self._catch_all = []
+        # Indices of providers keyed by access control element and path prefix
+        self._table = {}  # type: Dict[Tuple[str, str], List[int]]
+        for idx, provider in enumerate(self._providers):
+            if provider.routes is None:
+                self._catch_all.append(idx)
+                continue
+            for ace, path_prefix in provider.routes:
+                self._table.setdefault((ace, path_prefix), []).append(idx)
+        # Memoized providers keyed by access control element and attribute path
+        self._lookups = {}  # type: Dict[Tuple[str, str], Tuple[Provider, ...]]
+
+    @property
+    def providers(self) -> List[Provider]:
+        """
+            All attribute providers in order
+        """
+        return self._providers
+
+    def get_providers(self, ace: str, attribute_path: str) -> Tuple[Provider, ...]:
+        """
+            Get providers serving attribute in order
+
+            :param ace: access control element
+            :param attribute_path: attribute path in ObjectPath format
+            :return: tuple of attribute providers
+        """
+        key = (ace, attribute_path)
+        try:
+            return self._lookups[key]
+        except KeyError:
+            pass
+        if self._table:
+            indices = set(self._catch_all)
+            for path_prefix in _get_path_prefixes(attribute_path):
+                indices.update(self._table.get((ace, path_prefix), ()))
+            providers = tuple(self._providers[idx] for idx in sorted(indices))
+        else:
+            providers = tuple(self._providers)
+        self._lookups[key] = providers
+        return providers
+
+
+def _get_path_prefixes(attribute_path: str) -> List[str]:
+    """
+        Get prefixes of attribute path ending at member or index access, e.g.
+        `$`, `$.address` and `$.address.city` for path `$.address.city`.
+    """
+    prefixes = [attribute_path[:idx] for idx, char in enumerate(attribute_path)
+                if idx and char in ".["]
+    prefixes.append(attribute_path)
+    return prefixes
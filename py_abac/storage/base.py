@@ -3,7 +3,7 @@
 """
 
 from abc import ABCMeta, abstractmethod
-from typing import Generator, Union
+from typing import AsyncGenerator, Generator, Union
 
 from ..policy import Policy
 
@@ -47,6 +47,25 @@ class Storage(metaclass=ABCMeta):
         # TODO: Add policy retrieval caching
         raise NotImplementedError()
 
+    def get_for_target_by_priority(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> Generator[Policy, None, None]:
+        """
+            Get all policies for given target IDs in descending order of priority.
+
+            .. note:
+
+                The default implementation retrieves all policies returned by
+                `get_for_target` and sorts them. Storages which are able to stream
+                policies already sorted by priority should override this method.
+        """
+        policies = self.get_for_target(subject_id, resource_id, action_id)
+        for policy in sorted(policies, key=lambda x: x.priority, reverse=True):
+            yield policy
+
     @abstractmethod
     def update(self, policy: Policy):
         """
@@ -67,3 +86,80 @@ class Storage(metaclass=ABCMeta):
             raise ValueError("Limit can't be negative")
         if offset < 0:
             raise ValueError("Offset can't be negative")
+
+
+class AsyncStorage(metaclass=ABCMeta):
+    """
+        Base class for asynchronous policy storage
+    """
+
+    @abstractmethod
+    async def add(self, policy: Policy):
+        """
+            Store a policy
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get(self, uid: str) -> Union[Policy, None]:
+        """
+            Get specific policy
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_all(self, limit: int, offset: int) -> AsyncGenerator[Policy, None]:
+        """
+            Retrieve all the policies within a window
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_for_target(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> AsyncGenerator[Policy, None]:
+        """
+            Get all policies for given target IDs.
+        """
+        raise NotImplementedError()
+
+    async def get_for_target_by_priority(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> AsyncGenerator[Policy, None]:
+        """
+            Get all policies for given target IDs in descending order of priority.
+
+            .. note:
+
+                The default implementation retrieves all policies returned by
+                `get_for_target` and sorts them. Storages which are able to stream
+                policies already sorted by priority should override this method.
+        """
+        policies = self.get_for_target(subject_id, resource_id, action_id)
+        policies = [policy async for policy in policies]
+        for policy in sorted(policies, key=lambda x: x.priority, reverse=True):
+            yield policy
+
+    @abstractmethod
+    async def update(self, policy: Policy):
+        """
+            Update a policy
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete(self, uid: str):
+        """
+            Delete a policy
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _check_limit_and_offset(limit: int, offset: int):
+        Storage._check_limit_and_offset(limit, offset)  # pylint: disable=protected-access
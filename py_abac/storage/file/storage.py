@@ -9,6 +9,7 @@ from itertools import islice
 from typing import Union, Generator
 
 from ..base import Storage
+from ...cache import PolicyCache
 from ...exceptions import PolicyExistsError
 from ...policy import Policy
 
@@ -29,11 +30,14 @@ class FileStorage(Storage):
 
         :param storage_dir: path to directory where storage files
             are to be saved.
+        :param policy_cache: optional cache of decoded policies used when
+            retrieving policies for target IDs.
     """
     # Policy storage file name
     POLICY_FILE = "policies"
 
-    def __init__(self, storage_dir: str):
+    def __init__(self, storage_dir: str, policy_cache: PolicyCache = None):
+        self.policy_cache = policy_cache
         # Create path directory if not exists
         os.makedirs(storage_dir, exist_ok=True)
         self._file = "{}/{}".format(os.path.abspath(storage_dir), self.POLICY_FILE)
@@ -85,12 +89,17 @@ class FileStorage(Storage):
 
             .. note:
 
-                Currently all policies are returned for evaluation.
+                Currently all policies are returned for evaluation. Their
+                rules are decoded lazily, i.e. only for policies whose
+                targets match the request.
         """
         # TODO: Create glob match based topologically sorted graph index for filtering
         with shelve.open(self._file, flag="r") as curr:
             for policy_json in curr.values():
-                yield Policy.from_json(policy_json)
+                if self.policy_cache is not None:
+                    yield self.policy_cache.get_policy(policy_json, lazy=True)
+                else:
+                    yield Policy.from_json(policy_json, lazy=True)
 
     def update(self, policy: Policy):
         """
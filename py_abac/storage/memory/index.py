@@ -0,0 +1,266 @@
+"""
+    Target ID pattern index for in-memory storage
+"""
+
+import os
+from fnmatch import fnmatchcase
+from typing import Iterable, Set, Union
+
+from ...policy import Policy
+
+# Characters with special meaning in Unix shell-style wildcards
+_SPECIAL_CHARS = frozenset("*?[")
+
+
+def _has_special_chars(pattern: str) -> bool:
+    """
+        Check if pattern contains characters with special meaning
+    """
+    return not _SPECIAL_CHARS.isdisjoint(pattern)
+
+
+class _TrieNode(object):
+    """
+        Node of a character trie
+    """
+    __slots__ = ("children", "uids")
+
+    def __init__(self):
+        self.children = {}
+        self.uids = set()
+
+
+class _Trie(object):
+    """
+        Character trie of policy UIDs keyed by string
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def add(self, key: str, uid: str):
+        """
+            Add policy UID for key
+        """
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.uids.add(uid)
+
+    def remove(self, key: str, uid: str):
+        """
+            Remove policy UID for key. Nodes left empty are pruned.
+        """
+        path = [self._root]
+        for char in key:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].uids.discard(uid)
+        # Prune empty nodes bottom up
+        for idx in range(len(key), 0, -1):
+            node = path[idx]
+            if node.uids or node.children:
+                break
+            del path[idx - 1].children[key[idx - 1]]
+
+    def match_prefixes(self, value: str, result: Set[str]):
+        """
+            Add to result the UIDs of all keys which are prefixes of value
+        """
+        node = self._root
+        result.update(node.uids)
+        for char in value:
+            node = node.children.get(char)
+            if node is None:
+                return
+            result.update(node.uids)
+
+
+class PatternIndex(object):
+    """
+        Index of policy UIDs by the target ID patterns of an access control
+        element. Patterns are Unix shell-style wildcards as matched by
+        :func:`fnmatch.fnmatch`. They are indexed as follows:
+
+            - Exact IDs without wildcards in a hash map.
+            - Catch-all patterns, e.g. `*`, in a separate bucket.
+            - Prefix patterns, e.g. `abc*`, in a trie.
+            - Suffix patterns, e.g. `*abc`, in a trie of reversed suffixes.
+            - Other patterns in a map from pattern to UIDs which are matched
+              one by one.
+    """
+
+    def __init__(self):
+        self._exact = {}
+        self._any = set()
+        self._prefixes = _Trie()
+        self._suffixes = _Trie()
+        self._globs = {}
+
+    def add(self, uid: str, patterns: Iterable[str]):
+        """
+            Add policy UID for the given target ID patterns
+        """
+        for pattern in patterns:
+            kind, key = self._classify(pattern)
+            if kind == "exact":
+                self._exact.setdefault(key, set()).add(uid)
+            elif kind == "any":
+                self._any.add(uid)
+            elif kind == "prefix":
+                self._prefixes.add(key, uid)
+            elif kind == "suffix":
+                self._suffixes.add(key[::-1], uid)
+            else:
+                self._globs.setdefault(key, set()).add(uid)
+
+    def remove(self, uid: str, patterns: Iterable[str]):
+        """
+            Remove policy UID for the given target ID patterns
+        """
+        for pattern in patterns:
+            kind, key = self._classify(pattern)
+            if kind == "exact":
+                self._discard(self._exact, key, uid)
+            elif kind == "any":
+                self._any.discard(uid)
+            elif kind == "prefix":
+                self._prefixes.remove(key, uid)
+            elif kind == "suffix":
+                self._suffixes.remove(key[::-1], uid)
+            else:
+                self._discard(self._globs, key, uid)
+
+    def match(self, ace_id: str) -> Set[str]:
+        """
+            Get UIDs of policies having a target ID pattern which matches the ID
+        """
+        ace_id = os.path.normcase(ace_id)
+        result = set(self._any)
+        result.update(self._exact.get(ace_id, ()))
+        self._prefixes.match_prefixes(ace_id, result)
+        self._suffixes.match_prefixes(ace_id[::-1], result)
+        for pattern, uids in list(self._globs.items()):
+            if fnmatchcase(ace_id, pattern):
+                result.update(uids)
+        return result
+
+    @staticmethod
+    def is_catch_all(pattern: str) -> bool:
+        """
+            Check if pattern matches every ID
+        """
+        return bool(pattern) and not pattern.strip("*")
+
+    @staticmethod
+    def _classify(pattern: str):
+        """
+            Get kind of pattern and the key by which it is indexed
+        """
+        pattern = os.path.normcase(pattern)
+        if not _has_special_chars(pattern):
+            return "exact", pattern
+        prefix = pattern.rstrip("*")
+        if not prefix:
+            return "any", pattern
+        if not _has_special_chars(prefix):
+            return "prefix", prefix
+        suffix = pattern.lstrip("*")
+        if not _has_special_chars(suffix):
+            return "suffix", suffix
+        return "glob", pattern
+
+    @staticmethod
+    def _discard(buckets: dict, key: str, uid: str):
+        """
+            Remove UID from bucket of key. Buckets left empty are deleted.
+        """
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.discard(uid)
+            if not bucket:
+                del buckets[key]
+
+
+class TargetIndex(object):
+    """
+        Index of policy UIDs by the subject, resource and action ID patterns
+        of their targets.
+
+        Policies are grouped by the target elements having a catch-all pattern,
+        e.g. all policies with only a `*` subject ID form one group. The patterns
+        of the other elements are indexed by a :class:`PatternIndex` per element.
+        A policy of a group matches the target IDs if it is matched by the
+        pattern indices of all elements of the group not having a catch-all pattern.
+        Thus the common catch-all patterns do not have to be matched.
+    """
+
+    def __init__(self):
+        self._indices = (PatternIndex(), PatternIndex(), PatternIndex())
+        # Policy UIDs grouped by bit mask of the elements having a catch-all pattern
+        self._groups = {}
+        # Target ID patterns and group mask of indexed policies. The patterns at time of
+        # indexing are used for removal as the policy could have been modified since.
+        self._patterns = {}
+
+    def add(self, policy: Policy):
+        """
+            Add policy to index
+        """
+        targets = policy.targets
+        patterns = (
+            self._as_tuple(targets.subject_id),
+            self._as_tuple(targets.resource_id),
+            self._as_tuple(targets.action_id)
+        )
+        mask = 0
+        for idx, _patterns in enumerate(patterns):
+            if any(PatternIndex.is_catch_all(pattern) for pattern in _patterns):
+                mask |= 1 << idx
+            else:
+                self._indices[idx].add(policy.uid, _patterns)
+        self._groups.setdefault(mask, set()).add(policy.uid)
+        self._patterns[policy.uid] = (patterns, mask)
+
+    def remove(self, uid: str):
+        """
+            Remove policy from index
+        """
+        patterns, mask = self._patterns.pop(uid)
+        for idx, _patterns in enumerate(patterns):
+            if not mask & (1 << idx):
+                self._indices[idx].remove(uid, _patterns)
+        group = self._groups[mask]
+        group.discard(uid)
+        if not group:
+            del self._groups[mask]
+
+    def match(self, subject_id: str, resource_id: str, action_id: str) -> Set[str]:
+        """
+            Get UIDs of policies whose targets match the given target IDs
+        """
+        ace_ids = (subject_id, resource_id, action_id)
+        # Policy UIDs matched by the pattern index of each element computed on demand
+        matched = [None, None, None]
+        result = set()
+        for mask, group in list(self._groups.items()):
+            uids = group
+            for idx in range(3):
+                if mask & (1 << idx):
+                    continue
+                if matched[idx] is None:
+                    matched[idx] = self._indices[idx].match(ace_ids[idx])
+                uids = uids & matched[idx]
+                if not uids:
+                    break
+            result.update(uids)
+        return result
+
+    @staticmethod
+    def _as_tuple(ace_ids: Union[str, list]) -> tuple:
+        """
+            Get tuple of target ID patterns
+        """
+        return tuple(ace_ids) if isinstance(ace_ids, list) else (ace_ids,)
@@ -3,9 +3,11 @@
 """
 
 import logging
-from itertools import islice
+from heapq import heapify, heappop
+from itertools import count, islice
 from typing import Generator, Union
 
+from .index import TargetIndex
 from ..base import Storage
 from ...exceptions import PolicyExistsError
 from ...policy import Policy
@@ -20,6 +22,14 @@ class MemoryStorage(Storage):
 
     def __init__(self):
         self._index_map = {}
+        # Index of policy UIDs by target ID patterns
+        self._target_index = TargetIndex()
+        # Sequence numbers of policies in order of addition, and sort keys of
+        # policies for retrieval in descending order of priority. Policies of
+        # equal priority are retrieved in order of addition or last update.
+        self._counter = count()
+        self._sequence_map = {}
+        self._priority_map = {}
 
     def add(self, policy: Policy):
         """
@@ -29,6 +39,8 @@ class MemoryStorage(Storage):
         if policy.uid in self._index_map:
             raise PolicyExistsError(policy.uid)
         self._index_map[policy.uid] = policy
+        self._sequence_map[policy.uid] = next(self._counter)
+        self._add_to_indices(policy)
         LOG.info('Added Policy: %s', policy)
 
     def get(self, uid: str) -> Union[Policy, None]:
@@ -55,15 +67,39 @@ class MemoryStorage(Storage):
     ) -> Generator[Policy, None, None]:
         """
             Get all policies for given target IDs.
+        """
+        sequence_map = self._sequence_map
+        uids = sorted(
+            self._target_index.match(subject_id, resource_id, action_id),
+            key=lambda uid: sequence_map.get(uid, -1)
+        )
+        for uid in uids:
+            # Policies may be deleted between iterations
+            policy = self._index_map.get(uid, None)
+            if policy is not None:
+                yield policy
 
-            .. note:
-
-                Currently all policies are returned for evaluation. This issue will
-                be resolved once indexing is supported for in-memory storage.
+    def get_for_target_by_priority(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> Generator[Policy, None, None]:
         """
-        # TODO: Create glob match based topologically sorted graph index for filtering
-        for policy in self._index_map.values():
-            yield policy
+            Get all policies for given target IDs in descending order of priority.
+        """
+        # Heap of sort keys is popped lazily as the PDP may stop the iteration early
+        priority_map = self._priority_map
+        heap = [
+            priority_map.get(uid, (0, -1)) + (uid,)
+            for uid in self._target_index.match(subject_id, resource_id, action_id)
+        ]
+        heapify(heap)
+        while heap:
+            uid = heappop(heap)[-1]
+            policy = self._index_map.get(uid, None)
+            if policy is not None:
+                yield policy
 
     def update(self, policy: Policy):
         """
@@ -71,7 +107,9 @@ class MemoryStorage(Storage):
         """
         if policy.uid not in self._index_map:
             raise ValueError("Policy with UID='{}' does not exist.".format(policy.uid))
+        self._remove_from_indices(policy.uid)
         self._index_map[policy.uid] = policy
+        self._add_to_indices(policy)
         LOG.info('Updated Policy with UID=%s. New value is: %s', policy.uid, policy)
 
     def delete(self, uid: str):
@@ -82,4 +120,22 @@ class MemoryStorage(Storage):
             raise ValueError("Policy with UID='{}' does not exist.".format(uid))
         # Remove policy from index map
         del self._index_map[uid]
+        del self._sequence_map[uid]
+        self._remove_from_indices(uid)
         LOG.info('Deleted Policy with UID=%s.', uid)
+
+    def _add_to_indices(self, policy: Policy):
+        """
+            Add policy to target index and priority map
+        """
+        self._target_index.add(policy)
+        self._priority_map[policy.uid] = (-policy.priority, next(self._counter))
+
+    def _remove_from_indices(self, uid: str):
+        """
+            Remove policy from target index and priority map. The targets and
+            priority at time of storage are used as the policy object could have
+            been modified since.
+        """
+        self._target_index.remove(uid)
+        del self._priority_map[uid]
@@ -2,8 +2,11 @@
     MongoDB migrations
 """
 
+import json
 import logging
 
+from pymongo import DESCENDING
+
 from .storage import MongoStorage
 from ..migration import Migration, MigrationSet
 
@@ -26,6 +29,7 @@ class MongoMigrationSet(MigrationSet):
     def migrations(self):
         return [
             MongoMigration0To0x2x0(self.storage),
+            MongoMigration0x2x0To0x5x0(self.storage),
         ]
 
     def save_applied_number(self, number: int):
@@ -63,3 +67,30 @@ class MongoMigration0To0x2x0(Migration):
     def down(self):
         for field in self.multi_key_indices:
             self.storage.collection.drop_index(self.index_name(field))
+
+
+class MongoMigration0x2x0To0x5x0(Migration):
+    """
+        Migration between versions 0.2.0 and 0.5.0. Adds the indexed priority
+        field used for retrieving policies in order of priority.
+    """
+
+    def __init__(self, storage: MongoStorage):
+        self.storage = storage
+        self.index_name = 'priority_idx'
+
+    @property
+    def order(self):
+        return 2
+
+    def up(self):
+        cur = self.storage.collection.find({"priority": {"$exists": False}})
+        for doc in cur:
+            priority = json.loads(doc["policy_str"]).get("priority", 0)
+            self.storage.collection.update_one({"_id": doc["_id"]}, {"$set": {"priority": priority}})
+        # Index allows streaming of policies sorted by priority instead of an in-memory sort
+        self.storage.collection.create_index([("priority", DESCENDING)], name=self.index_name)
+
+    def down(self):
+        self.storage.collection.drop_index(self.index_name)
+        self.storage.collection.update_many({}, {"$unset": {"priority": ""}})
@@ -5,6 +5,7 @@
 import json
 
 from ..utils import get_sub_wildcard_queries, get_all_wildcard_queries
+from ...cache import PolicyCache
 from ...policy import Policy
 from ...policy.targets import Targets
 
@@ -16,12 +17,14 @@ class PolicyModel:
         :param _id: document ID
         :param policy_str: policy JSON string
         :param tags: tags for target based filtering
+        :param priority: policy priority used for ordering policies
     """
 
-    def __init__(self, _id: str, policy_str: str, tags: dict = None):
+    def __init__(self, _id: str, policy_str: str, tags: dict = None, priority: int = 0):
         self._id = _id
         self.policy_str = policy_str
         self.tags = tags
+        self.priority = priority
 
     @classmethod
     def from_policy(cls, policy: Policy):
@@ -30,14 +33,19 @@ class PolicyModel:
         """
         policy_str = json.dumps(policy.to_json())
         tags = cls._targets_to_tags(policy.targets)
-        return cls(policy.uid, policy_str, tags)
+        return cls(policy.uid, policy_str, tags, policy.priority)
 
-    def to_policy(self):
+    def to_policy(self, cache: PolicyCache = None, lazy: bool = False):
         """
             Get policy object
+
+            :param cache: optional cache of decoded policies
+            :param lazy: if True, the policy rules are decoded on first access
         """
+        if cache is not None:
+            return cache.get_policy(self.policy_str, lazy)
         policy_json = json.loads(self.policy_str)
-        return Policy.from_json(policy_json)
+        return Policy.from_json(policy_json, lazy)
 
     @classmethod
     def from_doc(cls, data):
@@ -53,9 +61,15 @@ class PolicyModel:
         return self.__dict__
 
     @staticmethod
-    def get_aggregate_pipeline(subject_id: str, resource_id: str, action_id: str):
+    def get_aggregate_pipeline(
+            subject_id: str,
+            resource_id: str,
+            action_id: str,
+            sort_by_priority: bool = False
+    ):
         """
-            Get query using target ids to retrieve policies
+            Get query using target ids to retrieve policies. The policies are
+            sorted in descending order of priority when `sort_by_priority` is set.
         """
         # Compute all wildcard queries from target IDs
         subject_wildcard_queries = get_all_wildcard_queries(subject_id)
@@ -79,6 +93,10 @@ class PolicyModel:
                 "tags.action.id": {"$not": {"$elemMatch": {"$nin": action_wildcard_queries}}}
             }
         }
+        if sort_by_priority:
+            # Stage 3 sorts filtered policies in descending order of priority
+            stage_3 = {"$sort": {"priority": -1}}
+            return [stage_1, stage_2, stage_3]
         return [stage_1, stage_2]
 
     @staticmethod
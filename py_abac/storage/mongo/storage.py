@@ -10,6 +10,7 @@ from pymongo.errors import DuplicateKeyError
 
 from .model import PolicyModel
 from ..base import Storage
+from ...cache import PolicyCache
 from ...exceptions import PolicyExistsError
 from ...policy import Policy
 
@@ -26,15 +27,19 @@ class MongoStorage(Storage):
         :param client: mongodb client
         :param db_name: database to use for storing policies
         :param collection: collection to use for storing policies
+        :param policy_cache: optional cache of decoded policies used when
+            retrieving policies for target IDs
     """
 
     def __init__(
             self,
             client: MongoClient,
             db_name: str = DEFAULT_DB,
-            collection: str = DEFAULT_COLLECTION
+            collection: str = DEFAULT_COLLECTION,
+            policy_cache: PolicyCache = None
     ):
         self.client = client
+        self.policy_cache = policy_cache
         self.database = self.client[db_name]
         self.collection = self.database[collection]
 
@@ -67,7 +72,20 @@ class MongoStorage(Storage):
         pipeline = PolicyModel.get_aggregate_pipeline(subject_id, resource_id, action_id)
         cur = self.collection.aggregate(pipeline)
         for doc in cur:
-            yield PolicyModel.from_doc(doc).to_policy()
+            yield PolicyModel.from_doc(doc).to_policy(self.policy_cache, lazy=True)
+
+    def get_for_target_by_priority(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> Generator[Policy, None, None]:
+        pipeline = PolicyModel.get_aggregate_pipeline(
+            subject_id, resource_id, action_id, sort_by_priority=True
+        )
+        cur = self.collection.aggregate(pipeline)
+        for doc in cur:
+            yield PolicyModel.from_doc(doc).to_policy(self.policy_cache, lazy=True)
 
     def update(self, policy: Policy):
         uid = policy.uid
@@ -2,4 +2,6 @@
     Exposed classes and methods
 """
 
+from .async_storage import AsyncRedisStorage
+from .migrations import RedisMigrationSet
 from .storage import RedisStorage
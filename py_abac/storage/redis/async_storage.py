@@ -0,0 +1,121 @@
+"""
+    Asynchronous Redis policy storage
+"""
+
+import logging
+from itertools import islice
+from typing import AsyncGenerator, Union, TYPE_CHECKING
+
+from .index import ADD_POLICY_SCRIPT, UPDATE_POLICY_SCRIPT, DELETE_POLICY_SCRIPT
+from .index import GET_FOR_TARGET_SCRIPT
+from .index import get_index_key, get_index_entries, get_target_query, to_policy, to_policy_str
+from .storage import DEFAULT_HASH_KEY
+from ..base import AsyncStorage
+from ...cache import PolicyCache
+from ...exceptions import PolicyExistsError
+from ...policy import Policy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from redis.asyncio import Redis  # pragma: no cover
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncRedisStorage(AsyncStorage):
+    """
+        Asynchronous Redis policy storage backend. Requires the asyncio client
+        of the :code:`redis` package version 4.2 or above.
+
+        :param client: asyncio redis client.
+        :param hash_key: hash key under which policies are
+            stored in database.
+        :param policy_cache: optional cache of decoded policies used when
+            retrieving policies for target IDs.
+    """
+
+    def __init__(self, client: 'Redis', hash_key: str = None, policy_cache: PolicyCache = None):
+        self.client = client
+        self._hash = hash_key or DEFAULT_HASH_KEY
+        self.policy_cache = policy_cache
+        self._add_policy = self.client.register_script(ADD_POLICY_SCRIPT)
+        # The lua script is used to make sure an update operation occurs instead of upsert
+        self._update_policy = self.client.register_script(UPDATE_POLICY_SCRIPT)
+        self._delete_policy = self.client.register_script(DELETE_POLICY_SCRIPT)
+        self._get_for_target = self.client.register_script(GET_FOR_TARGET_SCRIPT)
+
+    async def add(self, policy: Policy):
+        """
+            Store a policy
+        """
+        rvalue = await self._add_policy(
+            keys=[self._hash, get_index_key(self._hash, policy.uid)],
+            args=[policy.uid, to_policy_str(policy)] + get_index_entries(self._hash, policy)
+        )
+        if rvalue == 0:
+            LOG.error('Error trying to create already existing policy with UID=%s.', policy.uid)
+            raise PolicyExistsError(policy.uid)
+        LOG.info('Added Policy: %s', policy)
+
+    async def get(self, uid: str) -> Union[Policy, None]:
+        """
+            Get specific policy
+        """
+        policy_str = await self.client.hget(self._hash, uid)
+        if not policy_str:
+            return None
+        return to_policy(policy_str)
+
+    async def get_all(self, limit: int, offset: int) -> AsyncGenerator[Policy, None]:
+        """
+            Retrieve all the policies within a window
+
+            .. note:
+
+                Redis doesn't guarantee the exact number of elements returned
+                thus this method gets all policies from Redis and manually
+                slices the list.
+        """
+        self._check_limit_and_offset(limit, offset)
+        rvalue = await self.client.hgetall(self._hash)
+        policies = islice(rvalue.values(), offset, offset + limit)
+        for policy_str in policies:
+            yield to_policy(policy_str)
+
+    async def get_for_target(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> AsyncGenerator[Policy, None]:
+        """
+            Get all policies for given target IDs. The policies are filtered
+            on the server using the target index.
+        """
+        rvalue = await self._get_for_target(
+            keys=[self._hash],
+            args=get_target_query(self._hash, subject_id, resource_id, action_id)
+        )
+        for policy_str in rvalue:
+            yield to_policy(policy_str, self.policy_cache, lazy=True)
+
+    async def update(self, policy: Policy):
+        """
+            Update a policy
+        """
+        uid = policy.uid
+        rvalue = await self._update_policy(
+            keys=[self._hash, get_index_key(self._hash, uid)],
+            args=[uid, to_policy_str(policy)] + get_index_entries(self._hash, policy)
+        )
+        if rvalue is not None:
+            LOG.info('Updated Policy with UID=%s. New value is: %s', uid, policy)
+
+    async def delete(self, uid: str):
+        """
+            Delete a policy
+        """
+        rvalue = await self._delete_policy(
+            keys=[self._hash, get_index_key(self._hash, uid)], args=[uid]
+        )
+        if rvalue != 0:
+            LOG.info('Deleted Policy with UID=%s.', uid)
@@ -0,0 +1,208 @@
+"""
+    Redis target index of policies
+
+    The target ID patterns of a policy are split into wildcard sub-queries, see
+    :func:`py_abac.storage.utils.get_sub_wildcard_queries`, which are used as tags.
+    For each tag a set keyed by the access control element and tag stores the
+    policies having the tag. The set members are of the form
+    `<pattern index>:<number of tags of pattern>:<policy UID>`. Policies matching
+    target IDs are then retrieved by a Lua script which looks up the sets of all
+    wildcard queries matching the IDs, see :func:`py_abac.storage.utils.get_all_wildcard_queries`,
+    and selects the policies for which all tags of a pattern are found for each
+    access control element. The index entries of a policy are kept in a list
+    keyed by the policy UID so that they can be removed on update or delete.
+"""
+
+import json
+import re
+from typing import List, Tuple
+
+from ..utils import get_sub_wildcard_queries, get_all_wildcard_queries
+from ...cache import PolicyCache
+from ...policy import Policy
+
+ACE_NAMES = ("subject", "resource", "action")
+
+# Lua functions used by the scripts to maintain the index entries of a policy
+_LUA_INDEX_FUNCTIONS = """
+    local function unindex(index_key)
+        local entries = redis.call('LRANGE', index_key, 0, -1)
+        for i = 1, #entries, 2 do
+            redis.call('SREM', entries[i], entries[i + 1])
+        end
+        redis.call('DEL', index_key)
+    end
+
+    local function index(index_key, first)
+        for i = first, #ARGV, 2 do
+            redis.call('SADD', ARGV[i], ARGV[i + 1])
+            redis.call('RPUSH', index_key, ARGV[i], ARGV[i + 1])
+        end
+    end
+"""
+
+# Add policy and its index entries if the policy does not exist.
+# KEYS: policies hash, policy index list. ARGV: UID, policy string, index entries.
+ADD_POLICY_SCRIPT = _LUA_INDEX_FUNCTIONS + """
+    if redis.call('HSETNX', KEYS[1], ARGV[1], ARGV[2]) == 0 then
+        return 0
+    end
+    index(KEYS[2], 3)
+    return 1
+"""
+
+# Update policy and its index entries if the policy exists. Used to make
+# sure an update operation occurs instead of upsert.
+# KEYS: policies hash, policy index list. ARGV: UID, policy string, index entries.
+UPDATE_POLICY_SCRIPT = _LUA_INDEX_FUNCTIONS + """
+    if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+        return nil
+    end
+    unindex(KEYS[2])
+    local rvalue = redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+    index(KEYS[2], 3)
+    return rvalue
+"""
+
+# Delete policy along with its index entries.
+# KEYS: policies hash, policy index list. ARGV: UID.
+DELETE_POLICY_SCRIPT = _LUA_INDEX_FUNCTIONS + """
+    unindex(KEYS[2])
+    return redis.call('HDEL', KEYS[1], ARGV[1])
+"""
+
+# Replace the index entries of a policy. Used by migrations.
+# KEYS: policy index list. ARGV: index entries.
+INDEX_POLICY_SCRIPT = _LUA_INDEX_FUNCTIONS + """
+    unindex(KEYS[1])
+    index(KEYS[1], 1)
+"""
+
+# Remove the index entries of a policy. Used by migrations.
+# KEYS: policy index list.
+UNINDEX_POLICY_SCRIPT = _LUA_INDEX_FUNCTIONS + """
+    unindex(KEYS[1])
+"""
+
+# Get policies matching target IDs.
+# KEYS: policies hash. ARGV: number of wildcard query set keys for subject,
+# resource and action IDs followed by the keys.
+GET_FOR_TARGET_SCRIPT = """
+    local function match(first, count)
+        local hits = {}
+        local uids = {}
+        for i = first, first + count - 1 do
+            for _, member in ipairs(redis.call('SMEMBERS', ARGV[i])) do
+                local num_tags, uid = string.match(member, '^%d+:(%d+):(.*)$')
+                local hit = (hits[member] or 0) + 1
+                hits[member] = hit
+                if hit == tonumber(num_tags) then
+                    uids[uid] = true
+                end
+            end
+        end
+        return uids
+    end
+
+    local matched = {}
+    local first = 4
+    for i = 1, 3 do
+        local count = tonumber(ARGV[i])
+        matched[i] = match(first, count)
+        first = first + count
+    end
+
+    local result = {}
+    for uid in pairs(matched[1]) do
+        if matched[2][uid] and matched[3][uid] then
+            local policy_str = redis.call('HGET', KEYS[1], uid)
+            if policy_str then
+                table.insert(result, policy_str)
+            end
+        end
+    end
+    return result
+"""
+
+
+def get_index_key(hash_key: str, uid: str) -> str:
+    """
+        Get key of the list storing index entries of a policy
+    """
+    return "{}:index:{}".format(hash_key, uid)
+
+
+def get_tag_key(hash_key: str, ace_name: str, tag: str) -> str:
+    """
+        Get key of the set storing policies with tag for an access control element
+    """
+    return "{}:{}:{}".format(hash_key, ace_name, tag)
+
+
+def get_index_entries(hash_key: str, policy: Policy) -> List[str]:
+    """
+        Get flat list of tag set keys and members indexing the policy targets
+    """
+    entries = []
+    for ace_name in ACE_NAMES:
+        patterns = getattr(policy.targets, "{}_id".format(ace_name))
+        patterns = patterns if isinstance(patterns, list) else [patterns]
+        for idx, pattern in enumerate(patterns):
+            tags = _pattern_to_tags(pattern)
+            for tag in tags:
+                entries.append(get_tag_key(hash_key, ace_name, tag))
+                entries.append("{}:{}:{}".format(idx, len(tags), policy.uid))
+    return entries
+
+
+def get_target_query(
+        hash_key: str,
+        subject_id: str,
+        resource_id: str,
+        action_id: str
+) -> List[str]:
+    """
+        Get arguments of the script retrieving policies for target IDs
+    """
+    counts = []
+    keys = []
+    for ace_name, ace_id in zip(ACE_NAMES, (subject_id, resource_id, action_id)):
+        queries = get_all_wildcard_queries(ace_id)
+        counts.append(len(queries))
+        keys.extend(get_tag_key(hash_key, ace_name, query) for query in queries)
+    return counts + keys
+
+
+def to_policy(policy_str: bytes, cache: PolicyCache = None, lazy: bool = False) -> Policy:
+    """
+        Converts stored policy string to policy object.
+
+        :param policy_str: stored policy string
+        :param cache: optional cache of decoded policies
+        :param lazy: if True, the policy rules are decoded on first access
+    """
+    if cache is not None:
+        return cache.get_policy(policy_str, lazy)
+    policy_json = json.loads(policy_str.decode("utf-8"))
+    return Policy.from_json(policy_json, lazy)
+
+
+def to_policy_str(policy: Policy) -> str:
+    """
+        Converts policy object to string for storage on Redis.
+    """
+    policy_json = policy.to_json()
+    return json.dumps(policy_json)
+
+
+def _pattern_to_tags(pattern: str) -> Tuple[str, ...]:
+    """
+        Get distinct tags of a target ID pattern. Patterns with wildcards other
+        than `*` are tagged as `*` so that they are matched by every ID and left
+        to be filtered by the PDP.
+    """
+    if "?" in pattern or "[" in pattern:
+        return ("*",)
+    # Consecutive wildcards are collapsed as they are never generated by wildcard queries
+    pattern = re.sub(r"\*\*+", "*", pattern)
+    return tuple(dict.fromkeys(get_sub_wildcard_queries(pattern)))
@@ -0,0 +1,69 @@
+"""
+    Redis migrations
+"""
+
+import logging
+
+from .index import INDEX_POLICY_SCRIPT, UNINDEX_POLICY_SCRIPT
+from .index import get_index_key, get_index_entries, to_policy
+from .storage import RedisStorage
+from ..migration import Migration, MigrationSet
+
+DEFAULT_MIGRATION_KEY = "py_abac_migrations"
+
+LOG = logging.getLogger(__name__)
+
+
+class RedisMigrationSet(MigrationSet):
+    """
+        Migrations Collection for RedisStorage. The number of the last applied
+        migration is stored in a hash keyed by the policies hash key of the storage.
+    """
+
+    def __init__(self, storage: RedisStorage, key: str = DEFAULT_MIGRATION_KEY):
+        self.storage = storage
+        self.key = key
+
+    def migrations(self):
+        return [
+            RedisMigration0x4x0To0x5x0(self.storage),
+        ]
+
+    def save_applied_number(self, number: int):
+        self.storage.client.hset(self.key, self.storage.hash_key, number)
+
+    def last_applied(self):
+        data = self.storage.client.hget(self.key, self.storage.hash_key)
+        if data:
+            return int(data)
+        return 0
+
+
+class RedisMigration0x4x0To0x5x0(Migration):
+    """
+        Migration between versions 0.4.0 and 0.5.0. Builds the target index
+        used for retrieving policies matching target IDs.
+    """
+
+    def __init__(self, storage: RedisStorage):
+        self.storage = storage
+        self._index_policy = self.storage.client.register_script(INDEX_POLICY_SCRIPT)
+        self._unindex_policy = self.storage.client.register_script(UNINDEX_POLICY_SCRIPT)
+
+    @property
+    def order(self):
+        return 1
+
+    def up(self):
+        hash_key = self.storage.hash_key
+        for policy_str in self.storage.client.hvals(hash_key):
+            policy = to_policy(policy_str)
+            self._index_policy(
+                keys=[get_index_key(hash_key, policy.uid)],
+                args=get_index_entries(hash_key, policy)
+            )
+
+    def down(self):
+        hash_key = self.storage.hash_key
+        for uid in self.storage.client.hkeys(hash_key):
+            self._unindex_policy(keys=[get_index_key(hash_key, uid.decode("utf-8"))])
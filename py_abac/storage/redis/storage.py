@@ -2,14 +2,17 @@
     Redis policy storage
 """
 
-import json
 import logging
 from itertools import islice
 from typing import Generator, Union
 
 from redis import Redis
 
+from .index import ADD_POLICY_SCRIPT, UPDATE_POLICY_SCRIPT, DELETE_POLICY_SCRIPT
+from .index import GET_FOR_TARGET_SCRIPT
+from .index import get_index_key, get_index_entries, get_target_query, to_policy, to_policy_str
 from ..base import Storage
+from ...cache import PolicyCache
 from ...exceptions import PolicyExistsError
 from ...policy import Policy
 
@@ -20,22 +23,40 @@ DEFAULT_HASH_KEY = "py_abac_policies"
 
 class RedisStorage(Storage):
     """
-        Redis policy storage backend.
+        Redis policy storage backend. Policies are stored in a hash along with
+        an index of their targets used to filter policies on the server.
 
         :param client: redis client.
         :param hash_key: hash key under which policies are
             stored in database.
+        :param policy_cache: optional cache of decoded policies used when
+            retrieving policies for target IDs.
     """
 
-    def __init__(self, client: Redis, hash_key: str = None):
+    def __init__(self, client: Redis, hash_key: str = None, policy_cache: PolicyCache = None):
         self.client = client
         self._hash = hash_key or DEFAULT_HASH_KEY
+        self.policy_cache = policy_cache
+        self._add_policy = self.client.register_script(ADD_POLICY_SCRIPT)
+        self._update_policy = self.client.register_script(UPDATE_POLICY_SCRIPT)
+        self._delete_policy = self.client.register_script(DELETE_POLICY_SCRIPT)
+        self._get_for_target = self.client.register_script(GET_FOR_TARGET_SCRIPT)
+
+    @property
+    def hash_key(self) -> str:
+        """
+            Hash key under which policies are stored in database
+        """
+        return self._hash
 
     def add(self, policy: Policy):
         """
             Store a policy
         """
-        rvalue = self.client.hsetnx(self._hash, policy.uid, self.__to_policy_str(policy))
+        rvalue = self._add_policy(
+            keys=[self._hash, get_index_key(self._hash, policy.uid)],
+            args=[policy.uid, to_policy_str(policy)] + get_index_entries(self._hash, policy)
+        )
         if rvalue == 0:
             LOG.error('Error trying to create already existing policy with UID=%s.', policy.uid)
             raise PolicyExistsError(policy.uid)
@@ -48,7 +69,7 @@ class RedisStorage(Storage):
         policy_str = self.client.hget(self._hash, uid)
         if not policy_str:
             return None
-        return self.__to_policy(policy_str)
+        return to_policy(policy_str)
 
     def get_all(self, limit: int, offset: int) -> Generator[Policy, None, None]:
         """
@@ -64,7 +85,7 @@ class RedisStorage(Storage):
         rvalue = self.client.hgetall(self._hash)
         policies = islice(rvalue.values(), offset, offset + limit)
         for policy_str in policies:
-            yield self.__to_policy(policy_str)
+            yield to_policy(policy_str)
 
     def get_for_target(
             self,
@@ -73,17 +94,15 @@ class RedisStorage(Storage):
             action_id: str
     ) -> Generator[Policy, None, None]:
         """
-            Get all policies for given target IDs.
-
-            .. note:
-
-                Currently all policies are returned for evaluation by PDP.
+            Get all policies for given target IDs. The policies are filtered
+            on the server using the target index.
         """
-        # TODO: Create topologically sorted graph index for filtered retrieval.
-        rvalue = self.client.hgetall(self._hash)
-        for uid in rvalue:
-            policy_str = rvalue[uid]
-            yield self.__to_policy(policy_str)
+        rvalue = self._get_for_target(
+            keys=[self._hash],
+            args=get_target_query(self._hash, subject_id, resource_id, action_id)
+        )
+        for policy_str in rvalue:
+            yield to_policy(policy_str, self.policy_cache, lazy=True)
 
     def update(self, policy: Policy):
         """
@@ -93,14 +112,10 @@ class RedisStorage(Storage):
                 operation occurs instead of upsert.
         """
         uid = policy.uid
-        lua = \
-            """
-                if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
-                    return redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
-                end
-            """
-        update_policy = self.client.register_script(lua)
-        rvalue = update_policy(keys=[self._hash], args=[uid, self.__to_policy_str(policy)])
+        rvalue = self._update_policy(
+            keys=[self._hash, get_index_key(self._hash, uid)],
+            args=[uid, to_policy_str(policy)] + get_index_entries(self._hash, policy)
+        )
         if rvalue is not None:
             LOG.info('Updated Policy with UID=%s. New value is: %s', uid, policy)
 
@@ -108,22 +123,6 @@ class RedisStorage(Storage):
         """
             Delete a policy
         """
-        rvalue = self.client.hdel(self._hash, uid)
+        rvalue = self._delete_policy(keys=[self._hash, get_index_key(self._hash, uid)], args=[uid])
         if rvalue != 0:
             LOG.info('Deleted Policy with UID=%s.', uid)
-
-    @staticmethod
-    def __to_policy(policy_str: bytes) -> Policy:
-        """
-            Converts stored policy string to policy object.
-        """
-        policy_json = json.loads(policy_str.decode("utf-8"))
-        return Policy.from_json(policy_json)
-
-    @staticmethod
-    def __to_policy_str(policy: Policy) -> str:
-        """
-            Converts policy object to string for storage on Redis.
-        """
-        policy_json = policy.to_json()
-        return json.dumps(policy_json)
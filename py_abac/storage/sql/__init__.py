@@ -2,5 +2,6 @@
     SQL storage
 """
 
+from .async_storage import AsyncSQLStorage
 from .migrations import SQLMigrationSet
 from .storage import SQLStorage
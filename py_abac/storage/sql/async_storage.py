@@ -0,0 +1,109 @@
+"""
+    Asynchronous SQL Storage implementation
+"""
+
+import logging
+from typing import AsyncGenerator, Union, TYPE_CHECKING
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import FlushError
+
+from .model import PolicyModel
+from ..base import AsyncStorage
+from ...cache import PolicyCache
+from ...exceptions import PolicyExistsError
+from ...policy import Policy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlalchemy.ext.asyncio import AsyncSession  # pragma: no cover
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncSQLStorage(AsyncStorage):
+    """
+        Asynchronously stores and retrieves policies from SQL database. Requires
+        the asyncio extension of SQL Alchemy version 1.4 or above along with an
+        async database driver, e.g. :code:`asyncpg` or :code:`aiosqlite`.
+
+        :param session: SQL Alchemy async session
+        :param policy_cache: optional cache of decoded policies used when
+            retrieving policies for target IDs
+    """
+
+    def __init__(self, session: 'AsyncSession', policy_cache: PolicyCache = None):
+        self.session = session
+        self.policy_cache = policy_cache
+
+    async def add(self, policy: Policy):
+        try:
+            policy_model = PolicyModel.from_policy(policy)
+            self.session.add(policy_model)
+            await self.session.commit()
+            LOG.info("Added Policy: %s", policy)
+        except (IntegrityError, FlushError):
+            await self.session.rollback()
+            LOG.error("Error trying to create already existing policy with UID=%s.", policy.uid)
+            raise PolicyExistsError(policy.uid)
+
+    async def get(self, uid: str) -> Union[Policy, None]:
+        policy_model = await self.session.get(PolicyModel, uid)
+        return policy_model.to_policy() if policy_model else None
+
+    async def get_all(self, limit: int, offset: int) -> AsyncGenerator[Policy, None]:
+        self._check_limit_and_offset(limit, offset)
+        query = select(PolicyModel).order_by(PolicyModel.uid.asc()).slice(offset, offset + limit)
+        async for policy_model in self._stream(query):
+            yield policy_model.to_policy()
+
+    async def get_for_target(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> AsyncGenerator[Policy, None]:
+        policy_filter = PolicyModel.get_filter(subject_id, resource_id, action_id)
+        query = select(PolicyModel).filter(*policy_filter)
+        async for policy_model in self._stream(query):
+            yield policy_model.to_policy(self.policy_cache, lazy=True)
+
+    async def get_for_target_by_priority(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> AsyncGenerator[Policy, None]:
+        policy_filter = PolicyModel.get_filter(subject_id, resource_id, action_id)
+        query = select(PolicyModel).filter(*policy_filter).order_by(PolicyModel.priority.desc())
+        async for policy_model in self._stream(query):
+            yield policy_model.to_policy(self.policy_cache, lazy=True)
+
+    async def update(self, policy: Policy):
+        try:
+            policy_model = await self.session.get(PolicyModel, policy.uid)
+            if not policy_model:
+                return
+            policy_model.update(policy)
+            await self.session.commit()
+        except IntegrityError:  # pragma: no cover
+            await self.session.rollback()  # pragma: no cover
+            raise  # pragma: no cover
+        LOG.info('Updated Policy with UID=%s. New value is: %s', policy.uid, policy)
+
+    async def delete(self, uid: str):
+        await self.session.execute(delete(PolicyModel).where(PolicyModel.uid == uid))
+        await self.session.commit()
+        LOG.info("Deleted Policy with UID=%s.", uid)
+
+    async def _stream(self, query) -> AsyncGenerator[PolicyModel, None]:
+        """
+            Stream policy models selected by query. The results are made unique as
+            the policy targets are eagerly loaded using joins.
+        """
+        result = await self.session.stream(query)
+        try:
+            async for policy_model in result.scalars().unique():
+                yield policy_model
+        finally:
+            await result.close()
@@ -2,11 +2,11 @@
     SQL storage migrations
 """
 
-from sqlalchemy import Column, Integer
+from sqlalchemy import Column, Integer, inspect, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 
-from .model import Base
+from .model import Base, PolicyModel
 from ..migration import Migration, MigrationSet
 
 MigrationBase = declarative_base()
@@ -35,7 +35,10 @@ class SQLMigrationSet(MigrationSet):
         MigrationModel.metadata.create_all(self.storage.session.bind)
 
     def migrations(self):
-        return [Migration0To0x2x1(self.storage)]
+        return [
+            Migration0To0x2x1(self.storage),
+            Migration0x2x1To0x5x0(self.storage),
+        ]
 
     def save_applied_number(self, number):
         try:
@@ -76,3 +79,54 @@ class Migration0To0x2x1(Migration):
 
     def down(self):
         Base.metadata.drop_all(self.storage.session.bind)
+
+
+class Migration0x2x1To0x5x0(Migration):
+    """
+        Migration between versions 0.2.1 and 0.5.0.
+        Adds the priority column used for retrieving policies in order of priority.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    @property
+    def order(self):
+        return 2
+
+    def up(self):
+        session = self.storage.session
+        try:
+            # Column already exists for tables created by the initial migration
+            # using the current policy model.
+            if not self._has_priority_column():
+                session.execute(text(
+                    "ALTER TABLE {} ADD COLUMN priority INTEGER DEFAULT 0 NOT NULL".format(
+                        PolicyModel.__tablename__
+                    )
+                ))
+            # Set priority of existing policies
+            for policy_model in session.query(PolicyModel):
+                policy_model.priority = policy_model.json.get("priority", 0)
+            session.commit()
+        except SQLAlchemyError as err:  # pragma: no cover
+            session.rollback()  # pragma: no cover
+            raise err  # pragma: no cover
+
+    def down(self):
+        session = self.storage.session
+        if self._has_priority_column():
+            session.execute(text(
+                "ALTER TABLE {} DROP COLUMN priority".format(PolicyModel.__tablename__)
+            ))
+            session.commit()
+
+    def _has_priority_column(self):
+        """
+            Check if policy table has the priority column
+        """
+        inspector = inspect(self.storage.session.bind)
+        if PolicyModel.__tablename__ not in inspector.get_table_names():
+            return False
+        columns = inspector.get_columns(PolicyModel.__tablename__)
+        return any(column["name"] == "priority" for column in columns)
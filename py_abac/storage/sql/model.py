@@ -9,6 +9,7 @@ from sqlalchemy import literal
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
+from ...cache import PolicyCache
 from ...policy import Policy
 
 Base = declarative_base()
@@ -59,6 +60,8 @@ class PolicyModel(Base):
 
     uid = Column(String(248), primary_key=True)
     json = Column(JSON(), nullable=False)
+    priority = Column(Integer, nullable=False, default=0, server_default="0",
+                      comment="Policy priority used for ordering policies")
     subjects = relationship(SubjectTargetModel, passive_deletes=True, lazy='joined')
     resources = relationship(ResourceTargetModel, passive_deletes=True, lazy='joined')
     actions = relationship(ActionTargetModel, passive_deletes=True, lazy='joined')
@@ -73,11 +76,16 @@ class PolicyModel(Base):
 
         return rvalue
 
-    def to_policy(self) -> Policy:
+    def to_policy(self, cache: PolicyCache = None, lazy: bool = False) -> Policy:
         """
             Get `Policy` object from model instance
+
+            :param cache: optional cache of decoded policies
+            :param lazy: if True, the policy rules are decoded on first access
         """
-        return Policy.from_json(self.json)
+        if cache is not None:
+            return cache.get_policy(self.json, lazy)
+        return Policy.from_json(self.json, lazy)
 
     def update(self, policy: Policy):
         """
@@ -108,6 +116,7 @@ class PolicyModel(Base):
         """
         self.uid = policy.uid
         self.json = policy.to_json()
+        self.priority = policy.priority
 
         # Setup targets
         self._setup_targets(
@@ -10,6 +10,7 @@ from sqlalchemy.orm.exc import FlushError
 
 from .model import PolicyModel
 from ..base import Storage
+from ...cache import PolicyCache
 from ...exceptions import PolicyExistsError
 from ...policy import Policy
 
@@ -21,10 +22,13 @@ class SQLStorage(Storage):
         Stores and retrieves policies from SQL database
 
         :param scoped_session: SQL Alchemy scoped session
+        :param policy_cache: optional cache of decoded policies used when
+            retrieving policies for target IDs
     """
 
-    def __init__(self, scoped_session):
+    def __init__(self, scoped_session, policy_cache: PolicyCache = None):
         self.session = scoped_session
+        self.policy_cache = policy_cache
         self.dialect = scoped_session.bind.engine.dialect.name
 
     def add(self, policy: Policy):
@@ -58,7 +62,19 @@ class SQLStorage(Storage):
         policy_filter = PolicyModel.get_filter(subject_id, resource_id, action_id)
         cur = self.session.query(PolicyModel).filter(*policy_filter)
         for policy_model in cur:
-            yield policy_model.to_policy()
+            yield policy_model.to_policy(self.policy_cache, lazy=True)
+
+    def get_for_target_by_priority(
+            self,
+            subject_id: str,
+            resource_id: str,
+            action_id: str
+    ) -> Generator[Policy, None, None]:
+        policy_filter = PolicyModel.get_filter(subject_id, resource_id, action_id)
+        cur = self.session.query(PolicyModel).filter(*policy_filter) \
+            .order_by(PolicyModel.priority.desc())
+        for policy_model in cur:
+            yield policy_model.to_policy(self.policy_cache, lazy=True)
 
     def update(self, policy: Policy):
         try:
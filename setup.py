@@ -19,6 +19,12 @@ extra_requires_sql = [
 extra_requires_redis = [
     'redis~=3.5'
 ]
+extra_requires_async_sql = [
+    'SQLAlchemy~=1.4'
+]
+extra_requires_async_redis = [
+    'redis>=4.2'
+]
 extra_requires_doc = [
     'sphinx==2.4.1',
     'sphinx-rtd-theme~=0.4'
@@ -33,7 +39,8 @@ extra_requires_utils = [
     'pylint~=1.0',
     'bandit~=1.6',
     'PyMySQL~=0.9',
-    'psycopg2cffi~=2.8'
+    'psycopg2cffi~=2.8',
+    'aiosqlite~=0.17'
 ]
 extra_requires_dev = extra_requires_utils + \
                      extra_requires_mongo + \
@@ -69,6 +76,8 @@ if __name__ == '__main__':
             'sql': extra_requires_sql,
             'file': extra_requires_file,
             'redis': extra_requires_redis,
+            'async-sql': extra_requires_async_sql,
+            'async-redis': extra_requires_async_redis,
         },
         packages=find_packages(exclude=('tests', 'benchmarks')),
         classifiers=[
@@ -0,0 +1,219 @@
+"""
+    Unit test caching utilities
+"""
+
+import json
+
+import pytest
+
+from py_abac import cache
+from py_abac.cache import LRUCache, DecisionCache, PolicyCache, AttributeDecisionCache
+from py_abac.policy import Policy
+from py_abac.request import AccessRequest
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(cache, "monotonic", fake_clock)
+    yield fake_clock
+
+
+def test_create_error():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+    with pytest.raises(ValueError):
+        LRUCache(10, ttl=0)
+
+
+def test_get_and_set():
+    lru_cache = LRUCache(10)
+    assert lru_cache.get("a") is None
+    assert lru_cache.get("a", False) is False
+    lru_cache.set("a", 1)
+    lru_cache.set("b", None)
+    assert lru_cache.get("a") == 1
+    assert lru_cache.get("b", 2) is None
+    assert len(lru_cache) == 2
+    assert lru_cache.stats == {"hits": 2, "misses": 2, "evictions": 0, "size": 2, "max_size": 10}
+
+    lru_cache.clear()
+    assert len(lru_cache) == 0
+    assert lru_cache.get("a") is None
+
+
+def test_eviction():
+    lru_cache = LRUCache(2)
+    lru_cache.set("a", 1)
+    lru_cache.set("b", 2)
+    # Access "a" so that "b" is least recently used
+    assert lru_cache.get("a") == 1
+    lru_cache.set("c", 3)
+    assert lru_cache.get("b") is None
+    assert lru_cache.get("a") == 1
+    assert lru_cache.get("c") == 3
+    assert lru_cache.evictions == 1
+
+
+def test_ttl(clock):
+    lru_cache = LRUCache(10, ttl=5)
+    lru_cache.set("a", 1)
+    clock.now = 4.9
+    assert lru_cache.get("a") == 1
+    clock.now = 5.0
+    assert lru_cache.get("a") is None
+    assert len(lru_cache) == 0
+    assert lru_cache.hits == 1
+    assert lru_cache.misses == 1
+
+    # No expiry without TTL
+    lru_cache = LRUCache(10)
+    lru_cache.set("a", 1)
+    clock.now = 1e9
+    assert lru_cache.get("a") == 1
+
+
+def test_ttl_override(clock):
+    lru_cache = LRUCache(10, ttl=5)
+    lru_cache.set("a", 1, ttl=1)
+    lru_cache.set("b", 2)
+    clock.now = 1
+    assert lru_cache.get("a") is None
+    assert lru_cache.get("b") == 2
+    lru_cache = LRUCache(10)
+    lru_cache.set("a", 1, ttl=1)
+    lru_cache.set("b", 2)
+    clock.now = 1e9
+    assert lru_cache.get("a") is None
+    assert lru_cache.get("b") == 2
+
+
+def test_decision_cache_key():
+    request_json = {
+        "subject": {"id": "a", "attributes": {"name": "Max", "roles": ["admin"]}},
+        "resource": {"id": "b", "attributes": {"name": "doc"}},
+        "action": {"id": "c", "attributes": {"method": "get"}},
+        "context": {"ip": "127.0.0.1"}
+    }
+    key = DecisionCache.make_key(AccessRequest.from_json(request_json))
+    # Key is independent of attribute order
+    reordered_json = {
+        "context": {"ip": "127.0.0.1"},
+        "action": {"attributes": {"method": "get"}, "id": "c"},
+        "resource": {"id": "b", "attributes": {"name": "doc"}},
+        "subject": {"id": "a", "attributes": {"roles": ["admin"], "name": "Max"}}
+    }
+    assert DecisionCache.make_key(AccessRequest.from_json(reordered_json)) == key
+
+    for element, change in [
+        ("subject", {"id": "x"}),
+        ("subject", {"attributes": {"name": "Nina", "roles": ["admin"]}}),
+        ("resource", {"id": "x"}),
+        ("action", {"attributes": {"method": "put"}}),
+    ]:
+        changed_json = dict(request_json)
+        changed_json[element] = dict(request_json[element], **change)
+        assert DecisionCache.make_key(AccessRequest.from_json(changed_json)) != key
+    changed_json = dict(request_json, context={"ip": "127.0.0.2"})
+    assert DecisionCache.make_key(AccessRequest.from_json(changed_json)) != key
+
+    # Attributes not serializable to JSON are supported
+    request = AccessRequest({"id": "a", "attributes": {"roles": {"admin"}}}, {}, {}, {})
+    assert DecisionCache.make_key(request) == DecisionCache.make_key(request)
+
+
+@pytest.mark.parametrize("attributes, other_attributes", [
+    ({"roles": {"admin"}}, {"roles": "{'admin'}"}),
+    ({"roles": {"admin"}}, {"roles": ["admin"]}),
+    ({"roles": ("admin",)}, {"roles": ["admin"]}),
+    ({"roles": frozenset(["admin"])}, {"roles": {"admin"}}),
+    ({1: "admin"}, {"1": "admin"}),
+    ({"roles": {"__type__": "set", "value": ['"admin"']}}, {"roles": {"admin"}}),
+])
+def test_decision_cache_key_non_json_types(attributes, other_attributes):
+    request = AccessRequest({"id": "a", "attributes": attributes}, {}, {}, {})
+    other_request = AccessRequest({"id": "a", "attributes": other_attributes}, {}, {}, {})
+    assert DecisionCache.make_key(request) != DecisionCache.make_key(other_request)
+
+
+def test_decision_cache_key_set_order():
+    request = AccessRequest({"id": "a", "attributes": {"roles": {"admin", "dev", "ops"}}}, {}, {}, {})
+    other_request = AccessRequest({"id": "a", "attributes": {"roles": {"ops", "dev", "admin"}}}, {}, {}, {})
+    assert DecisionCache.make_key(request) == DecisionCache.make_key(other_request)
+
+
+POLICY_JSON = {
+    "uid": "1",
+    "description": "Policy cache test",
+    "rules": {"subject": {"$.name": {"condition": "Equals", "value": "Max"}}},
+    "targets": {"subject_id": "a*"},
+    "effect": "allow",
+    "priority": 1
+}
+
+
+@pytest.mark.parametrize("policy_json", [
+    POLICY_JSON,
+    json.dumps(POLICY_JSON),
+    json.dumps(POLICY_JSON).encode("utf-8"),
+])
+def test_policy_cache(policy_json):
+    policy_cache = PolicyCache(max_size=2)
+    policy = policy_cache.get_policy(policy_json)
+    assert isinstance(policy, Policy)
+    assert policy.to_json() == Policy.from_json(POLICY_JSON).to_json()
+    assert policy_cache.stats["misses"] == 1 and policy_cache.stats["hits"] == 0
+    # Unchanged policies are decoded once
+    assert policy_cache.get_policy(policy_json) is policy
+    assert policy_cache.stats["misses"] == 1 and policy_cache.stats["hits"] == 1
+    # Changed policies are decoded again
+    changed_policy = policy_cache.get_policy(dict(POLICY_JSON, priority=2))
+    assert changed_policy is not policy
+    assert changed_policy.priority == 2
+    assert len(policy_cache) == 2
+
+
+def test_policy_cache_key():
+    key = PolicyCache.make_key(POLICY_JSON)
+    reordered_json = dict(reversed(list(POLICY_JSON.items())))
+    assert PolicyCache.make_key(reordered_json) == key
+    assert PolicyCache.make_key(dict(POLICY_JSON, effect="deny")) != key
+    policy_str = json.dumps(POLICY_JSON)
+    assert PolicyCache.make_key(policy_str) == PolicyCache.make_key(policy_str.encode("utf-8"))
+
+
+def test_attribute_decision_cache_key():
+    target = ("user:1", "doc:1", "read")
+    values = {("subject", "$.roles"): ["admin"], ("context", "$.ip"): "127.0.0.1", ("action", "$.method"): None}
+    key = AttributeDecisionCache.make_attribute_key(target, values)
+    reordered_values = dict(reversed(list(values.items())))
+    assert AttributeDecisionCache.make_attribute_key(target, reordered_values) == key
+    changed_values = dict(values)
+    changed_values[("context", "$.ip")] = "127.0.0.2"
+    assert AttributeDecisionCache.make_attribute_key(target, changed_values) != key
+    assert AttributeDecisionCache.make_attribute_key(("user:2", "doc:1", "read"), values) != key
+    # Attributes are not confused between access control elements
+    assert AttributeDecisionCache.make_attribute_key(target, {("subject", "$.a"): 1}) != \
+        AttributeDecisionCache.make_attribute_key(target, {("resource", "$.a"): 1})
+
+
+def test_attribute_decision_cache_clear():
+    decision_cache = AttributeDecisionCache(max_size=2)
+    target = ("user:1", "doc:1", "read")
+    decision_cache.set_required_attributes(target, frozenset([("subject", "$.name")]))
+    key = decision_cache.make_attribute_key(target, {("subject", "$.name"): "Max"})
+    decision_cache.set(key, True)
+    assert decision_cache.get_required_attributes(target) == frozenset([("subject", "$.name")])
+    assert decision_cache.get(key) is True
+    decision_cache.clear()
+    assert decision_cache.get_required_attributes(target) is None
+    assert decision_cache.get(key) is None
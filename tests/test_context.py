@@ -2,6 +2,9 @@
     Unit test evaluation context
 """
 
+import time
+from concurrent import futures
+
 import pytest
 
 from py_abac.context import EvaluationContext
@@ -99,6 +102,242 @@ def test_get_attribute_value():
     assert context.get_attribute_value("context", "$.ip") is None
 
 
+class CountingAttributeProvider(AttributeProvider):
+
+    def __init__(self, values):
+        self.values = values
+        self.calls = []
+
+    def get_attribute_value(self, ace, attribute_path, ctx):
+        self.calls.append((ace, attribute_path))
+        return self.values.get((ace, attribute_path))
+
+
+class NestedAttributeProvider(AttributeProvider):
+
+    def get_attribute_value(self, ace, attribute_path, ctx):
+        if attribute_path == "$.manager_email":
+            return ctx.get_attribute_value(ace, "$.email")
+        if attribute_path == "$.email":
+            return "nested@gmail.com"
+        return None
+
+
+def test_attribute_provider_memoized():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {"firstName": "Carl"}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    first_provider = CountingAttributeProvider({("subject", "$.email"): "carl@gmail.com"})
+    second_provider = CountingAttributeProvider({("subject", "$.age"): 21})
+    context = EvaluationContext(request, providers=[first_provider, second_provider])
+    for _ in range(3):
+        assert context.get_attribute_value("subject", "$.email") == "carl@gmail.com"
+        assert context.get_attribute_value("subject", "$.age") == 21
+        assert context.get_attribute_value("subject", "$.phone") is None
+        assert context.get_attribute_value("subject", "$.firstName") == "Carl"
+    # Providers are called once per attribute, including attributes not found
+    assert first_provider.calls == [("subject", "$.email"), ("subject", "$.age"), ("subject", "$.phone")]
+    assert second_provider.calls == [("subject", "$.age"), ("subject", "$.phone")]
+    # Memoized values are per context
+    context = EvaluationContext(request, providers=[first_provider, second_provider])
+    assert context.get_attribute_value("subject", "$.email") == "carl@gmail.com"
+    assert len(first_provider.calls) == 4
+
+
+def test_attribute_provider_nested_lookup_not_memoized():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    context = EvaluationContext(request, providers=[NestedAttributeProvider(), EmailAttributeProvider()])
+    # Nested lookup of email skips the nested provider in call stack
+    assert context.get_attribute_value("subject", "$.manager_email") == "carl@gmail.com"
+    # Top-level lookup of email is not served from the nested lookup
+    assert context.get_attribute_value("subject", "$.email") == "nested@gmail.com"
+    assert context._active_providers == set()
+
+
+class BulkAttributeProvider(CountingAttributeProvider):
+
+    def __init__(self, values):
+        super().__init__(values)
+        self.bulk_calls = []
+
+    def get_attribute_values(self, keys, ctx):
+        self.bulk_calls.append(list(keys))
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+def test_prefetch_attribute_values():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {"firstName": "Carl"}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    first_provider = BulkAttributeProvider({("subject", "$.email"): "carl@gmail.com"})
+    second_provider = BulkAttributeProvider({("subject", "$.email"): "other@gmail.com",
+                                             ("subject", "$.age"): 21})
+    context = EvaluationContext(request, providers=[first_provider, second_provider])
+    context.prefetch_attribute_values([("subject", "$.firstName"), ("subject", "$.email"),
+                                       ("subject", "$.age"), ("subject", "$.phone"), ("subject", "$.age")])
+    # Attributes in request are not prefetched. Providers are called for values not found by preceding providers.
+    assert first_provider.bulk_calls == [[("subject", "$.email"), ("subject", "$.age"), ("subject", "$.phone")]]
+    assert second_provider.bulk_calls == [[("subject", "$.age"), ("subject", "$.phone")]]
+    assert context.get_attribute_value("subject", "$.firstName") == "Carl"
+    assert context.get_attribute_value("subject", "$.email") == "carl@gmail.com"
+    assert context.get_attribute_value("subject", "$.age") == 21
+    assert context.get_attribute_value("subject", "$.phone") is None
+    assert first_provider.calls == [] and second_provider.calls == []
+    # Memoized values are not prefetched again
+    context.prefetch_attribute_values([("subject", "$.email"), ("subject", "$.phone")])
+    assert len(first_provider.bulk_calls) == 1
+
+
+def test_prefetch_attribute_values_not_supported():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    first_provider = BulkAttributeProvider({("subject", "$.email"): "carl@gmail.com"})
+    second_provider = CountingAttributeProvider({("subject", "$.email"): "other@gmail.com",
+                                                 ("subject", "$.age"): 21})
+    third_provider = BulkAttributeProvider({("subject", "$.age"): 42})
+    context = EvaluationContext(request, providers=[first_provider, second_provider, third_provider])
+    context.prefetch_attribute_values([("subject", "$.email"), ("subject", "$.age")])
+    # Prefetching stops at provider not supporting bulk retrieval
+    assert third_provider.bulk_calls == []
+    assert context.get_attribute_value("subject", "$.email") == "carl@gmail.com"
+    assert context.get_attribute_value("subject", "$.age") == 21
+    assert second_provider.calls == [("subject", "$.age")]
+
+
+class RoutedAttributeProvider(BulkAttributeProvider):
+
+    def __init__(self, values, routes):
+        super().__init__(values)
+        self.routes = routes
+
+
+def test_attribute_provider_routes():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    address_provider = RoutedAttributeProvider({("subject", "$.address.city"): "Paris",
+                                                ("subject", "$.email"): "wrong@gmail.com"},
+                                               [("subject", "$.address")])
+    email_provider = RoutedAttributeProvider({("subject", "$.email"): "carl@gmail.com",
+                                              ("resource", "$.email"): "doc@gmail.com"},
+                                             [("subject", "$.email"), ("resource", "$")])
+    catch_all_provider = CountingAttributeProvider({("subject", "$.addresses"): ["Rome"]})
+    context = EvaluationContext(request, providers=[address_provider, email_provider, catch_all_provider])
+    assert context.get_attribute_value("subject", "$.address.city") == "Paris"
+    assert context.get_attribute_value("subject", "$.email") == "carl@gmail.com"
+    assert context.get_attribute_value("resource", "$.email") == "doc@gmail.com"
+    # Path prefixes only match whole members
+    assert context.get_attribute_value("subject", "$.addresses") == ["Rome"]
+    assert context.get_attribute_value("action", "$.method") is None
+    # Providers are only called for the attributes they serve
+    assert address_provider.calls == [("subject", "$.address.city")]
+    assert email_provider.calls == [("subject", "$.email"), ("resource", "$.email")]
+    assert catch_all_provider.calls == [("subject", "$.addresses"), ("action", "$.method")]
+
+
+def test_prefetch_attribute_values_routes():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    first_provider = CountingAttributeProvider({("subject", "$.age"): 21})
+    first_provider.routes = [("subject", "$.age")]
+    second_provider = RoutedAttributeProvider({("subject", "$.email"): "carl@gmail.com",
+                                               ("subject", "$.age"): 42}, [("subject", "$")])
+    third_provider = RoutedAttributeProvider({}, [("context", "$")])
+    context = EvaluationContext(request, providers=[first_provider, second_provider, third_provider])
+    context.prefetch_attribute_values([("subject", "$.email"), ("subject", "$.age"), ("subject", "$.phone")])
+    # Attributes served by a provider not supporting bulk retrieval are left to it
+    assert second_provider.bulk_calls == [[("subject", "$.email"), ("subject", "$.phone")]]
+    assert third_provider.bulk_calls == []
+    assert context.get_attribute_value("subject", "$.email") == "carl@gmail.com"
+    assert context.get_attribute_value("subject", "$.phone") is None
+    assert context.get_attribute_value("subject", "$.age") == 21
+    assert second_provider.calls == [] and first_provider.calls == [("subject", "$.age")]
+
+
+class SlowAttributeProvider(CountingAttributeProvider):
+
+    def __init__(self, values, delay, delays=None):
+        super().__init__(values)
+        self.delay = delay
+        self.delays = delays or {}
+
+    def get_attribute_value(self, ace, attribute_path, ctx):
+        time.sleep(self.delays.get((ace, attribute_path), self.delay))
+        return super().get_attribute_value(ace, attribute_path, ctx)
+
+
+def test_resolve_attribute_values():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {"firstName": "Carl"}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    provider = SlowAttributeProvider({("subject", "$.email"): "carl@gmail.com",
+                                      ("subject", "$.age"): 21,
+                                      ("resource", "$.owner"): "Carl"}, 0.2)
+    context = EvaluationContext(request, providers=[provider, NestedAttributeProvider()])
+    keys = [("subject", "$.firstName"), ("subject", "$.email"), ("subject", "$.age"),
+            ("resource", "$.owner"), ("subject", "$.manager_email"), ("subject", "$.email")]
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        start = time.monotonic()
+        context.resolve_attribute_values(keys, executor)
+        # Lookups are made concurrently. The manager email takes two lookups one after the other.
+        assert time.monotonic() - start < 0.6
+    # Attributes in request are not looked up
+    assert ("subject", "$.firstName") not in provider.calls
+    assert len(provider.calls) == 5
+    provider.calls.clear()
+    assert context.get_attribute_value("subject", "$.email") == "carl@gmail.com"
+    assert context.get_attribute_value("subject", "$.age") == 21
+    assert context.get_attribute_value("resource", "$.owner") == "Carl"
+    # Nested lookups made by providers in other threads are guarded against recursion
+    assert context.get_attribute_value("subject", "$.manager_email") == "carl@gmail.com"
+    assert provider.calls == []
+    assert context._active_providers == set()
+
+
+def test_resolve_attribute_values_timeout():
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {}},
+        "resource": {"id": "a"},
+        "action": {"id": ""},
+        "context": {}
+    })
+    provider = SlowAttributeProvider({("subject", "$.email"): "carl@gmail.com", ("subject", "$.age"): 21},
+                                     0, {("subject", "$.age"): 0.5})
+    context = EvaluationContext(request, providers=[provider])
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        start = time.monotonic()
+        with pytest.raises(futures.TimeoutError):
+            context.resolve_attribute_values([("subject", "$.email"), ("subject", "$.age")], executor, 0.1)
+        assert time.monotonic() - start < 0.3
+    # Values retrieved in time are memoized
+    assert context._provider_values == {("subject", "$.email"): "carl@gmail.com"}
+
+
 def test_attribute_provider_infinite_recursion():
     request_json = {
         "subject": {
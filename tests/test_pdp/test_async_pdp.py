@@ -0,0 +1,228 @@
+"""
+    Asynchronous PDP tests
+"""
+
+import asyncio
+
+import pytest
+
+from py_abac.cache import DecisionCache, AttributeDecisionCache
+from py_abac.pdp import PDP, AsyncPDP, EvaluationAlgorithm
+from py_abac.policy import Policy
+from py_abac.provider.base import AttributeProvider, AsyncAttributeProvider
+from py_abac.request import AccessRequest
+from py_abac.storage.base import AsyncStorage
+from py_abac.storage.memory import MemoryStorage
+from .test_pdp_with_memory import POLICIES, SUBJECT_IDS, EmailsAttributeProvider
+
+REQUESTS = [
+    {
+        "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max"}},
+        "resource": {"id": "myrn:example.com:resource:123", "attributes": {"name": "myrn:example.com:resource:123"}},
+        "action": {"id": "", "attributes": {"method": "get"}},
+        "context": {"ip": "127.0.0.1"}
+    },
+    {
+        "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max"}},
+        "resource": {"id": "myrn:example.com:resource:123", "attributes": {"name": "myrn:example.com:resource:123"}},
+        "action": {"id": "", "attributes": {"method": "print"}},
+        "context": {}
+    },
+    {
+        "subject": {"id": SUBJECT_IDS["Nina"], "attributes": {"name": "Nina"}},
+        "resource": {"id": "", "attributes": {"name": "11111"}},
+        "action": {"id": "", "attributes": {"method": "update"}},
+        "context": {"id": 123}
+    },
+    {
+        "subject": {"id": SUBJECT_IDS["Ben"], "attributes": {"name": "Ben"}},
+        "resource": {"id": "", "attributes": {"name": "doc"}},
+        "action": {"id": "", "attributes": {"method": "print"}},
+        "context": {}
+    },
+    {
+        "subject": {"id": SUBJECT_IDS["Henry"], "attributes": {"name": "Henry", "roles": ["employee", "manager"]}},
+        "resource": {"id": "", "attributes": {"name": "doc:confidential:sales:1"}},
+        "action": {"id": "", "attributes": {"method": "get"}},
+        "context": {"ip": "127.0.0.1"}
+    },
+    {
+        "subject": {"id": "", "attributes": {}},
+        "resource": {"id": "", "attributes": {}},
+        "action": {"id": "", "attributes": {}},
+        "context": {}
+    },
+]
+
+
+class AsyncMemoryStorage(AsyncStorage):
+
+    def __init__(self):
+        self._storage = MemoryStorage()
+        self.calls = 0
+
+    async def add(self, policy):
+        self._storage.add(policy)
+
+    async def get(self, uid):
+        return self._storage.get(uid)
+
+    async def get_all(self, limit, offset):
+        for policy in self._storage.get_all(limit, offset):
+            yield policy
+
+    async def get_for_target(self, subject_id, resource_id, action_id):
+        self.calls += 1
+        for policy in self._storage.get_for_target(subject_id, resource_id, action_id):
+            # Yield control to event loop as a remote storage would
+            await asyncio.sleep(0)
+            yield policy
+
+    async def update(self, policy):
+        self._storage.update(policy)
+
+    async def delete(self, uid):
+        self._storage.delete(uid)
+
+
+class AsyncEmailsAttributeProvider(AsyncAttributeProvider):
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_attribute_value(self, ace, attribute_path, ctx):
+        self.calls.append((ace, attribute_path))
+        await asyncio.sleep(0.01)
+        if ace == "subject" and attribute_path == "$.email":
+            if ctx.get_attribute_value(ace, "$.name") == "Ben":
+                return "ben@gmail.com"
+        return None
+
+
+def create_storage():
+    st = AsyncMemoryStorage()
+    for policy_json in POLICIES:
+        asyncio.run(st.add(Policy.from_json(policy_json)))
+    return st
+
+
+@pytest.mark.parametrize("algorithm", list(EvaluationAlgorithm))
+@pytest.mark.parametrize("compile_policies", [False, True])
+@pytest.mark.parametrize("provider_cls", [EmailsAttributeProvider, AsyncEmailsAttributeProvider])
+def test_is_allowed(algorithm, compile_policies, provider_cls):
+    st = create_storage()
+    sync_pdp = PDP(st._storage, algorithm, [EmailsAttributeProvider()])
+    pdp = AsyncPDP(st, algorithm, [provider_cls()], compile_policies=compile_policies)
+    for request_json in REQUESTS:
+        request = AccessRequest.from_json(request_json)
+        assert asyncio.run(pdp.is_allowed(request)) == sync_pdp.is_allowed(request)
+
+
+def test_is_allowed_with_async_provider():
+    st = create_storage()
+    provider = AsyncEmailsAttributeProvider()
+    pdp = AsyncPDP(st, EvaluationAlgorithm.DENY_OVERRIDES, [provider])
+    request = AccessRequest.from_json(REQUESTS[3])
+    assert asyncio.run(pdp.is_allowed(request))
+    # Missing attributes fetched once from asynchronous provider for evaluation of all policies
+    assert sorted(provider.calls) == [("subject", "$.email"), ("subject", "$.roles")]
+
+
+@pytest.mark.parametrize("algorithm", list(EvaluationAlgorithm))
+def test_is_allowed_many(algorithm):
+    st = create_storage()
+    provider = AsyncEmailsAttributeProvider()
+    pdp = AsyncPDP(st, algorithm, [provider])
+    requests = [AccessRequest.from_json(request_json) for request_json in REQUESTS] * 20
+    sync_pdp = PDP(st._storage, algorithm, [EmailsAttributeProvider()])
+
+    async def is_allowed_many():
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        decisions = await pdp.is_allowed_many(requests)
+        return decisions, loop.time() - start
+
+    decisions, elapsed = asyncio.run(is_allowed_many())
+    assert decisions == [sync_pdp.is_allowed(request) for request in requests]
+    # Storage queried once per distinct target
+    assert st.calls == len(REQUESTS) - 1
+    # Requests evaluated concurrently, so the provider latency is not summed up
+    assert len(provider.calls) > 20
+    assert elapsed < len(provider.calls) * 0.01
+
+
+def test_is_allowed_with_cache():
+    st = create_storage()
+    cache = DecisionCache(max_size=10)
+    pdp = AsyncPDP(st, providers=[AsyncEmailsAttributeProvider()], cache=cache)
+    request = AccessRequest.from_json(REQUESTS[3])
+    assert asyncio.run(pdp.is_allowed(request))
+    assert asyncio.run(pdp.is_allowed(request))
+    assert pdp.cache is cache
+    assert st.calls == 1
+    assert cache.hits == 1
+
+
+@pytest.mark.parametrize("algorithm", list(EvaluationAlgorithm))
+@pytest.mark.parametrize("provider_cls", [EmailsAttributeProvider, AsyncEmailsAttributeProvider])
+def test_is_allowed_with_attribute_cache(algorithm, provider_cls):
+    st = create_storage()
+    sync_pdp = PDP(st._storage, algorithm, [EmailsAttributeProvider()])
+    pdp = AsyncPDP(st, algorithm, [provider_cls()], cache=AttributeDecisionCache(max_size=100))
+    for _ in range(2):
+        for request_json in REQUESTS:
+            request = AccessRequest.from_json(request_json)
+            assert asyncio.run(pdp.is_allowed(request)) == sync_pdp.is_allowed(request)
+    # Storage is queried once for every target and decisions are served from cache on repetition
+    assert st.calls == len(REQUESTS)
+    assert pdp.cache.hits == len(REQUESTS)
+
+
+def test_pdp_create_error():
+    st = create_storage()
+    with pytest.raises(TypeError):
+        AsyncPDP(MemoryStorage())
+    with pytest.raises(TypeError):
+        AsyncPDP(st, None)
+    with pytest.raises(TypeError):
+        AsyncPDP(st, EvaluationAlgorithm.DENY_OVERRIDES, [None])
+    with pytest.raises(TypeError):
+        AsyncPDP(st, cache={})
+    with pytest.raises(ValueError):
+        AsyncPDP(st, timeout=-1)
+
+
+def test_is_allowed_error():
+    pdp = AsyncPDP(create_storage())
+    with pytest.raises(TypeError):
+        asyncio.run(pdp.is_allowed(None))
+    with pytest.raises(TypeError):
+        asyncio.run(pdp.is_allowed_many([None]))
+
+
+class SlowAsyncEmailsAttributeProvider(AsyncEmailsAttributeProvider):
+
+    async def get_attribute_value(self, ace, attribute_path, ctx):
+        await asyncio.sleep(1)
+        return await super().get_attribute_value(ace, attribute_path, ctx)
+
+
+@pytest.mark.parametrize("timeout_decision", [False, True])
+def test_is_allowed_timeout(timeout_decision):
+    st = create_storage()
+    pdp = AsyncPDP(st, providers=[SlowAsyncEmailsAttributeProvider()], timeout=0.05,
+                   timeout_decision=timeout_decision)
+    assert asyncio.run(pdp.is_allowed(AccessRequest.from_json(REQUESTS[3]))) == timeout_decision
+    # Decisions made within the timeout are not affected
+    fast_pdp = AsyncPDP(st, providers=[AsyncEmailsAttributeProvider()], timeout=5,
+                        timeout_decision=timeout_decision)
+    assert asyncio.run(fast_pdp.is_allowed(AccessRequest.from_json(REQUESTS[3])))
+    # A decision exceeding the timeout does not affect the others of a batch sharing its target
+    fast_request_json = dict(REQUESTS[3], subject={"id": SUBJECT_IDS["Ben"], "attributes": {
+        "name": "Ben", "email": "ben@gmail.com", "roles": []
+    }})
+    decisions = asyncio.run(pdp.is_allowed_many([
+        AccessRequest.from_json(REQUESTS[3]), AccessRequest.from_json(fast_request_json)
+    ]))
+    sync_pdp = PDP(st._storage)
+    assert decisions == [timeout_decision, sync_pdp.is_allowed(AccessRequest.from_json(fast_request_json))]
@@ -2,8 +2,13 @@
     PDP tests with In-Memory storage
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from py_abac.cache import DecisionCache, AttributeDecisionCache
 from py_abac.pdp import PDP, EvaluationAlgorithm
 from py_abac.policy import Policy
 from py_abac.provider.base import AttributeProvider
@@ -392,8 +397,9 @@ def st():
             False,
     ),
 ])
-def test_is_allowed_deny_overrides(st, desc, request_json, should_be_allowed):
-    pdp = PDP(st, EvaluationAlgorithm.DENY_OVERRIDES, [EmailsAttributeProvider()])
+@pytest.mark.parametrize("compile_policies", [False, True])
+def test_is_allowed_deny_overrides(st, desc, request_json, should_be_allowed, compile_policies):
+    pdp = PDP(st, EvaluationAlgorithm.DENY_OVERRIDES, [EmailsAttributeProvider()], compile_policies=compile_policies)
     request = AccessRequest.from_json(request_json)
     assert should_be_allowed == pdp.is_allowed(request)
 
@@ -631,8 +637,9 @@ def test_is_allowed_deny_overrides(st, desc, request_json, should_be_allowed):
             True,
     ),
 ])
-def test_is_allowed_allow_overrides(st, desc, request_json, should_be_allowed):
-    pdp = PDP(st, EvaluationAlgorithm.ALLOW_OVERRIDES, [EmailsAttributeProvider()])
+@pytest.mark.parametrize("compile_policies", [False, True])
+def test_is_allowed_allow_overrides(st, desc, request_json, should_be_allowed, compile_policies):
+    pdp = PDP(st, EvaluationAlgorithm.ALLOW_OVERRIDES, [EmailsAttributeProvider()], compile_policies=compile_policies)
     request = AccessRequest.from_json(request_json)
     assert should_be_allowed == pdp.is_allowed(request)
 
@@ -870,8 +877,9 @@ def test_is_allowed_allow_overrides(st, desc, request_json, should_be_allowed):
             True,
     ),
 ])
-def test_is_allowed_highest_priority(st, desc, request_json, should_be_allowed):
-    pdp = PDP(st, EvaluationAlgorithm.HIGHEST_PRIORITY, [EmailsAttributeProvider()])
+@pytest.mark.parametrize("compile_policies", [False, True])
+def test_is_allowed_highest_priority(st, desc, request_json, should_be_allowed, compile_policies):
+    pdp = PDP(st, EvaluationAlgorithm.HIGHEST_PRIORITY, [EmailsAttributeProvider()], compile_policies=compile_policies)
     request = AccessRequest.from_json(request_json)
     assert should_be_allowed == pdp.is_allowed(request)
 
@@ -883,9 +891,388 @@ def test_pdp_create_error(st):
         PDP(st, None)
     with pytest.raises(TypeError):
         PDP(st, EvaluationAlgorithm.DENY_OVERRIDES, [None])
+    with pytest.raises(TypeError):
+        PDP(st, executor=object())
+    with pytest.raises(ValueError):
+        PDP(st, executor=ThreadPoolExecutor(), timeout=0)
+    with pytest.raises(ValueError):
+        PDP(st, timeout=1)
 
 
 def test_is_allowed_error(st):
     g = PDP(st)
     with pytest.raises(TypeError):
         g.is_allowed(None)
+
+
+class CountingMemoryStorage(MemoryStorage):
+
+    def __init__(self):
+        super().__init__()
+        self.target_calls = []
+
+    def get_for_target(self, subject_id, resource_id, action_id):
+        self.target_calls.append((subject_id, resource_id, action_id))
+        return super().get_for_target(subject_id, resource_id, action_id)
+
+    def get_for_target_by_priority(self, subject_id, resource_id, action_id):
+        self.target_calls.append((subject_id, resource_id, action_id))
+        return super().get_for_target_by_priority(subject_id, resource_id, action_id)
+
+
+@pytest.mark.parametrize("algorithm", list(EvaluationAlgorithm))
+def test_is_allowed_many(algorithm):
+    st = CountingMemoryStorage()
+    for policy_json in POLICIES:
+        st.add(Policy.from_json(policy_json))
+    requests = [
+        AccessRequest.from_json(request_json) for request_json in [
+            {
+                "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max"}},
+                "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+                "action": {"id": "", "attributes": {"method": "update"}},
+                "context": {}
+            },
+            {
+                "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max"}},
+                "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+                "action": {"id": "", "attributes": {"method": "print"}},
+                "context": {}
+            },
+            {
+                "subject": {"id": SUBJECT_IDS["Ben"], "attributes": {"name": "Ben"}},
+                "resource": {"id": "", "attributes": {"name": ""}},
+                "action": {"id": "", "attributes": {"method": "print"}},
+                "context": {}
+            },
+            {
+                "subject": {"id": "", "attributes": {"roles": ["employee", "manager"]}},
+                "resource": {"id": "", "attributes": {"name": "doc:confidential:sales:I3462"}},
+                "action": {"id": "", "attributes": {"method": "get"}},
+                "context": {}
+            },
+            {
+                "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "max"}},
+                "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+                "action": {"id": "", "attributes": {"method": "update"}},
+                "context": {}
+            },
+        ]
+    ]
+    pdp = PDP(st, algorithm, [EmailsAttributeProvider()])
+    expected = [pdp.is_allowed(request) for request in requests]
+    st.target_calls.clear()
+
+    assert pdp.is_allowed_many(requests) == expected
+    assert pdp.is_allowed_many(iter(requests)) == expected
+    # Storage queried once per distinct target triple in each batch
+    assert len(st.target_calls) == 2 * 3
+    assert pdp.is_allowed_many([]) == []
+
+
+def test_is_allowed_many_error(st):
+    g = PDP(st)
+    with pytest.raises(TypeError):
+        g.is_allowed_many([None])
+
+
+def test_is_allowed_with_cache():
+    st = CountingMemoryStorage()
+    for policy_json in POLICIES:
+        st.add(Policy.from_json(policy_json))
+    allowed_json = {
+        "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max"}},
+        "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+        "action": {"id": "", "attributes": {"method": "update"}},
+        "context": {}
+    }
+    denied_json = {
+        "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max"}},
+        "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+        "action": {"id": "", "attributes": {"method": "print"}},
+        "context": {}
+    }
+    pdp = PDP(st, EvaluationAlgorithm.DENY_OVERRIDES, [EmailsAttributeProvider()],
+              cache=DecisionCache(max_size=10, ttl=60))
+    for _ in range(3):
+        assert pdp.is_allowed(AccessRequest.from_json(allowed_json))
+        assert not pdp.is_allowed(AccessRequest.from_json(denied_json))
+    # Storage queried only on cache misses
+    assert len(st.target_calls) == 2
+    assert pdp.cache.hits == 4
+    assert pdp.cache.misses == 2
+
+    requests = [AccessRequest.from_json(denied_json), AccessRequest.from_json(allowed_json)]
+    assert pdp.is_allowed_many(requests) == [False, True]
+    assert len(st.target_calls) == 2
+
+    pdp.cache.clear()
+    assert pdp.is_allowed(AccessRequest.from_json(allowed_json))
+    assert len(st.target_calls) == 3
+
+
+@pytest.mark.parametrize("algorithm", list(EvaluationAlgorithm))
+def test_is_allowed_with_attribute_cache(algorithm):
+    st = CountingMemoryStorage()
+    for policy_json in POLICIES:
+        st.add(Policy.from_json(policy_json))
+    request_json = {
+        "subject": {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max"}},
+        "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+        "action": {"id": "", "attributes": {"method": "get"}},
+        "context": {"ip": "127.0.0.1"}
+    }
+    pdp = PDP(st, algorithm, [EmailsAttributeProvider()], cache=AttributeDecisionCache(max_size=10, ttl=60))
+    assert pdp.is_allowed(AccessRequest.from_json(request_json))
+    # Requests differing only in attributes not read by policies share the decision
+    for idx in range(3):
+        irrelevant_json = dict(request_json, context={"ip": "127.0.0.1", "request_id": idx, "ts": {"at": idx}})
+        irrelevant_json["subject"] = {"id": SUBJECT_IDS["Max"], "attributes": {"name": "Max", "age": idx}}
+        assert pdp.is_allowed(AccessRequest.from_json(irrelevant_json))
+    assert pdp.cache.hits == 3 and pdp.cache.misses == 1
+    # Storage is not queried on cache hits
+    assert len(st.target_calls) == 1
+
+    # Requests differing in attributes read by policies are evaluated
+    relevant_json = dict(request_json, context={"ip": "127.0.0.2"})
+    assert not pdp.is_allowed(AccessRequest.from_json(relevant_json))
+    relevant_json = dict(request_json, action={"id": "", "attributes": {"method": "print"}})
+    assert not pdp.is_allowed(AccessRequest.from_json(relevant_json))
+    assert pdp.cache.misses == 3
+    assert len(st.target_calls) == 3
+
+    # Requests for other targets are evaluated
+    other_json = dict(request_json, subject={"id": SUBJECT_IDS["Nina"], "attributes": {"name": "Nina"}})
+    uncached_pdp = PDP(st, algorithm, [EmailsAttributeProvider()])
+    assert pdp.is_allowed(AccessRequest.from_json(other_json)) == \
+        uncached_pdp.is_allowed(AccessRequest.from_json(other_json))
+    assert len(st.target_calls) == 5
+
+    pdp.cache.clear()
+    assert pdp.is_allowed(AccessRequest.from_json(request_json))
+    assert len(st.target_calls) == 6
+
+
+def test_pdp_cache_error(st):
+    assert PDP(st).cache is None
+    with pytest.raises(TypeError):
+        PDP(st, cache={})
+
+
+class StreamingMemoryStorage(MemoryStorage):
+
+    def __init__(self):
+        super().__init__()
+        self.yielded = []
+        self.closed = False
+
+    def get_for_target(self, subject_id, resource_id, action_id):
+        self.yielded = []
+        self.closed = False
+        try:
+            for policy in super().get_for_target(subject_id, resource_id, action_id):
+                self.yielded.append(policy.uid)
+                yield policy
+        finally:
+            self.closed = True
+
+    def get_for_target_by_priority(self, subject_id, resource_id, action_id):
+        self.yielded = []
+        self.closed = False
+        try:
+            for policy in super().get_for_target_by_priority(subject_id, resource_id, action_id):
+                self.yielded.append(policy.uid)
+                yield policy
+        finally:
+            self.closed = True
+
+
+@pytest.mark.parametrize("algorithm, effects, allowed, num_yielded, num_fitted", [
+    (EvaluationAlgorithm.DENY_OVERRIDES, ["allow", "deny", "deny", "allow"], False, 2, 2),
+    (EvaluationAlgorithm.DENY_OVERRIDES, ["allow", "allow", "allow"], True, 3, 3),
+    (EvaluationAlgorithm.DENY_OVERRIDES, [], False, 0, 0),
+    (EvaluationAlgorithm.ALLOW_OVERRIDES, ["deny", "allow", "deny", "allow"], True, 2, 2),
+    (EvaluationAlgorithm.ALLOW_OVERRIDES, ["deny", "deny"], False, 2, 2),
+    (EvaluationAlgorithm.ALLOW_OVERRIDES, [], False, 0, 0),
+    (EvaluationAlgorithm.HIGHEST_PRIORITY, [], False, 0, 0),
+    (EvaluationAlgorithm.HIGHEST_PRIORITY, [("allow", 1), ("deny", 0), ("deny", 0)], True, 2, 1),
+    (EvaluationAlgorithm.HIGHEST_PRIORITY, [("allow", 2), ("allow", 2), ("deny", 1)], True, 3, 2),
+    (EvaluationAlgorithm.HIGHEST_PRIORITY, [("deny", 0), ("allow", 2), ("deny", 2), ("allow", 2)], False, 4, 3),
+    (EvaluationAlgorithm.HIGHEST_PRIORITY, [("allow", 10)] + [("deny", 1, "Nina")] * 1000, True, 2, 1),
+    (EvaluationAlgorithm.HIGHEST_PRIORITY, [("deny", 10, "Nina"), ("allow", 5)] + [("deny", 1)] * 10, True, 3, 2),
+])
+def test_is_allowed_short_circuits(monkeypatch, algorithm, effects, allowed, num_yielded, num_fitted):
+    fitted = []
+    fits = Policy.fits
+
+    def counting_fits(policy, ctx):
+        fitted.append(policy.uid)
+        return fits(policy, ctx)
+
+    monkeypatch.setattr(Policy, "fits", counting_fits)
+    st = StreamingMemoryStorage()
+    for idx, effect in enumerate(effects):
+        effect, priority, name = (effect + ("Max",))[:3] if isinstance(effect, tuple) else (effect, 0, "Max")
+        st.add(Policy.from_json({
+            "uid": str(idx),
+            "rules": {"subject": {"$.name": {"condition": "Equals", "value": name}}},
+            "targets": {},
+            "effect": effect,
+            "priority": priority
+        }))
+    request = AccessRequest.from_json({
+        "subject": {"id": "a", "attributes": {"name": "Max"}},
+        "resource": {"id": "b"},
+        "action": {"id": "c"},
+        "context": {}
+    })
+    pdp = PDP(st, algorithm)
+    assert pdp.is_allowed(request) == allowed
+    # Remaining policies are neither retrieved nor evaluated once decision is known
+    assert len(st.yielded) == num_yielded
+    assert len(fitted) == num_fitted
+    assert st.closed
+
+
+class UnorderedMemoryStorage(MemoryStorage):
+
+    def get_for_target_by_priority(self, subject_id, resource_id, action_id):
+        # Policies in ascending order of priority
+        return reversed(list(super().get_for_target_by_priority(subject_id, resource_id, action_id)))
+
+
+@pytest.mark.parametrize("effects, allowed", [
+    ([("deny", 1), ("allow", 10)], True),
+    ([("allow", 1), ("deny", 10)], False),
+    ([("allow", 1), ("deny", 1), ("allow", 5), ("allow", 10)], True),
+    ([("deny", 1), ("allow", 10), ("deny", 10)], False),
+])
+def test_is_allowed_highest_priority_out_of_order(effects, allowed):
+    st = UnorderedMemoryStorage()
+    for idx, (effect, priority) in enumerate(effects):
+        st.add(Policy.from_json({"uid": str(idx), "rules": {}, "targets": {}, "effect": effect, "priority": priority}))
+    request = AccessRequest.from_json({
+        "subject": {"id": "a"},
+        "resource": {"id": "b"},
+        "action": {"id": "c"},
+        "context": {}
+    })
+    pdp = PDP(st, EvaluationAlgorithm.HIGHEST_PRIORITY)
+    assert pdp.is_allowed(request) == allowed
+
+
+class BulkEmailsAttributeProvider(EmailsAttributeProvider):
+
+    def __init__(self):
+        self.single_calls = []
+        self.bulk_calls = []
+
+    def get_attribute_value(self, ace: str, attribute_path: str, ctx):
+        self.single_calls.append((ace, attribute_path))
+        return super().get_attribute_value(ace, attribute_path, ctx)
+
+    def get_attribute_values(self, keys, ctx):
+        self.bulk_calls.append(list(keys))
+        values = {key: super(BulkEmailsAttributeProvider, self).get_attribute_value(key[0], key[1], ctx)
+                  for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+
+
+@pytest.mark.parametrize("algorithm", list(EvaluationAlgorithm))
+@pytest.mark.parametrize("compile_policies", [False, True])
+def test_is_allowed_with_prefetch(st, algorithm, compile_policies):
+    requests_json = [
+        {
+            "subject": {"id": SUBJECT_IDS[name], "attributes": {"name": name}},
+            "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+            "action": {"id": "", "attributes": {"method": method}},
+            "context": {"ip": "127.0.0.1"}
+        }
+        for name in SUBJECT_IDS for method in ["get", "print", "update"]
+    ]
+    pdp = PDP(st, algorithm, [EmailsAttributeProvider()], compile_policies=compile_policies)
+    provider = BulkEmailsAttributeProvider()
+    prefetch_pdp = PDP(st, algorithm, [provider], compile_policies=compile_policies, prefetch_attributes=True)
+    for request_json in requests_json:
+        request = AccessRequest.from_json(request_json)
+        provider.bulk_calls.clear()
+        assert prefetch_pdp.is_allowed(request) == pdp.is_allowed(request)
+        # Attributes of policies matching targets missing from request are prefetched in a single call
+        assert len(provider.bulk_calls) == 1
+        assert ("subject", "$.roles") in provider.bulk_calls[0]
+        assert ("subject", "$.name") not in provider.bulk_calls[0]
+        assert (("subject", "$.email") in provider.bulk_calls[0]) == (request_json["subject"]["id"] == SUBJECT_IDS["Ben"])
+    # Attribute values are never retrieved one at a time
+    assert provider.single_calls == []
+
+
+class SlowEmailsAttributeProvider(EmailsAttributeProvider):
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.threads = set()
+
+    def get_attribute_value(self, ace: str, attribute_path: str, ctx):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        return super().get_attribute_value(ace, attribute_path, ctx)
+
+
+@pytest.mark.parametrize("algorithm", list(EvaluationAlgorithm))
+@pytest.mark.parametrize("prefetch_attributes", [False, True])
+def test_is_allowed_with_executor(st, algorithm, prefetch_attributes):
+    requests_json = [
+        {
+            "subject": {"id": SUBJECT_IDS[name], "attributes": {"name": name}},
+            "resource": {"id": "", "attributes": {"name": "myrn:example.com:resource:123"}},
+            "action": {"id": "", "attributes": {"method": method}},
+            "context": {"ip": "127.0.0.1"}
+        }
+        for name in SUBJECT_IDS for method in ["get", "print", "update"]
+    ]
+    pdp = PDP(st, algorithm, [EmailsAttributeProvider()])
+    provider = SlowEmailsAttributeProvider(0)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        concurrent_pdp = PDP(st, algorithm, [provider], prefetch_attributes=prefetch_attributes,
+                             executor=executor, timeout=10)
+        for request_json in requests_json:
+            request = AccessRequest.from_json(request_json)
+            assert concurrent_pdp.is_allowed(request) == pdp.is_allowed(request)
+    # Attribute values are retrieved by the executor
+    assert threading.get_ident() not in provider.threads
+
+
+def test_is_allowed_with_executor_concurrent(st):
+    # Ben's email and roles are both missing from the request
+    request = AccessRequest.from_json({
+        "subject": {"id": SUBJECT_IDS["Ben"], "attributes": {"name": "Ben"}},
+        "resource": {"id": "", "attributes": {"name": "doc"}},
+        "action": {"id": "", "attributes": {"method": "print"}},
+        "context": {}
+    })
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pdp = PDP(st, providers=[SlowEmailsAttributeProvider(0.2)], executor=executor)
+        start = time.monotonic()
+        assert pdp.is_allowed(request)
+        # Lookups are made concurrently instead of one after the other
+        assert time.monotonic() - start < 0.35
+
+
+@pytest.mark.parametrize("timeout_decision", [False, True])
+def test_is_allowed_with_executor_timeout(st, timeout_decision):
+    request = AccessRequest.from_json({
+        "subject": {"id": SUBJECT_IDS["Ben"], "attributes": {"name": "Ben"}},
+        "resource": {"id": "", "attributes": {"name": "doc"}},
+        "action": {"id": "", "attributes": {"method": "get"}},
+        "context": {}
+    })
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for cache in [None, DecisionCache(), AttributeDecisionCache()]:
+            pdp = PDP(st, providers=[SlowEmailsAttributeProvider(0.3)], cache=cache, executor=executor,
+                      timeout=0.05, timeout_decision=timeout_decision)
+            start = time.monotonic()
+            assert pdp.is_allowed(request) == timeout_decision
+            assert time.monotonic() - start < 0.25
+            # Timeout decisions are not cached
+            if cache is not None:
+                assert len(cache) == 0
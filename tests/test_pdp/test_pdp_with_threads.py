@@ -0,0 +1,116 @@
+"""
+    PDP tests with a single PDP shared by multiple threads
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from py_abac.pdp import PDP, EvaluationAlgorithm
+from py_abac.policy import Policy
+from py_abac.request import AccessRequest
+from py_abac.storage.memory import MemoryStorage
+
+from .test_pdp_with_memory import POLICIES, SUBJECT_IDS
+
+OWNER_POLICIES = [
+    {
+        "uid": "owner",
+        "description": "Owners are allowed to update their resources from the private network.",
+        "effect": "allow",
+        "rules": {
+            "subject": {"$.name": {"condition": "EqualsAttribute", "ace": "resource", "path": "$.owner"}},
+            "resource": {"$.tags": {"condition": "AnyInAttribute", "ace": "subject", "path": "$.teams"}},
+            "action": {"$.method": {"condition": "Equals", "value": "update"}},
+            "context": {"$.ip": {"condition": "CIDR", "value": "10.0.0.0/8"}}
+        },
+        "targets": {},
+        "priority": 1
+    },
+    {
+        "uid": "not-owner",
+        "description": "Non owners are not allowed to update resources.",
+        "effect": "deny",
+        "rules": {
+            "subject": {"$.name": {"condition": "NotEqualsAttribute", "ace": "resource", "path": "$.owner"}},
+            "action": {"$.method": {"condition": "Equals", "value": "update"}}
+        },
+        "targets": {},
+        "priority": 1
+    },
+]
+NUM_THREADS = 8
+NUM_ROUNDS = 5
+
+
+def create_requests():
+    """
+        Create access requests which alternately should be allowed and denied
+    """
+    requests = []
+    names = list(SUBJECT_IDS)
+    for idx, name in enumerate(names * 4):
+        owner = names[(idx + (idx % 2)) % len(names)]
+        for method in ("get", "update", "print"):
+            requests.append(AccessRequest.from_json({
+                "subject": {
+                    "id": SUBJECT_IDS[name],
+                    "attributes": {"name": name, "teams": ["team:{}".format(idx % 3)]}
+                },
+                "resource": {
+                    "id": "myrn:example.com:resource:{}".format(idx),
+                    "attributes": {
+                        "name": "myrn:example.com:resource:123",
+                        "owner": owner,
+                        "tags": ["team:{}".format(idx % 3), "team:x"]
+                    }
+                },
+                "action": {"id": "", "attributes": {"method": method}},
+                "context": {"ip": "10.0.0.{}".format(idx) if idx % 4 else "127.0.0.1"}
+            }))
+    return requests
+
+
+@pytest.fixture
+def st():
+    storage = MemoryStorage()
+    for policy_json in POLICIES + OWNER_POLICIES:
+        storage.add(Policy.from_json(policy_json))
+    yield storage
+
+
+@pytest.fixture
+def switch_interval():
+    # Switch threads as often as possible to interleave policy evaluations
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.parametrize("compile_policies", [False, True])
+@pytest.mark.parametrize("algorithm", [
+    EvaluationAlgorithm.DENY_OVERRIDES,
+    EvaluationAlgorithm.ALLOW_OVERRIDES,
+    EvaluationAlgorithm.HIGHEST_PRIORITY,
+])
+def test_is_allowed_concurrently(st, switch_interval, algorithm, compile_policies):
+    pdp = PDP(st, algorithm, compile_policies=compile_policies)
+    requests = create_requests()
+    expected = [pdp.is_allowed(request) for request in requests]
+    # Both decisions should be exercised by the requests
+    assert any(expected) and not all(expected)
+
+    def run(offset):
+        # Each thread evaluates the requests in a different order
+        ordered = requests[offset:] + requests[:offset]
+        decisions = [pdp.is_allowed(request) for _ in range(NUM_ROUNDS) for request in ordered]
+        return offset, decisions
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = list(executor.map(run, range(NUM_THREADS)))
+
+    for offset, decisions in results:
+        ordered = expected[offset:] + expected[:offset]
+        assert decisions == ordered * NUM_ROUNDS
@@ -149,6 +149,7 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
 
     @pytest.mark.parametrize("condition, what, result", [
         (NotEqualsAttribute("subject", "$.what"), "test", False),
@@ -165,6 +166,7 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
 
     @pytest.mark.parametrize("condition, what, result", [
         (IsInAttribute("subject", "$.what"), "test", False),
@@ -181,6 +183,7 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
 
     @pytest.mark.parametrize("condition, what, result", [
         (IsNotInAttribute("subject", "$.what"), "test", False),
@@ -197,6 +200,7 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
 
     @pytest.mark.parametrize("condition, what, result", [
         (AllInAttribute("subject", "$.what"), "test", False),
@@ -215,6 +219,7 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
 
     @pytest.mark.parametrize("condition, what, result", [
         (AllNotInAttribute("subject", "$.what"), "test", False),
@@ -233,6 +238,7 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
 
     @pytest.mark.parametrize("condition, what, result", [
         (AnyInAttribute("subject", "$.what"), "test", False),
@@ -251,6 +257,7 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
 
     @pytest.mark.parametrize("condition, what, result", [
         (AnyNotInAttribute("subject", "$.what"), "test", False),
@@ -269,3 +276,4 @@ class TestAttributeCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
@@ -72,6 +72,9 @@ class TestCollectionCondition(object):
         (AllIn([3, 2]), [1, 2], False),
         (AllIn([1, 2, 3]), [1, 2], True),
         (AllIn([1, 2, 3]), None, False),
+        (AllIn([1, {"a": 1}]), [1, {"a": 1}], True),
+        (AllIn([1, {"a": 1}]), [{"a": 2}], False),
+        (AllIn([1, [2]]), [[2]], True),
 
         (AllNotIn([]), 1, False),
         (AllNotIn([]), [], False),
@@ -81,6 +84,7 @@ class TestCollectionCondition(object):
         (AllNotIn([3, 2]), [1, 2], True),
         (AllNotIn([1, 2, 3]), [1, 2], False),
         (AllNotIn([1, 2, 3]), None, False),
+        (AllNotIn([1, {"a": 1}]), [{"a": 2}], True),
 
         (AnyIn([]), 1, False),
         (AnyIn([]), [], False),
@@ -90,6 +94,9 @@ class TestCollectionCondition(object):
         (AnyIn([3, 2]), [1, 4], False),
         (AnyIn([1, 2, 3]), [1, 2], True),
         (AnyIn([1, 2, 3]), None, False),
+        (AnyIn([1, {"a": 1}]), [{"a": 1}, 3], True),
+        (AnyIn([1, {"a": 1}]), [{"a": 2}, 3], False),
+        (AnyIn(["id-{}".format(idx) for idx in range(10000)]), ["id-9999"], True),
 
         (AnyNotIn([]), 1, False),
         (AnyNotIn([]), [], True),
@@ -99,16 +106,22 @@ class TestCollectionCondition(object):
         (AnyNotIn([3, 2]), [1, 4], True),
         (AnyNotIn([1, 2, 3]), [1, 2], False),
         (AnyNotIn([1, 2, 3]), None, False),
+        (AnyNotIn([1, {"a": 1}]), [{"a": 1}], False),
 
         (IsIn([]), [], False),
         (IsIn([1, 2, 3]), 1, True),
         (IsIn([1, 2, 3]), 4, False),
         (IsIn([1, 2, 3]), None, False),
+        (IsIn([1, {"a": 1}]), {"a": 1}, True),
+        (IsIn([1, [2]]), [2], True),
+        (IsIn([1, [2]]), [3], False),
 
         (IsNotIn([]), [], True),
         (IsNotIn([1, 2, 3]), 1, False),
         (IsNotIn([1, 2, 3]), 4, True),
         (IsNotIn([1, 2, 3]), None, True),
+        (IsNotIn([1, {"a": 1}]), {"a": 1}, False),
+        (IsNotIn([1, {"a": 1}]), {"a": 2}, True),
 
         (IsEmpty(), [], True),
         (IsEmpty(), [1], False),
@@ -124,3 +137,12 @@ class TestCollectionCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
+
+    def test_values(self):
+        condition = IsIn([1, 2])
+        condition.values = [3, {"a": 1}]
+        assert condition.values == [3, {"a": 1}]
+        assert condition.evaluate(3, None)
+        assert condition.evaluate({"a": 1}, None)
+        assert not condition.evaluate(1, None)
@@ -0,0 +1,55 @@
+"""
+    Condition index tests
+"""
+
+import gc
+
+from py_abac.policy.conditions.index import ConditionIndex, get_condition_index
+
+
+class EqualsIndex(ConditionIndex):
+    """
+        Index of string values counting the built tables
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.num_builds = 0
+
+    def _build(self, keys):
+        self.num_builds += 1
+        return frozenset(keys)
+
+    def _find(self, table, what):
+        return table.intersection([what])
+
+
+def test_get_condition_index():
+    index = get_condition_index(EqualsIndex, "subject", "$.name")
+    assert isinstance(index, EqualsIndex)
+    assert get_condition_index(EqualsIndex, "subject", "$.name") is index
+    assert get_condition_index(EqualsIndex, "resource", "$.name") is not index
+
+
+def test_condition_index():
+    index = EqualsIndex()
+    predicate = index.compile("a", str)
+    other_predicate = index.compile("b", str)
+    assert len(index) == 2
+    assert predicate("a", None)
+    assert not other_predicate("a", None)
+    assert not predicate(1, None)
+    assert index.last_lookup == ("a", {"a"})
+    assert index.num_builds == 1
+    # Table is rebuilt once keys change
+    new_predicate = index.compile("c", str)
+    assert index.last_lookup is None
+    assert new_predicate("c", None)
+    assert not predicate("c", None)
+    assert index.num_builds == 2
+    # Keys are removed along with the predicates
+    del predicate, new_predicate
+    gc.collect()
+    assert len(index) == 1
+    assert other_predicate("b", None)
+    assert index.num_builds == 3
@@ -109,3 +109,4 @@ class TestLogicCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
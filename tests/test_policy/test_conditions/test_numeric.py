@@ -106,3 +106,4 @@ class TestNumericCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
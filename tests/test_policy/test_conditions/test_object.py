@@ -53,3 +53,4 @@ class TestCollectionCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
@@ -2,6 +2,8 @@
     Other condition tests
 """
 
+import gc
+
 import pytest
 from marshmallow import ValidationError
 
@@ -10,6 +12,8 @@ from py_abac.policy.conditions.others import Any
 from py_abac.policy.conditions.others import CIDR
 from py_abac.policy.conditions.others import Exists
 from py_abac.policy.conditions.others import NotExists
+from py_abac.policy.conditions.index import get_condition_index
+from py_abac.policy.conditions.others.cidr import CIDRIndex
 from py_abac.policy.conditions.schema import ConditionSchema
 from py_abac.request import AccessRequest
 
@@ -49,6 +53,13 @@ class TestOtherCondition(object):
         (CIDR("127.0.0.0/24"), "127.0.0.1", True),
         (CIDR("127.0.0.0/24"), ")", False),
         (CIDR("127.0.0.0/24"), None, False),
+        (CIDR("127.0.0.1/24"), "127.0.0.1", False),
+        (CIDR("127.0.0.0/24"), "::ffff:127.0.0.1", False),
+        (CIDR("0.0.0.0/0"), "255.255.255.255", True),
+        (CIDR("2001:db8::/32"), "2001:db8:1::1", True),
+        (CIDR("2001:db8::/32"), "2001:db9::1", False),
+        (CIDR("2001:db8::/32"), "10.0.0.1", False),
+        (CIDR("::/0"), "::1", True),
 
         (Exists(), None, False),
         (Exists(), 1.0, True),
@@ -69,3 +80,46 @@ class TestOtherCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
+        assert condition.compile_for(ctx.ace, ctx.attribute_path)(ctx.attribute_value, ctx) == result
+
+    def test_cidr_value(self):
+        condition = CIDR("127.0.0.0/24")
+        condition.value = "10.0.0.0/8"
+        assert condition.evaluate("10.1.2.3", None)
+        assert not condition.evaluate("127.0.0.1", None)
+
+
+def test_cidr_index():
+    networks = ["10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "192.168.0.0/16",
+                "2001:db8::/32", "2001:db8:1::/48", "invalid"]
+    conditions = [CIDR(network) for network in networks]
+    predicates = [condition.compile_for("context", "$.cidr_index") for condition in conditions]
+    index = get_condition_index(CIDRIndex, "context", "$.cidr_index")
+    assert len(index) == 6
+    for what in ["10.1.2.3", "10.1.3.3", "10.2.0.1", "192.168.1.1", "172.16.0.1",
+                 "2001:db8:1::1", "2001:db8:2::1", "::1", "invalid", 1]:
+        expected = [condition.evaluate(what, None) for condition in conditions]
+        # Evaluated twice to check the last lookup
+        for _ in range(2):
+            assert [predicate(what, None) for predicate in predicates] == expected
+    assert len(index.lookup("10.1.2.3")) == 3
+    assert len(index.lookup("2001:db8:1::1")) == 2
+
+
+def test_cidr_index_changes():
+    index = get_condition_index(CIDRIndex, "context", "$.cidr_index_changes")
+    predicate = CIDR("10.0.0.0/8").compile_for("context", "$.cidr_index_changes")
+    other_predicate = CIDR("10.0.0.0/8").compile_for("context", "$.cidr_index_changes")
+    assert predicate("10.1.2.3", None)
+    assert len(index) == 1
+    # Networks added after a lookup are found
+    narrow_predicate = CIDR("10.1.0.0/16").compile_for("context", "$.cidr_index_changes")
+    assert narrow_predicate("10.1.2.3", None)
+    assert len(index) == 2
+    # Networks are removed once not used by any predicate
+    del predicate, narrow_predicate
+    gc.collect()
+    assert len(index) == 1
+    assert other_predicate("10.1.2.3", None)
+    assert index.lookup("10.1.2.3") == {(4, 8, 10)}
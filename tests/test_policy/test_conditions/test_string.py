@@ -14,6 +14,10 @@ from py_abac.policy.conditions.string import NotContains
 from py_abac.policy.conditions.string import NotEquals
 from py_abac.policy.conditions.string import RegexMatch
 from py_abac.policy.conditions.string import StartsWith
+from py_abac.policy.conditions.index import get_condition_index
+from py_abac.policy.conditions.string.regex_match import compile_regex
+from py_abac.policy.conditions.string.trie import PrefixIndex, SuffixIndex, SubstringIndex
+from py_abac.policy.conditions.string.trie import build_automaton, scan_automaton
 from py_abac.request import AccessRequest
 
 
@@ -38,7 +42,9 @@ class TestStringCondition(object):
         (EndsWith("2"), {"condition": "EndsWith", "value": "2", "case_insensitive": False}),
         (EndsWith("2", case_insensitive=True),
          {"condition": "EndsWith", "value": "2", "case_insensitive": True}),
-        (RegexMatch("2"), {"condition": "RegexMatch", "value": "2"}),
+        (RegexMatch("2"), {"condition": "RegexMatch", "value": "2", "case_insensitive": False}),
+        (RegexMatch("2", case_insensitive=True),
+         {"condition": "RegexMatch", "value": "2", "case_insensitive": True}),
     ])
     def test_to_json(self, condition, condition_json):
         assert ConditionSchema().dump(condition) == condition_json
@@ -63,6 +69,8 @@ class TestStringCondition(object):
         (EndsWith("2", case_insensitive=True),
          {"condition": "EndsWith", "value": "2", "case_insensitive": True}),
         (RegexMatch("2"), {"condition": "RegexMatch", "value": "2"}),
+        (RegexMatch("2", case_insensitive=True),
+         {"condition": "RegexMatch", "value": "2", "case_insensitive": True}),
     ])
     def test_from_json(self, condition, condition_json):
         new_condition = ConditionSchema().load(condition_json)
@@ -84,6 +92,7 @@ class TestStringCondition(object):
         (EndsWith, {"condition": "EndsWith", "value": (), "case_insensitive": False}),
         (EndsWith, {"condition": "EndsWith", "value": "2", "case_insensitive": ()}),
         (RegexMatch, {"condition": "RegexMatch", "value": "("}),
+        (RegexMatch, {"condition": "RegexMatch", "value": "2", "case_insensitive": []}),
     ])
     def test_create_error(self, condition_type, data):
         with pytest.raises(ValidationError):
@@ -120,6 +129,8 @@ class TestStringCondition(object):
         (StartsWith("ab"), "ab", True),
         (StartsWith("ab"), "cab", False),
         (StartsWith("ab"), None, False),
+        (StartsWith(""), "abc", True),
+        (StartsWith("abcd"), "abc", False),
 
         (EndsWith("ab"), "abc", False),
         (EndsWith("ab"), "ab", True),
@@ -127,6 +138,8 @@ class TestStringCondition(object):
         (EndsWith("AB"), "cab", False),
         (EndsWith("AB", True), "cab", True),
         (EndsWith("AB", True), None, False),
+        (EndsWith(""), "abc", True),
+        (EndsWith("zabc"), "abc", False),
 
         (RegexMatch(".*"), "foo", True),
         (RegexMatch("abc"), "abc", True),
@@ -136,6 +149,9 @@ class TestStringCondition(object):
         (RegexMatch(r"^python\?exe"), "python?exe", True),
         (RegexMatch(r"^python?exe"), "python?exe", False),
         (RegexMatch(r"^python?exe"), None, False),
+        (RegexMatch("^ABC"), "abc", False),
+        (RegexMatch("^ABC", True), "abcd", True),
+        (RegexMatch("^ABC", True), "xabc", False),
     ])
     def test_is_satisfied(self, condition, what, result):
         request = AccessRequest(subject={"attributes": {"what": what}}, resource={}, action={}, context={})
@@ -143,3 +159,55 @@ class TestStringCondition(object):
         ctx.ace = "subject"
         ctx.attribute_path = "$.what"
         assert condition.is_satisfied(ctx) == result
+        assert condition.compile()(ctx.attribute_value, ctx) == result
+        assert condition.compile_for(ctx.ace, ctx.attribute_path)(ctx.attribute_value, ctx) == result
+
+    def test_regex_match_recompiled(self):
+        condition = RegexMatch("^abc$")
+        assert not condition.evaluate("ABC", None)
+        condition.case_insensitive = True
+        assert condition.evaluate("ABC", None)
+        condition.value = "^abd$"
+        assert not condition.evaluate("ABC", None)
+        assert condition.evaluate("ABD", None)
+
+    def test_regex_match_shares_regexes(self):
+        conditions = [ConditionSchema().load({"condition": "RegexMatch", "value": "^dep-1$"}) for _ in range(3)]
+        assert conditions[0]._regex is conditions[1]._regex is conditions[2]._regex
+        assert conditions[0]._regex is compile_regex("^dep-1$", False)
+        assert RegexMatch("^dep-1$", True)._regex is not conditions[0]._regex
+
+
+@pytest.mark.parametrize("condition_type, index_type, values", [
+    (StartsWith, PrefixIndex, ["", "/", "/docs", "/docs/", "/docs/a", "/DOCS/", "/Docs/a", "/private/"]),
+    (EndsWith, SuffixIndex, ["", "t", ".txt", "a.txt", ".TXT", "A.Txt", ".pdf"]),
+    (Contains, SubstringIndex, ["", "/", "docs", "DOCS", "DOCS/a", "s/a.t", "a.txt", "/private/", "xyz"]),
+    (NotContains, SubstringIndex, ["", "/", "docs", "DOCS", "DOCS/a", "s/a.t", "a.txt", "/private/", "xyz"]),
+])
+def test_trie_index(condition_type, index_type, values):
+    attribute_path = "$.trie_index_{}".format(condition_type.__name__)
+    conditions = [condition_type(value, case_insensitive)
+                  for value in values for case_insensitive in (False, True)]
+    predicates = [condition.compile_for("resource", attribute_path) for condition in conditions]
+    # Conditions with the same key share the index entry
+    assert len(get_condition_index(index_type, "resource", attribute_path)) < len(conditions)
+    for what in ["/docs/a.txt", "/DOCS/A.TXT", "/Docs/a.Txt", "/private/b.pdf", "", "t", None]:
+        expected = [condition.evaluate(what, None) for condition in conditions]
+        assert [predicate(what, None) for predicate in predicates] == expected
+
+
+def test_substring_index_shared():
+    contains = Contains("docs", case_insensitive=True).compile_for("resource", "$.substring_index")
+    not_contains = NotContains("DOCS", case_insensitive=True).compile_for("resource", "$.substring_index")
+    assert len(get_condition_index(SubstringIndex, "resource", "$.substring_index")) == 1
+    assert contains("/Docs/a", None) and not not_contains("/Docs/a", None)
+    assert not contains("/private", None) and not_contains("/private", None)
+
+
+def test_aho_corasick_automaton():
+    keys = [(False, value) for value in ["he", "she", "his", "hers", "e", "r"]]
+    automaton = build_automaton(keys)
+    assert sorted(set(scan_automaton(automaton, "ushers"))) == sorted([(False, "he"), (False, "she"), (False, "hers"),
+                                                                        (False, "e"), (False, "r")])
+    assert scan_automaton(automaton, "ahi") == []
+    assert scan_automaton(build_automaton([(False, "")]), "") == [(False, "")]
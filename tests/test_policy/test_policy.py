@@ -8,7 +8,7 @@ import pytest
 
 from py_abac.context import EvaluationContext
 from py_abac.exceptions import PolicyCreateError
-from py_abac.policy import Policy
+from py_abac.policy import Policy, get_required_attributes
 from py_abac.policy.conditions.numeric import Eq
 from py_abac.policy.conditions.string import Equals
 from py_abac.policy.rules import Rules
@@ -344,3 +344,124 @@ class TestPolicy(object):
         ctx = EvaluationContext(AccessRequest.from_json(request_json))
         policy = Policy.from_json(policy_json)
         assert policy.fits(ctx) == result
+        assert policy.compile()(ctx) == result
+        lazy_policy = Policy.from_json(policy_json, lazy=True)
+        assert lazy_policy.fits(ctx) == result
+        assert Policy.from_json(policy_json, lazy=True).compile()(ctx) == result
+
+    def test_compile_cached(self):
+        policy = Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny"})
+        compiled = policy.compile()
+        assert policy.compile() is compiled
+        # Replacing rules or targets discards compiled policy
+        policy.rules = Policy.from_json({
+            "uid": "1",
+            "rules": {"subject": {"$.name": {"condition": "Equals", "value": "Max"}}},
+            "targets": {},
+            "effect": "deny"
+        }).rules
+        assert policy.compile() is not compiled
+        ctx = EvaluationContext(AccessRequest.from_json({
+            "subject": {"id": "a", "attributes": {"name": "Nina"}},
+            "resource": {"id": "b"},
+            "action": {"id": "c"},
+            "context": {}
+        }))
+        assert not policy.compile()(ctx)
+        compiled = policy.compile()
+        policy.targets = Policy.from_json({"uid": "1", "rules": {}, "targets": {"subject_id": "x"},
+                                           "effect": "deny"}).targets
+        assert policy.compile() is not compiled
+
+    def test_create_lazy(self):
+        policy_json = {
+            "uid": "1",
+            "description": "Lazy policy create test",
+            "rules": {
+                "subject": {"$.uid": {"condition": "Eq", "value": 1.0}},
+                "resource": [{"$.name": {"condition": "Equals", "value": "test", "case_insensitive": False}}],
+                "action": {},
+                "context": {}
+            },
+            "targets": {"subject_id": ["abc", "a*"], "resource_id": ["123"], "action_id": "*"},
+            "effect": "deny",
+            "priority": 2
+        }
+        policy = Policy.from_json(policy_json, lazy=True)
+        assert policy.targets.subject_id == ["abc", "a*"]
+        assert policy.effect == "deny" and policy.priority == 2
+        # Rules are decoded on first access
+        assert policy._rules is None
+        assert isinstance(policy.rules, Rules)
+        assert isinstance(policy.rules.subject["$.uid"], Eq)
+        assert policy.to_json() == policy_json
+
+    def test_create_lazy_error(self):
+        policy_json = {"uid": "1", "rules": {"subject": {"$.uid": {"condition": "Eqs", "value": 1.0}}},
+                       "targets": {}, "effect": "deny"}
+        policy = Policy.from_json(policy_json, lazy=True)
+        with pytest.raises(PolicyCreateError):
+            policy.rules
+        # Targets, effect and priority are validated on creation
+        for changes in [{"targets": {"subject_id": None}}, {"effect": "test"}, {"priority": -1}, {"rules": None}]:
+            with pytest.raises(PolicyCreateError):
+                Policy.from_json(dict(policy_json, **changes), lazy=True)
+
+    def test_fits_targets_first(self):
+        policy_json = {"uid": "1", "rules": {"subject": {"$.name": {"condition": "Equals", "value": "Max"}}},
+                       "targets": {"subject_id": "user::*"}, "effect": "deny"}
+        ctx = EvaluationContext(AccessRequest.from_json({
+            "subject": {"id": "service::1", "attributes": {"name": "Max"}},
+            "resource": {"id": "b"},
+            "action": {"id": "c"},
+            "context": {}
+        }))
+        # Rules are not decoded for requests not matching targets
+        policy = Policy.from_json(policy_json, lazy=True)
+        assert not policy.fits(ctx)
+        assert not policy.compile()(ctx)
+        assert policy._rules is None
+        ctx = EvaluationContext(AccessRequest.from_json({
+            "subject": {"id": "user::1", "attributes": {"name": "Max"}},
+            "resource": {"id": "b"},
+            "action": {"id": "c"},
+            "context": {}
+        }))
+        assert policy.compile()(ctx)
+        assert policy._rules is not None
+
+    def test_required_attributes(self):
+        policy_json = {
+            "uid": "1",
+            "rules": {
+                "subject": [{"$.name": {"condition": "Equals", "value": "Max"}},
+                            {"$.roles": {"condition": "AnyOf", "values": [
+                                {"condition": "AnyInAttribute", "ace": "resource", "path": "$.roles"},
+                                {"condition": "Not", "value": {"condition": "AllOf", "values": [
+                                    {"condition": "IsEmpty"},
+                                    {"condition": "EqualsAttribute", "ace": "context", "path": "$.roles"}
+                                ]}}
+                            ]}}],
+                "resource": {"$.owner": {"condition": "NotEqualsAttribute", "ace": "subject", "path": "$.name"}},
+                "action": {"$.method": {"condition": "Not",
+                                        "value": {"condition": "Equals", "value": "delete"}}},
+            },
+            "targets": {},
+            "effect": "allow"
+        }
+        expected = {("subject", "$.name"), ("subject", "$.roles"), ("resource", "$.roles"),
+                    ("context", "$.roles"), ("resource", "$.owner"), ("action", "$.method")}
+        policy = Policy.from_json(policy_json)
+        assert policy.required_attributes == expected
+        # Computed once on load
+        assert policy.required_attributes is policy.required_attributes
+        lazy_policy = Policy.from_json(policy_json, lazy=True)
+        assert lazy_policy.required_attributes == expected
+        assert lazy_policy._rules is not None
+
+        # Analyzed again when rules are re-assigned
+        policy.rules = Policy.from_json({"uid": "2", "rules": {"context": {"$.ip": {"condition": "Exists"}}},
+                                         "targets": {}, "effect": "deny"}).rules
+        assert policy.required_attributes == {("context", "$.ip")}
+        assert get_required_attributes([policy, lazy_policy]) == expected | {("context", "$.ip")}
+        assert get_required_attributes([]) == set()
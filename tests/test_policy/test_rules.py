@@ -141,3 +141,38 @@ def test_is_satisfied(rules_json, result):
     ctx = EvaluationContext(request)
     rules = RulesSchema().load(rules_json)
     assert rules.is_satisfied(ctx) == result
+    assert rules.compile()(ctx) == result
+    # Rules are evaluated without mutating the context
+    assert ctx.ace is None and ctx.attribute_path is None
+
+
+def test_required_attributes():
+    rules_json = {
+        "subject": [{"$.firstName": {"condition": "Equals", "value": "Carl"}},
+                    {"$.lastName": {"condition": "Equals", "value": "Nice"},
+                     "$.firstName": {"condition": "Equals", "value": "Max"}}],
+        "resource": {"$.name": {"condition": "Equals", "value": "Calendar"}},
+        "context": {"$.ip": {"condition": "CIDR", "value": "10.0.0.0/8"}},
+    }
+    rules = RulesSchema().load(rules_json)
+    assert rules.required_attributes == {("subject", "$.firstName"), ("subject", "$.lastName"),
+                                         ("resource", "$.name"), ("context", "$.ip")}
+    assert RulesSchema().load({}).required_attributes == set()
+
+
+def test_compile_for_attribute():
+    # Conditions are compiled for the access control element and attribute they check
+    compiled_for = []
+
+    class RecordingEquals(Equals):
+        def compile_for(self, ace, attribute_path):
+            compiled_for.append((ace, attribute_path))
+            return super().compile_for(ace, attribute_path)
+
+    rules = Rules(subject=[{"$.firstName": RecordingEquals("Carl")}],
+                  resource={"$.name": RecordingEquals("Calendar")}, action={}, context={})
+    request = AccessRequest(subject={"attributes": {"firstName": "Carl"}},
+                            resource={"attributes": {"name": "Calendar"}},
+                            action={}, context={})
+    assert rules.compile()(EvaluationContext(request))
+    assert compiled_for == [("subject", "$.firstName"), ("resource", "$.name")]
@@ -2,11 +2,14 @@
     Policy target tests
 """
 
+import fnmatch
+import itertools
+
 import pytest
 from marshmallow import ValidationError
 
 from py_abac.context import EvaluationContext
-from py_abac.policy.targets import Targets, TargetsSchema
+from py_abac.policy.targets import Targets, TargetsSchema, _compile_matcher
 from py_abac.request import AccessRequest
 
 
@@ -68,3 +71,42 @@ def test_match(targets_json, result):
     ctx = EvaluationContext(request)
     targets = TargetsSchema().load(targets_json)
     assert targets.match(ctx) == result
+    assert targets.compile()(ctx) == result
+
+
+PATTERNS = [
+    "abc", "ab", "a", "ab*", "a*", "abc**", "*c", "*bc", "**b", "*b*", "a*b", "ab*c", "a?c", "[ab]*",
+    "a[!b]c", "[", "a[", "ab[c", "a.c", "a+", "(a)", "a\\nb",
+]
+IDS = ["", "a", "ab", "abc", "acb", "axc", "abcd", "bc", "c", "x", "[", "a[", "ab[c", "abd", "a.c", "a+", "(a)",
+       "a\\nb", "a\nb", "ABC"]
+
+
+@pytest.mark.parametrize("patterns", [[pattern] for pattern in PATTERNS] + [
+    list(patterns) for patterns in itertools.combinations(PATTERNS[::3], 3)
+])
+def test_compiled_matcher(patterns):
+    matcher = _compile_matcher(patterns)
+    for ace_id in IDS:
+        expected = any(fnmatch.fnmatch(ace_id, pattern) for pattern in patterns)
+        assert matcher(ace_id) == expected
+        assert Targets._is_in(patterns, ace_id) == expected
+
+
+@pytest.mark.parametrize("patterns", ["*", "**", ["abc", "*"], ["a?c", "***"]])
+def test_compiled_matcher_match_all(patterns):
+    matcher = _compile_matcher(patterns)
+    assert all(matcher(ace_id) for ace_id in IDS)
+
+
+def test_reassign_ids():
+    targets = TargetsSchema().load({"subject_id": "abc"})
+    ctx = EvaluationContext(AccessRequest.from_json({
+        "subject": {"id": "abd"}, "resource": {"id": "1"}, "action": {"id": "2"}, "context": {}
+    }))
+    assert not targets.match(ctx)
+    # Matchers are compiled again when IDs are re-assigned
+    targets.subject_id = ["abc", "ab?"]
+    assert targets.match(ctx)
+    targets.resource_id = "2"
+    assert not targets.match(ctx)
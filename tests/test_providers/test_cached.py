@@ -0,0 +1,145 @@
+"""
+    Unit test for caching attribute providers
+"""
+
+import asyncio
+
+import pytest
+
+from py_abac import cache
+from py_abac.context import EvaluationContext
+from py_abac.provider.base import AttributeProvider, AsyncAttributeProvider
+from py_abac.provider.cached import CachedAttributeProvider, AsyncCachedAttributeProvider
+from py_abac.request import AccessRequest
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(cache, "monotonic", fake_clock)
+    yield fake_clock
+
+
+class DirectoryAttributeProvider(AttributeProvider):
+
+    def __init__(self):
+        self.groups = {"alice": ["admin"], "bob": ["dev"]}
+        self.calls = 0
+
+    def get_attribute_value(self, ace, attribute_path, ctx):
+        self.calls += 1
+        if ace == "subject" and attribute_path == "$.groups":
+            return self.groups.get(ctx.subject_id)
+        return None
+
+
+class AsyncDirectoryAttributeProvider(AsyncAttributeProvider):
+
+    def __init__(self):
+        self.provider = DirectoryAttributeProvider()
+
+    async def get_attribute_value(self, ace, attribute_path, ctx):
+        return self.provider.get_attribute_value(ace, attribute_path, ctx)
+
+
+def create_context(subject_id, resource_id="doc", action_id="read"):
+    return EvaluationContext(AccessRequest.from_json({
+        "subject": {"id": subject_id},
+        "resource": {"id": resource_id},
+        "action": {"id": action_id},
+        "context": {}
+    }))
+
+
+def test_create_error():
+    with pytest.raises(ValueError):
+        CachedAttributeProvider(DirectoryAttributeProvider(), max_size=0)
+    with pytest.raises(ValueError):
+        CachedAttributeProvider(DirectoryAttributeProvider(), ttl=0)
+    with pytest.raises(ValueError):
+        CachedAttributeProvider(DirectoryAttributeProvider(), negative_ttl=-1)
+
+
+def test_get_attribute_value(clock):
+    directory = DirectoryAttributeProvider()
+    provider = CachedAttributeProvider(directory, ttl=10)
+    for _ in range(3):
+        assert provider.get_attribute_value("subject", "$.groups", create_context("alice")) == ["admin"]
+        assert provider.get_attribute_value("subject", "$.groups", create_context("bob")) == ["dev"]
+    # Values are cached by identifier of access control element
+    assert directory.calls == 2
+    assert provider.stats["hits"] == 4 and provider.stats["misses"] == 2 and provider.stats["size"] == 2
+
+    # Values expire after TTL
+    directory.groups["alice"] = ["dev"]
+    clock.now = 9.9
+    assert provider.get_attribute_value("subject", "$.groups", create_context("alice")) == ["admin"]
+    clock.now = 10
+    assert provider.get_attribute_value("subject", "$.groups", create_context("alice")) == ["dev"]
+    assert directory.calls == 3
+
+    provider.clear()
+    assert provider.get_attribute_value("subject", "$.groups", create_context("bob")) == ["dev"]
+    assert directory.calls == 4
+
+
+def test_get_attribute_value_not_found(clock):
+    directory = DirectoryAttributeProvider()
+    provider = CachedAttributeProvider(directory, ttl=60, negative_ttl=5)
+    for _ in range(3):
+        assert provider.get_attribute_value("subject", "$.groups", create_context("carl")) is None
+    assert directory.calls == 1
+    # Misses expire after negative TTL
+    directory.groups["carl"] = ["ops"]
+    clock.now = 5
+    assert provider.get_attribute_value("subject", "$.groups", create_context("carl")) == ["ops"]
+    assert directory.calls == 2
+
+    # Misses are not cached if disabled
+    directory = DirectoryAttributeProvider()
+    provider = CachedAttributeProvider(directory, cache_misses=False)
+    for _ in range(3):
+        assert provider.get_attribute_value("subject", "$.groups", create_context("carl")) is None
+    assert directory.calls == 3
+
+
+def test_make_key():
+    ctx = create_context("alice", "doc", "read")
+    assert CachedAttributeProvider.make_key("subject", "$.a", ctx) == ("subject", "$.a", "alice")
+    assert CachedAttributeProvider.make_key("resource", "$.a", ctx) == ("resource", "$.a", "doc")
+    assert CachedAttributeProvider.make_key("action", "$.a", ctx) == ("action", "$.a", "read")
+    assert CachedAttributeProvider.make_key("context", "$.a", ctx) == ("context", "$.a", None)
+
+
+def test_with_evaluation_context():
+    directory = DirectoryAttributeProvider()
+    provider = CachedAttributeProvider(directory)
+    for _ in range(3):
+        ctx = EvaluationContext(AccessRequest.from_json({
+            "subject": {"id": "alice"}, "resource": {"id": "doc"}, "action": {"id": "read"}, "context": {}
+        }), providers=[provider])
+        assert ctx.get_attribute_value("subject", "$.groups") == ["admin"]
+    assert directory.calls == 1
+
+
+def test_async_get_attribute_value():
+    directory = AsyncDirectoryAttributeProvider()
+    provider = AsyncCachedAttributeProvider(directory)
+
+    async def test():
+        for _ in range(3):
+            assert await provider.get_attribute_value("subject", "$.groups", create_context("alice")) == ["admin"]
+            assert await provider.get_attribute_value("subject", "$.groups", create_context("carl")) is None
+
+    asyncio.run(test())
+    assert directory.provider.calls == 2
+    assert provider.stats["hits"] == 4
@@ -0,0 +1,57 @@
+"""
+    Unit test attribute provider routing table
+"""
+
+import pytest
+
+from py_abac.provider.base import AttributeProvider
+from py_abac.provider.cached import CachedAttributeProvider
+from py_abac.provider.routes import ProviderRoutes
+
+
+class RoutedProvider(AttributeProvider):
+
+    def __init__(self, routes=None):
+        self.routes = routes
+
+    def get_attribute_value(self, ace, attribute_path, ctx):
+        return None
+
+
+@pytest.mark.parametrize("ace, attribute_path, expected", [
+    ("subject", "$.email", [0, 2]),
+    ("subject", "$.address", [0, 1]),
+    ("subject", "$.address.city", [0, 1]),
+    ("subject", "$.address[0]", [0, 1]),
+    ("subject", "$.addresses", [0]),
+    ("resource", "$.address", [0, 3]),
+    ("resource", "$", [0, 3]),
+    ("context", "$.ip", [0]),
+])
+def test_get_providers(ace, attribute_path, expected):
+    providers = [
+        RoutedProvider(),
+        RoutedProvider([("subject", "$.address")]),
+        RoutedProvider([("subject", "$.email"), ("subject", "$.phone")]),
+        RoutedProvider([("resource", "$")]),
+    ]
+    routes = ProviderRoutes(providers)
+    assert routes.providers == providers
+    result = routes.get_providers(ace, attribute_path)
+    assert result == tuple(providers[idx] for idx in expected)
+    # Lookups are memoized
+    assert routes.get_providers(ace, attribute_path) is result
+
+
+def test_get_providers_catch_all():
+    providers = [RoutedProvider(), RoutedProvider()]
+    assert ProviderRoutes(providers).get_providers("subject", "$.email") == tuple(providers)
+    assert ProviderRoutes().get_providers("subject", "$.email") == ()
+
+
+def test_cached_provider_routes():
+    provider = CachedAttributeProvider(RoutedProvider([("subject", "$.email")]))
+    routes = ProviderRoutes([provider])
+    assert provider.routes == [("subject", "$.email")]
+    assert routes.get_providers("subject", "$.email") == (provider,)
+    assert routes.get_providers("subject", "$.name") == ()
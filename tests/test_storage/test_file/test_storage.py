@@ -6,6 +6,7 @@ import uuid
 
 import pytest
 
+from py_abac.cache import PolicyCache
 from py_abac.exceptions import PolicyExistsError
 from py_abac.policy import Policy
 from py_abac.policy.conditions.numeric import Eq
@@ -180,6 +181,14 @@ def test_find_for_target(st, request_json, num):
     assert num == len(found)
 
 
+# NOTE: Currently all polices are returned by storage
+def test_find_for_target_by_priority(st):
+    for uid, priority in [("1", 0), ("2", 5), ("3", 1), ("4", 5), ("5", 10), ("6", 1)]:
+        st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": {}, "effect": "deny", "priority": priority}))
+    found = list(st.get_for_target_by_priority("abc", "1", "2"))
+    assert [policy.priority for policy in found] == [10, 5, 5, 1, 1, 0]
+
+
 def test_update(st):
     policy = Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny"})
     st.add(policy)
@@ -225,3 +234,21 @@ def test_delete_error(st):
     # Policy with UID 1 not present.
     with pytest.raises(ValueError):
         st.delete("1")
+
+
+def test_find_for_target_with_policy_cache(st):
+    st.policy_cache = PolicyCache()
+    for uid in ["1", "2"]:
+        st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": {"subject_id": "a*"}, "effect": "allow"}))
+    policies = {policy.uid: policy for policy in st.get_for_target("ab", "b", "c")}
+    assert sorted(policies) == ["1", "2"]
+    # Unchanged policies are decoded once
+    assert all(policy is policies[policy.uid] for policy in st.get_for_target("ab", "b", "c"))
+    assert all(policy is policies[policy.uid] for policy in st.get_for_target_by_priority("ab", "b", "c"))
+    # Updated policies are decoded again
+    st.update(Policy.from_json({"uid": "1", "rules": {}, "targets": {"subject_id": "a*"}, "effect": "deny"}))
+    updated = {policy.uid: policy for policy in st.get_for_target("ab", "b", "c")}
+    assert updated["1"] is not policies["1"] and updated["1"].effect == "deny"
+    assert updated["2"] is policies["2"]
+    # Policies retrieved by UID are not cached
+    assert st.get("2") is not policies["2"]
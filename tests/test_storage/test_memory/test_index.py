@@ -0,0 +1,84 @@
+"""
+    In-Memory storage target index test
+"""
+
+import fnmatch
+import random
+
+import pytest
+
+from py_abac.policy import Policy
+from py_abac.storage.memory.index import PatternIndex, TargetIndex
+
+PATTERNS = [
+    "*", "**", "abc", "ab", "a", "", "ab*", "a*", "abc**", "*c", "*bc", "**b", "a*b", "ab*c",
+    "a?c", "[ab]*", "*b*", "a[!b]c", "x*", "*x", "?", "[", "a[", "ab[c",
+]
+IDS = ["", "a", "ab", "abc", "acb", "axc", "abcd", "bc", "c", "x", "[", "a[", "ab[c", "abd"]
+
+
+@pytest.mark.parametrize("ace_id", IDS)
+def test_pattern_index_match(ace_id):
+    index = PatternIndex()
+    for idx, pattern in enumerate(PATTERNS):
+        index.add(str(idx), [pattern])
+    expected = {str(idx) for idx, pattern in enumerate(PATTERNS) if fnmatch.fnmatch(ace_id, pattern)}
+    assert index.match(ace_id) == expected
+
+
+def test_pattern_index_remove():
+    index = PatternIndex()
+    for idx, pattern in enumerate(PATTERNS):
+        index.add(str(idx), [pattern, "zz*"])
+    for idx, pattern in enumerate(PATTERNS):
+        index.remove(str(idx), [pattern, "zz*"])
+    for ace_id in IDS + ["zzz"]:
+        assert index.match(ace_id) == set()
+    # All buckets and trie nodes are removed
+    assert index._exact == {} and index._any == set() and index._globs == {}
+    assert index._prefixes._root.children == {} and index._suffixes._root.children == {}
+
+
+def test_pattern_index_shared_prefix():
+    index = PatternIndex()
+    index.add("1", ["ab*"])
+    index.add("2", ["abc*"])
+    index.add("3", ["a*", "ab*"])
+    assert index.match("abcd") == {"1", "2", "3"}
+    index.remove("2", ["abc*"])
+    assert index.match("abcd") == {"1", "3"}
+    index.remove("3", ["a*", "ab*"])
+    assert index.match("abcd") == {"1"}
+    assert index.match("a") == set()
+
+
+def test_target_index_match():
+    rand = random.Random(0)
+    # Policy targets can't be empty
+    patterns = [pattern for pattern in PATTERNS if pattern]
+    index = TargetIndex()
+    policies = []
+    for idx in range(300):
+        targets = {
+            "subject_id": rand.sample(patterns, rand.randint(1, 3)),
+            "resource_id": rand.choice(patterns),
+            "action_id": rand.choice(["*", "get", "g*", "*t"]),
+        }
+        policy = Policy.from_json({"uid": str(idx), "rules": {}, "targets": targets, "effect": "deny"})
+        policies.append(policy)
+        index.add(policy)
+    # Remove some of the policies
+    for policy in policies[::3]:
+        index.remove(policy.uid)
+    policies = [policy for idx, policy in enumerate(policies) if idx % 3]
+
+    for _ in range(200):
+        subject_id, resource_id = rand.choice(IDS), rand.choice(IDS)
+        action_id = rand.choice(["get", "set", "g"])
+        expected = {
+            policy.uid for policy in policies
+            if policy.targets._is_in(policy.targets.subject_id, subject_id) and
+            policy.targets._is_in(policy.targets.resource_id, resource_id) and
+            policy.targets._is_in(policy.targets.action_id, action_id)
+        }
+        assert index.match(subject_id, resource_id, action_id) == expected
@@ -125,33 +125,32 @@ def test_get_all_with_incorrect_args(st):
     assert "Offset can't be negative" == str(e.value)
 
 
-# NOTE: Currently all polices are returned by storage
 @pytest.mark.parametrize("request_json, num", [
     ({
          "subject": {"id": "a"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 1),
     ({
          "subject": {"id": "ab"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 3),
     ({
          "subject": {"id": "abc"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 3),
     ({
          "subject": {"id": "acb"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 2),
     ({
          "subject": {"id": "axc"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 1),
 ])
 def test_find_for_target(st, request_json, num):
     st.add(Policy.from_json({"uid": "1",
@@ -177,6 +176,22 @@ def test_find_for_target(st, request_json, num):
     assert num == len(found)
 
 
+def test_find_for_target_by_priority(st):
+    for uid, priority in [("1", 0), ("2", 5), ("3", 1), ("4", 5), ("5", 10), ("6", 1)]:
+        st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": {}, "effect": "deny", "priority": priority}))
+    found = list(st.get_for_target_by_priority("abc", "1", "2"))
+    assert [policy.uid for policy in found] == ["5", "2", "4", "3", "6", "1"]
+
+    # Priority groups are maintained on update and delete
+    policy = st.get("5")
+    policy.priority = 1
+    st.update(policy)
+    st.delete("2")
+    st.update(Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny", "priority": 7}))
+    found = list(st.get_for_target_by_priority("abc", "1", "2"))
+    assert [policy.uid for policy in found] == ["1", "4", "3", "6", "5"]
+
+
 def test_update(st):
     policy = Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny"})
     st.add(policy)
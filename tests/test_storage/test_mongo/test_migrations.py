@@ -5,7 +5,8 @@
 import pytest
 
 from py_abac.storage.mongo import MongoStorage
-from py_abac.storage.mongo.migrations import MongoMigrationSet, MongoMigration0To0x2x0
+from py_abac.policy import Policy
+from py_abac.storage.mongo.migrations import MongoMigrationSet, MongoMigration0To0x2x0, MongoMigration0x2x0To0x5x0
 from . import create_client
 
 # Pytest mark for module
@@ -41,9 +42,9 @@ class TestMongoMigrationSet:
     def test_up_and_down(self, migration_set):
         migration_set.save_applied_number(0)
         migration_set.up()
-        assert 1 == migration_set.last_applied()
+        assert 2 == migration_set.last_applied()
         migration_set.up()
-        assert 1 == migration_set.last_applied()
+        assert 2 == migration_set.last_applied()
         migration_set.down()
         assert 0 == migration_set.last_applied()
         migration_set.down()
@@ -81,3 +82,31 @@ class TestMongoMigration0To0x2x0:
         assert 'tags_action_id_idx' not in index_info
         assert 'tags_subject_id_idx' not in index_info
         assert 'tags_resource_id_idx' not in index_info
+
+
+class TestMongoMigration0x2x0To0x5x0:
+
+    @pytest.yield_fixture
+    def storage(self, client):
+        yield MongoStorage(client, DB_NAME, collection=COLLECTION)
+        client[DB_NAME][COLLECTION].drop()
+        client.close()
+
+    @pytest.yield_fixture
+    def migration(self, storage):
+        yield MongoMigration0x2x0To0x5x0(storage)
+
+    def test_order(self, migration):
+        assert 2 == migration.order
+
+    def test_up_and_down(self, migration, storage):
+        storage.add(Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny", "priority": 3}))
+        migration.up()
+        assert "priority_idx" in storage.collection.index_information()
+        # Simulate documents of version 0.2.0 without priority field
+        migration.down()
+        assert "priority" not in storage.collection.find_one("1")
+        assert "priority_idx" not in storage.collection.index_information()
+        migration.up()
+        assert 3 == storage.collection.find_one("1")["priority"]
+        assert "priority_idx" in storage.collection.index_information()
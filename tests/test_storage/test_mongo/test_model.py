@@ -35,6 +35,7 @@ def test_from_policy():
     assert isinstance(model.tags, dict)
     assert model.policy_str == json.dumps(policy.to_json())
     assert model._id == policy.uid
+    assert model.priority == policy.priority
     assert model.tags == {"subject": [{"id": ["user::b90b2998-9e1b-4ac5-a743-b060b2634dbb"]}],
                           "resource": [{"id": ["*"]}],
                           "action": [{"id": ["*"]}]}
@@ -99,7 +100,7 @@ def test_to_doc():
         "effect": "deny"
     }
     policy = Policy.from_json(policy_json)
-    policy_doc = {"_id": policy.uid, "policy_str": json.dumps(policy.to_json()), "tags": {}}
+    policy_doc = {"_id": policy.uid, "policy_str": json.dumps(policy.to_json()), "tags": {}, "priority": 0}
     model = PolicyModel.from_doc(policy_doc)
     new_policy_doc = model.to_doc()
     assert policy_doc == new_policy_doc
@@ -182,3 +183,10 @@ def test_get_aggregate_pipeline(subject_id, resource_id, action_id, pipeline):
         pipeline[1]['$match']['tags.resource.id']['$not']['$elemMatch']['$nin'])
     assert sorted(returned_pipeline[1]['$match']['tags.subject.id']['$not']['$elemMatch']['$nin']) == sorted(
         pipeline[1]['$match']['tags.subject.id']['$not']['$elemMatch']['$nin'])
+
+
+def test_get_aggregate_pipeline_sort_by_priority():
+    pipeline = PolicyModel.get_aggregate_pipeline("a", "b", "c")
+    sorted_pipeline = PolicyModel.get_aggregate_pipeline("a", "b", "c", sort_by_priority=True)
+    assert sorted_pipeline[:2] == pipeline
+    assert sorted_pipeline[2] == {"$sort": {"priority": -1}}
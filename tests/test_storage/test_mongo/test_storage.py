@@ -6,6 +6,7 @@ import uuid
 
 import pytest
 
+from py_abac.cache import PolicyCache
 from py_abac.exceptions import PolicyExistsError
 from py_abac.policy import Policy
 from py_abac.policy.conditions.numeric import Eq
@@ -188,6 +189,20 @@ def test_find_for_target(st, request_json, num):
     assert num == len(found)
 
 
+def test_find_for_target_by_priority(st):
+    for uid, priority, subject_id in [("1", 0, "*"), ("2", 5, "ab*"), ("3", 1, "a*b"),
+                                      ("4", 5, "ab*c"), ("5", 10, "x*"), ("6", 1, "abc")]:
+        st.add(Policy.from_json({"uid": uid,
+                                 "rules": {},
+                                 "targets": {"subject_id": subject_id},
+                                 "effect": "deny",
+                                 "priority": priority}))
+    found = list(st.get_for_target_by_priority("abc", "1", "2"))
+    assert [policy.priority for policy in found] == [5, 5, 1, 0]
+    assert sorted(policy.uid for policy in found) == \
+           sorted(policy.uid for policy in st.get_for_target("abc", "1", "2"))
+
+
 def test_update(st):
     policy = Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny"})
     st.add(policy)
@@ -220,3 +235,21 @@ def test_delete(st):
     assert '1' == st.get('1').uid
     st.delete('1')
     assert None is st.get('1')
+
+
+def test_find_for_target_with_policy_cache(st):
+    st.policy_cache = PolicyCache()
+    for uid in ["1", "2"]:
+        st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": {"subject_id": "a*"}, "effect": "allow"}))
+    policies = {policy.uid: policy for policy in st.get_for_target("ab", "b", "c")}
+    assert sorted(policies) == ["1", "2"]
+    # Unchanged policies are decoded once
+    assert all(policy is policies[policy.uid] for policy in st.get_for_target("ab", "b", "c"))
+    assert all(policy is policies[policy.uid] for policy in st.get_for_target_by_priority("ab", "b", "c"))
+    # Updated policies are decoded again
+    st.update(Policy.from_json({"uid": "1", "rules": {}, "targets": {"subject_id": "a*"}, "effect": "deny"}))
+    updated = {policy.uid: policy for policy in st.get_for_target("ab", "b", "c")}
+    assert updated["1"] is not policies["1"] and updated["1"].effect == "deny"
+    assert updated["2"] is policies["2"]
+    # Policies retrieved by UID are not cached
+    assert st.get("2") is not policies["2"]
@@ -10,3 +10,10 @@ def create_client() -> Redis:
     host = os.getenv("REDIS_HOST", DEFAULT_REDIS_HOST)
     port = os.getenv("REDIS_PORT", DEFAULT_REDIS_PORT)
     return Redis(host, port=int(port))
+
+
+def create_async_client():
+    from redis.asyncio import Redis as AsyncRedis
+    host = os.getenv("REDIS_HOST", DEFAULT_REDIS_HOST)
+    port = os.getenv("REDIS_PORT", DEFAULT_REDIS_PORT)
+    return AsyncRedis(host, port=int(port))
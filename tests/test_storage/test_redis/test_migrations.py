@@ -0,0 +1,85 @@
+"""
+    Redis storage migrations test
+"""
+
+import json
+
+import pytest
+
+from py_abac.policy import Policy
+from py_abac.storage.redis import RedisStorage
+from py_abac.storage.redis.migrations import RedisMigrationSet, RedisMigration0x4x0To0x5x0
+from . import create_client
+
+# Pytest mark for module
+pytestmark = [pytest.mark.redis, pytest.mark.integration]
+
+HASH_KEY = 'py_abac_policies_migration_test'
+MIGRATION_KEY = 'py_abac_migrations_test'
+
+
+@pytest.fixture
+def client():
+    client = create_client()
+    yield client
+    client.flushdb()
+    client.close()
+
+
+class TestRedisMigrationSet:
+
+    @pytest.fixture
+    def migration_set(self, client):
+        storage = RedisStorage(client, hash_key=HASH_KEY)
+        yield RedisMigrationSet(storage, MIGRATION_KEY)
+
+    def test_application_of_migration_number(self, migration_set):
+        assert 0 == migration_set.last_applied()
+        migration_set.save_applied_number(6)
+        assert 6 == migration_set.last_applied()
+        migration_set.save_applied_number(2)
+        assert 2 == migration_set.last_applied()
+
+    def test_up_and_down(self, migration_set):
+        migration_set.save_applied_number(0)
+        migration_set.up()
+        assert 1 == migration_set.last_applied()
+        migration_set.up()
+        assert 1 == migration_set.last_applied()
+        migration_set.down()
+        assert 0 == migration_set.last_applied()
+        migration_set.down()
+        assert 0 == migration_set.last_applied()
+
+
+class TestRedisMigration0x4x0To0x5x0:
+
+    @pytest.fixture
+    def storage(self, client):
+        yield RedisStorage(client, hash_key=HASH_KEY)
+
+    def test_order(self, storage):
+        migration = RedisMigration0x4x0To0x5x0(storage)
+        assert 1 == migration.order
+
+    def test_up_and_down(self, client, storage):
+        # Policies stored by version 0.4.0 without target index
+        for uid, subject_id in [("1", "*"), ("2", "ab*"), ("3", "a*b"), ("4", "ab*c")]:
+            policy = Policy.from_json({"uid": uid, "rules": {}, "targets": {"subject_id": subject_id},
+                                       "effect": "deny"})
+            client.hset(HASH_KEY, uid, json.dumps(policy.to_json()))
+        assert [] == list(storage.get_for_target("ab", "1", "2"))
+
+        migration = RedisMigration0x4x0To0x5x0(storage)
+        migration.up()
+        found = storage.get_for_target("ab", "1", "2")
+        assert ["1", "2", "3"] == sorted(policy.uid for policy in found)
+        # Migration can be applied again
+        migration.up()
+        found = storage.get_for_target("ab", "1", "2")
+        assert ["1", "2", "3"] == sorted(policy.uid for policy in found)
+
+        migration.down()
+        assert [] == list(storage.get_for_target("ab", "1", "2"))
+        # Only the policies hash is left
+        assert [HASH_KEY.encode()] == client.keys(HASH_KEY + "*")
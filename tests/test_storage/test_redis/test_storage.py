@@ -6,6 +6,7 @@ import uuid
 
 import pytest
 
+from py_abac.cache import PolicyCache
 from py_abac.exceptions import PolicyExistsError
 from py_abac.policy import Policy
 from py_abac.policy.conditions.numeric import Eq
@@ -135,33 +136,32 @@ def test_get_all_with_incorrect_args(st):
     assert "Offset can't be negative" == str(e.value)
 
 
-# NOTE: Currently all policies are returned by redis storage
 @pytest.mark.parametrize("request_json, num", [
     ({
          "subject": {"id": "a"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 1),
     ({
          "subject": {"id": "ab"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 3),
     ({
          "subject": {"id": "abc"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 3),
     ({
          "subject": {"id": "acb"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 2),
     ({
          "subject": {"id": "axc"},
          "resource": {"id": str(uuid.uuid4())},
          "action": {"id": str(uuid.uuid4())}
-     }, 4),
+     }, 1),
 ])
 def test_find_for_target(st, request_json, num):
     st.add(Policy.from_json({"uid": "1",
@@ -187,6 +187,49 @@ def test_find_for_target(st, request_json, num):
     assert num == len(found)
 
 
+@pytest.mark.parametrize("targets, found_ids, not_found_ids", [
+    ({"subject_id": ["abc", "x*"], "resource_id": "r*:1", "action_id": "*get"},
+     [("abc", "r:1", "get"), ("xyz", "rr:1", "doget")],
+     [("ab", "r:1", "get"), ("abc", "r:2", "get"), ("abc", "r:1", "set")]),
+    ({"subject_id": "a?c", "resource_id": "*", "action_id": "[gs]et"},
+     [("abc", "r:1", "get"), ("axc", "r:2", "set")],
+     []),
+    ({"subject_id": "a**b**c"},
+     [("abc", "r:1", "get"), ("axbxc", "r:2", "set")],
+     [("ab", "r:1", "get"), ("acb", "r:1", "get")]),
+])
+def test_find_for_target_patterns(st, targets, found_ids, not_found_ids):
+    st.add(Policy.from_json({"uid": "1", "rules": {}, "targets": targets, "effect": "deny"}))
+    for ids in found_ids:
+        assert ["1"] == [policy.uid for policy in st.get_for_target(*ids)]
+    for ids in not_found_ids:
+        assert [] == list(st.get_for_target(*ids))
+
+
+def test_find_for_target_after_update_and_delete(st):
+    st.add(Policy.from_json({"uid": "1", "rules": {}, "targets": {"subject_id": "ab*"}, "effect": "deny"}))
+    st.add(Policy.from_json({"uid": "2", "rules": {}, "targets": {"subject_id": "a*"}, "effect": "deny"}))
+    assert ["1", "2"] == sorted(policy.uid for policy in st.get_for_target("abc", "1", "2"))
+
+    st.update(Policy.from_json({"uid": "1", "rules": {}, "targets": {"subject_id": "x*"}, "effect": "deny"}))
+    assert ["2"] == [policy.uid for policy in st.get_for_target("abc", "1", "2")]
+    assert ["1"] == [policy.uid for policy in st.get_for_target("xyz", "1", "2")]
+
+    st.delete("1")
+    st.delete("2")
+    assert [] == list(st.get_for_target("abc", "1", "2"))
+    assert [] == list(st.get_for_target("xyz", "1", "2"))
+    # All index entries are removed along with the policies
+    assert [] == st.client.keys(HASH_KEY + "*")
+
+
+def test_find_for_target_by_priority(st):
+    for uid, priority in [("1", 0), ("2", 5), ("3", 1), ("4", 5), ("5", 10), ("6", 1)]:
+        st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": {}, "effect": "deny", "priority": priority}))
+    found = list(st.get_for_target_by_priority("abc", "1", "2"))
+    assert [policy.priority for policy in found] == [10, 5, 5, 1, 1, 0]
+
+
 def test_update(st):
     policy = Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny"})
     st.add(policy)
@@ -219,3 +262,21 @@ def test_delete(st):
     assert '1' == st.get('1').uid
     st.delete('1')
     assert None is st.get('1')
+
+
+def test_find_for_target_with_policy_cache(st):
+    st.policy_cache = PolicyCache()
+    for uid in ["1", "2"]:
+        st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": {"subject_id": "a*"}, "effect": "allow"}))
+    policies = {policy.uid: policy for policy in st.get_for_target("ab", "b", "c")}
+    assert sorted(policies) == ["1", "2"]
+    # Unchanged policies are decoded once
+    assert all(policy is policies[policy.uid] for policy in st.get_for_target("ab", "b", "c"))
+    assert all(policy is policies[policy.uid] for policy in st.get_for_target_by_priority("ab", "b", "c"))
+    # Updated policies are decoded again
+    st.update(Policy.from_json({"uid": "1", "rules": {}, "targets": {"subject_id": "a*"}, "effect": "deny"}))
+    updated = {policy.uid: policy for policy in st.get_for_target("ab", "b", "c")}
+    assert updated["1"] is not policies["1"] and updated["1"].effect == "deny"
+    assert updated["2"] is policies["2"]
+    # Policies retrieved by UID are not cached
+    assert st.get("2") is not policies["2"]
@@ -26,3 +26,12 @@ def create_test_sql_engine():
     except OperationalError as e:  # pragma: no cover
         pytest.exit('SQL_DATABASE_URL is not correct. Error: %s' % e)  # pragma: no cover
     return engine  # pragma: no cover
+
+
+DEFAULT_ASYNC_SQL_HOST = "sqlite+aiosqlite:///:memory:"
+
+
+def create_test_async_sql_engine():
+    from sqlalchemy.ext.asyncio import create_async_engine
+    url = os.getenv('ASYNC_SQL_HOST', DEFAULT_ASYNC_SQL_HOST)
+    return create_async_engine(url)
@@ -0,0 +1,169 @@
+"""
+    Asynchronous SQL storage tests
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from py_abac.cache import PolicyCache
+from py_abac.exceptions import PolicyExistsError
+from py_abac.policy import Policy
+from py_abac.policy.conditions.numeric import Eq
+from py_abac.storage.sql import AsyncSQLStorage
+from py_abac.storage.sql.model import Base
+from . import create_test_async_sql_engine
+
+# Pytest mark for module
+pytestmark = [pytest.mark.sql, pytest.mark.integration]
+
+
+def run(test):
+    """
+        Run test coroutine function with a storage on a new database
+    """
+
+    async def _run():
+        engine = create_test_async_sql_engine()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                await test(AsyncSQLStorage(session))
+        finally:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+    asyncio.run(_run())
+
+
+def test_add():
+    async def test(st):
+        policy = Policy.from_json({
+            "uid": "1",
+            "description": "Policy create test 1",
+            "rules": {"subject": {"$.uid": {"condition": "Eq", "value": 1.0}}},
+            "targets": {"subject_id": ["abc", "a*"], "resource_id": ["123"]},
+            "effect": "deny",
+        })
+        await st.add(policy)
+        policy = await st.get("1")
+        assert "1" == policy.uid
+        assert "Policy create test 1" == policy.description
+        assert isinstance(policy.rules.subject["$.uid"], Eq)
+        assert ["abc", "a*"] == policy.targets.subject_id
+        with pytest.raises(PolicyExistsError):
+            await st.add(Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny"}))
+        assert await st.get("2") is None
+
+    run(test)
+
+
+@pytest.mark.parametrize('limit, offset, result', [
+    (500, 0, 20),
+    (10, 1, 10),
+    (500, 5, 15),
+    (0, 0, 0),
+    (20, 30, 0),
+])
+def test_get_all(limit, offset, result):
+    async def test(st):
+        for i in range(20):
+            await st.add(Policy.from_json({"uid": str(i), "rules": {}, "targets": {}, "effect": "deny"}))
+        policies = [policy async for policy in st.get_all(limit, offset)]
+        assert result == len(policies)
+
+    run(test)
+
+
+def test_get_all_with_incorrect_args():
+    async def test(st):
+        with pytest.raises(ValueError) as e:
+            [policy async for policy in st.get_all(-1, 90)]
+        assert "Limit can't be negative" == str(e.value)
+
+        with pytest.raises(ValueError) as e:
+            [policy async for policy in st.get_all(0, -34)]
+        assert "Offset can't be negative" == str(e.value)
+
+    run(test)
+
+
+@pytest.mark.parametrize("subject_id, num", [
+    ("a", 1),
+    ("ab", 3),
+    ("abc", 3),
+    ("acb", 2),
+    ("axc", 1),
+])
+def test_find_for_target(subject_id, num):
+    async def test(st):
+        for uid, targets in [("1", {}), ("2", {"subject_id": "ab*"}), ("3", {"subject_id": "a*b"}),
+                             ("4", {"subject_id": "ab*c"})]:
+            await st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": targets, "effect": "deny"}))
+        found = [policy async for policy in st.get_for_target(subject_id, "1", "2")]
+        assert num == len(found)
+
+    run(test)
+
+
+def test_find_for_target_by_priority():
+    async def test(st):
+        for uid, priority, subject_id in [("1", 0, "*"), ("2", 5, "ab*"), ("3", 1, "a*b"),
+                                          ("4", 5, "ab*c"), ("5", 10, "x*"), ("6", 1, "abc")]:
+            await st.add(Policy.from_json({"uid": uid,
+                                           "rules": {},
+                                           "targets": {"subject_id": subject_id},
+                                           "effect": "deny",
+                                           "priority": priority}))
+        found = [policy async for policy in st.get_for_target_by_priority("abc", "1", "2")]
+        assert [policy.priority for policy in found] == [5, 5, 1, 0]
+
+    run(test)
+
+
+def test_update_and_delete():
+    async def test(st):
+        policy = Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny"})
+        # Test update before insert
+        await st.update(policy)
+        assert await st.get(policy.uid) is None
+        await st.add(policy)
+        policy = Policy.from_json({"uid": "1",
+                                   "description": "foo",
+                                   "rules": {"action": {"$.method": {"condition": "Equals", "value": "get"}}},
+                                   "targets": {"subject_id": "x"},
+                                   "effect": "deny"})
+        await st.update(policy)
+        policy = await st.get("1")
+        assert "foo" == policy.description
+        assert "get" == policy.rules.action["$.method"].value
+        assert [] == [policy async for policy in st.get_for_target("a", "1", "2")]
+        assert 1 == len([policy async for policy in st.get_for_target("x", "1", "2")])
+        await st.delete("1")
+        assert await st.get("1") is None
+        # Test non-existing
+        await st.delete("1")
+
+    run(test)
+
+
+def test_find_for_target_with_policy_cache():
+    async def test(st):
+        st.policy_cache = PolicyCache()
+        for uid in ["1", "2"]:
+            await st.add(Policy.from_json({"uid": uid, "rules": {}, "targets": {"subject_id": "a*"}, "effect": "allow"}))
+        policies = {policy.uid: policy async for policy in st.get_for_target("ab", "b", "c")}
+        assert sorted(policies) == ["1", "2"]
+        # Unchanged policies are decoded once
+        found = [policy async for policy in st.get_for_target_by_priority("ab", "b", "c")]
+        assert len(found) == 2 and all(policy is policies[policy.uid] for policy in found)
+        # Updated policies are decoded again
+        await st.update(Policy.from_json({"uid": "1", "rules": {}, "targets": {"subject_id": "a*"}, "effect": "deny"}))
+        updated = {policy.uid: policy async for policy in st.get_for_target("ab", "b", "c")}
+        assert updated["1"] is not policies["1"] and updated["1"].effect == "deny"
+        assert updated["2"] is policies["2"]
+
+    run(test)
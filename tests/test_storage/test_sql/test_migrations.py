@@ -1,8 +1,10 @@
 import pytest
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import sessionmaker, scoped_session
 
+from py_abac.policy import Policy
 from py_abac.storage.sql import SQLStorage
-from py_abac.storage.sql.migrations import SQLMigrationSet, Migration0To0x2x1
+from py_abac.storage.sql.migrations import SQLMigrationSet, Migration0To0x2x1, Migration0x2x1To0x5x0
 from py_abac.storage.sql.model import Base, PolicyModel, SubjectTargetModel, ResourceTargetModel, ActionTargetModel
 from . import create_test_sql_engine
 
@@ -40,9 +42,9 @@ class TestSQLMigrationSet:
     def test_up_and_down(self, migration_set):
         migration_set.save_applied_number(0)
         migration_set.up()
-        assert 1 == migration_set.last_applied()
+        assert 2 == migration_set.last_applied()
         migration_set.up()
-        assert 1 == migration_set.last_applied()
+        assert 2 == migration_set.last_applied()
         migration_set.down()
         assert 0 == migration_set.last_applied()
         migration_set.down()
@@ -76,3 +78,37 @@ class TestMigration0To0x2x1:
         assert not Base.metadata.tables[SubjectTargetModel.__tablename__].exists(engine)
         assert not Base.metadata.tables[ResourceTargetModel.__tablename__].exists(engine)
         assert not Base.metadata.tables[ActionTargetModel.__tablename__].exists(engine)
+
+
+class TestMigration0x2x1To0x5x0:
+
+    @pytest.fixture
+    def storage(self, session):
+        yield SQLStorage(scoped_session=session)
+        session.remove()
+
+    @pytest.fixture
+    def migration(self, storage):
+        yield Migration0x2x1To0x5x0(storage)
+
+    @staticmethod
+    def has_priority_column(engine):
+        return "priority" in [column["name"] for column in inspect(engine).get_columns(PolicyModel.__tablename__)]
+
+    def test_order(self, migration):
+        assert 2 == migration.order
+
+    def test_up_and_down(self, migration, storage, engine):
+        Migration0To0x2x1(storage).up()
+        storage.add(Policy.from_json({"uid": "1", "rules": {}, "targets": {}, "effect": "deny", "priority": 3}))
+        # Simulate table of version 0.2.1 without priority column
+        migration.down()
+        assert not self.has_priority_column(engine)
+
+        migration.up()
+        assert self.has_priority_column(engine)
+        storage.session.expire_all()
+        assert 3 == storage.session.query(PolicyModel).get("1").priority
+        # Migrating up again is idempotent
+        migration.up()
+        assert 3 == storage.session.query(PolicyModel).get("1").priority